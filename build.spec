@@ -36,6 +36,7 @@ a = Analysis(
         'PySide6.QtWidgets',
         'PySide6.QtMultimedia',
         'PySide6.QtMultimediaWidgets',
+        'PySide6.QtNetwork',
         'PIL',
         'PIL.Image',
         'pillow_heif',
@@ -46,7 +47,16 @@ a = Analysis(
         'viewer.video_player',
         'utils',
         'utils.image_loader',
+        'utils.metadata',
         'utils.compressor',
+        'utils.prefetcher',
+        'utils.process_decoder',
+        'utils.single_instance',
+        'utils.startup_decoder',
+        'utils.startup_timeline',
+        'utils.thumbnail_scheduler',
+        'utils.thumbnail_store',
+        'utils.tiled_image',
         'utils.theme',
     ],
     hookspath=[],
@@ -70,7 +80,8 @@ a = Analysis(
 
         # ===== PySide6 불필요 모듈 (대폭 확대) =====
         # 네트워크/웹
-        'PySide6.QtNetwork', 'PySide6.QtNetworkAuth',
+        # (QtNetwork는 단일 인스턴스 모드의 QLocalServer/QLocalSocket에 필요)
+        'PySide6.QtNetworkAuth',
         'PySide6.QtWebChannel', 'PySide6.QtWebEngineCore',
         'PySide6.QtWebEngineQuick', 'PySide6.QtWebEngineWidgets',
         'PySide6.QtWebSockets', 'PySide6.QtHttpServer',
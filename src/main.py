@@ -5,65 +5,77 @@ Lightweight Photo Viewer - 초경량 로컬 사진 뷰어
 import sys
 import os
 
-print("=" * 50)
-print("Lightweight Viewer 시작")
-print("=" * 50)
+# PyInstaller 빌드에서 프로세스 디코더 워커로 실행된 경우 여기서 처리 후 종료
+# (개발 환경에서는 아무 일도 하지 않으므로 시작 시간에 영향이 없도록 빌드에서만 import)
+if getattr(sys, 'frozen', False):
+    import multiprocessing
+    multiprocessing.freeze_support()
 
 # PyInstaller 실행 시 경로 설정
 if getattr(sys, 'frozen', False):
     # PyInstaller로 빌드된 exe 실행 시
     BASE_DIR = sys._MEIPASS
-    print(f"[INFO] PyInstaller 모드")
 else:
     # 개발 환경에서 실행 시
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    print(f"[INFO] 개발 모드")
-
-print(f"[INFO] BASE_DIR: {BASE_DIR}")
-print(f"[INFO] sys.path[0]: {sys.path[0] if sys.path else 'empty'}")
 
 # src 디렉토리를 모듈 검색 경로에 추가
 if BASE_DIR not in sys.path:
     sys.path.insert(0, BASE_DIR)
-    print(f"[INFO] Added to sys.path: {BASE_DIR}")
-
-# 빠른 시작을 위한 환경 변수 설정
-os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '1'
-
-print("[INFO] PySide6 import 시도...")
-try:
-    from PySide6.QtWidgets import QApplication, QMessageBox
-    from PySide6.QtCore import Qt
-    from PySide6.QtGui import QIcon
-    print("[OK] PySide6 import 성공")
-except Exception as e:
-    print(f"[ERROR] PySide6 import 실패: {e}")
-    input("Enter 키를 눌러 종료...")
-    sys.exit(1)
-
-print("[INFO] viewer/utils 모듈 import 시도...")
-try:
-    from viewer.main_window import MainWindow
-    from utils.theme import ThemeManager
-    print("[OK] 모듈 import 성공")
-except ImportError as e:
-    print(f"[ERROR] 모듈 import 실패: {e}")
-    print(f"[DEBUG] sys.path: {sys.path}")
-    print(f"[DEBUG] BASE_DIR 내용:")
-    try:
-        for item in os.listdir(BASE_DIR):
-            print(f"  - {item}")
-    except Exception as e2:
-        print(f"  디렉토리 읽기 실패: {e2}")
-    input("Enter 키를 눌러 종료...")
-    sys.exit(1)
+
+# 이하 시작 작업(인자 처리, 단일 인스턴스 전달, 선행 디코딩, GUI import)은 모두 main()에서 수행
+# (spawn 방식 워커 프로세스는 이 모듈을 __mp_main__으로 다시 실행하므로 모듈 수준에 두지 않음)
 
 
 def main():
-    print(f"[DEBUG] Starting Lightweight Viewer...")
-    print(f"[DEBUG] Python: {sys.version}")
-    print(f"[DEBUG] BASE_DIR: {BASE_DIR}")
-    print(f"[DEBUG] sys.path: {sys.path[:3]}...")
+    # 시작 타임라인 (--startup-timeline 또는 LIGHTWEIGHT_VIEWER_STARTUP_TIMELINE, 꺼져 있으면 기록 안 함)
+    from utils.startup_timeline import StartupTimeline
+    StartupTimeline.enable_from(sys.argv)
+
+    # 명령줄 인자 중 파일 경로 (--옵션 제외)
+    file_args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+
+    # 단일 인스턴스 모드 - 실행 중인 뷰어가 있으면 파일 경로만 넘기고 바로 종료 (GUI 초기화 전)
+    from utils.single_instance import SingleInstance
+    single_instance = SingleInstance.is_enabled(sys.argv)
+    if single_instance:
+        if SingleInstance.forward(file_args[0] if file_args else None):
+            sys.exit(0)
+
+    # 명령줄로 받은 이미지는 Qt 초기화와 동시에 읽기 시작 (PySide6 import 전)
+    startup_decoder = None
+    if file_args and os.path.isfile(file_args[0]):
+        from utils.startup_decoder import StartupDecoder
+        startup_decoder = StartupDecoder(file_args[0])
+        startup_decoder.start()
+
+    # 빠른 시작을 위한 환경 변수 설정
+    os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '1'
+
+    try:
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtCore import Qt, QTimer
+    except Exception as e:
+        print(f"[ERROR] PySide6 import 실패: {e}")
+        input("Enter 키를 눌러 종료...")
+        sys.exit(1)
+    StartupTimeline.mark('pyside6_import')
+
+    try:
+        from viewer.main_window import MainWindow
+        from utils.theme import ThemeManager
+    except ImportError as e:
+        print(f"[ERROR] 모듈 import 실패: {e}")
+        print(f"[DEBUG] sys.path: {sys.path}")
+        print(f"[DEBUG] BASE_DIR 내용:")
+        try:
+            for item in os.listdir(BASE_DIR):
+                print(f"  - {item}")
+        except Exception as e2:
+            print(f"  디렉토리 읽기 실패: {e2}")
+        input("Enter 키를 눌러 종료...")
+        sys.exit(1)
+    StartupTimeline.mark('modules_import')
 
     try:
         # High DPI 설정
@@ -75,30 +87,57 @@ def main():
         app.setApplicationName("Lightweight Viewer")
         app.setApplicationVersion("1.0.0")
         app.setOrganizationName("LightweightViewer")
+        StartupTimeline.mark('qapplication')
 
-        print("[DEBUG] QApplication created")
+        # 화면 크기를 알았으니 시작 디코딩 진행 (테마/창 초기화와 동시에)
+        if startup_decoder is not None:
+            startup_decoder.set_max_size(MainWindow.preview_size_for(app.primaryScreen()))
 
         # 테마 적용
         theme_manager = ThemeManager()
         theme_manager.apply_theme(app)
-
-        print("[DEBUG] Theme applied")
+        StartupTimeline.mark('theme')
 
         # 메인 윈도우 생성
         window = MainWindow()
+        StartupTimeline.mark('main_window')
 
-        print("[DEBUG] MainWindow created")
+        # 단일 인스턴스 모드 - 이후 실행에서 넘어오는 파일은 이 창에서 열기
+        instance_server = None
+        if single_instance:
+            from utils.single_instance import SingleInstanceServer
+            instance_server = SingleInstanceServer(window.open_external_file, window)
+            if not instance_server.listen():
+                instance_server = None
 
         # 명령줄 인자로 파일이 전달되면 열기
-        if len(sys.argv) > 1:
-            file_path = sys.argv[1]
+        if file_args:
+            file_path = file_args[0]
             if os.path.isfile(file_path):
-                window.open_file(file_path)
+                window.open_file(file_path, startup_decoder)
 
         window.show()
-        print("[DEBUG] Window shown, entering event loop...")
+        StartupTimeline.mark('window_shown')
+
+        # 시작 타임라인은 첫 이미지를 그리면 출력 (열 파일이 없으면 이벤트 루프 진입 시점,
+        # 이미지를 그리지 못한 경우는 종료 시점)
+        if not file_args:
+            QTimer.singleShot(0, lambda: (StartupTimeline.mark('event_loop'), StartupTimeline.report()))
+
+        exit_code = app.exec()
+        StartupTimeline.report()
+
+        if instance_server is not None:
+            instance_server.close()
+
+        # 썸네일 워커를 끝내고 디스크 캐시 연결 닫기
+        window.shutdown()
+
+        # 프로세스 디코더 워커 정리 (사용하지 않았으면 아무 일도 하지 않음)
+        from utils.process_decoder import ProcessDecoder
+        ProcessDecoder.shutdown()
 
-        sys.exit(app.exec())
+        sys.exit(exit_code)
     except Exception as e:
         print(f"[ERROR] {type(e).__name__}: {e}")
         import traceback
@@ -1,5 +1,17 @@
-from .image_loader import ImageLoader
-from .compressor import ImageCompressor
-from .theme import ThemeManager
+from importlib import import_module
 
 __all__ = ['ImageLoader', 'ImageCompressor', 'ThemeManager']
+
+# 하위 모듈은 처음 접근할 때 import (utils.theme만 써도 이미지/압축 모듈까지 불러오지 않도록)
+_EXPORTS = {
+    'ImageLoader': '.image_loader',
+    'ImageCompressor': '.compressor',
+    'ThemeManager': '.theme',
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
@@ -2,13 +2,20 @@
 이미지 압축 유틸리티
 """
 import os
+import math
 from pathlib import Path
-from typing import Optional, Tuple
-from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+from dataclasses import dataclass, field
+from io import BytesIO
 
 from PIL import Image
+from PySide6.QtCore import QObject, QRunnable, Signal, QMutex, QMutexLocker
 
-from .image_loader import ImageLoader
+from .image_loader import ImageLoader, TRANSPOSED_ORIENTATIONS
+
+
+class CompressionCancelled(Exception):
+    """압축 취소 (compress 내부에서만 사용)"""
 
 
 @dataclass
@@ -20,6 +27,11 @@ class CompressionResult:
     original_size: int
     compressed_size: int
     error_message: str = ""
+    target_size: int = 0  # 목표 크기 모드의 목표 (바이트, 0이면 고정 품질)
+    quality: int = 0      # 실제 사용한 품질
+    width: int = 0        # 출력 해상도
+    height: int = 0
+    cancelled: bool = False
 
     @property
     def size_reduction(self) -> float:
@@ -28,6 +40,51 @@ class CompressionResult:
             return 0
         return (1 - self.compressed_size / self.original_size) * 100
 
+    @property
+    def target_met(self) -> bool:
+        """목표 크기 이하로 저장되었는지 (목표가 없으면 True)"""
+        return self.success and (not self.target_size or self.compressed_size <= self.target_size)
+
+    @property
+    def original_size_str(self) -> str:
+        return ImageLoader.format_file_size(self.original_size)
+
+    @property
+    def compressed_size_str(self) -> str:
+        return ImageLoader.format_file_size(self.compressed_size)
+
+
+@dataclass
+class BatchCompressionResult:
+    """일괄 압축 결과 (파일별 결과 집계)"""
+    results: List[CompressionResult] = field(default_factory=list)
+    total: int = 0  # 요청한 파일 수 (취소 시 len(results)보다 클 수 있음)
+    cancelled: bool = False
+
+    @property
+    def succeeded(self) -> List[CompressionResult]:
+        return [r for r in self.results if r.success]
+
+    @property
+    def failed(self) -> List[CompressionResult]:
+        return [r for r in self.results if not r.success]
+
+    @property
+    def original_size(self) -> int:
+        """성공한 파일의 원본 크기 합계"""
+        return sum(r.original_size for r in self.succeeded)
+
+    @property
+    def compressed_size(self) -> int:
+        return sum(r.compressed_size for r in self.succeeded)
+
+    @property
+    def size_reduction(self) -> float:
+        """전체 압축률 (0-100%)"""
+        if self.original_size == 0:
+            return 0
+        return (1 - self.compressed_size / self.original_size) * 100
+
     @property
     def original_size_str(self) -> str:
         return ImageLoader.format_file_size(self.original_size)
@@ -40,6 +97,14 @@ class CompressionResult:
 class ImageCompressor:
     """이미지 압축 클래스"""
 
+    # 목표 크기 모드
+    MIN_TARGET_QUALITY = 10   # 품질 탐색 하한
+    MAX_RESIZE_ROUNDS = 4     # 최저 품질로도 초과할 때 해상도를 줄이는 최대 횟수
+    RESIZE_MARGIN = 0.9       # 해상도 축소 시 예상 비율보다 조금 더 줄임
+    MIN_TARGET_SIDE = 64      # 해상도 축소 하한 (긴 변)
+
+    CANCEL_POLL_INTERVAL = 0.2  # 일괄 압축 중 취소 확인 간격 (초)
+
     # 품질 프리셋
     QUALITY_PRESETS = {
         'high': 90,      # 고품질
@@ -56,83 +121,123 @@ class ImageCompressor:
         'hd': 1280,          # HD
     }
 
+    @staticmethod
+    def output_path_for(input_path: str, output_format: str = 'JPEG',
+                        output_suffix: str = '_compressed') -> str:
+        """기본 출력 경로 (입력 파일 옆에 '이름 + 접미사 + 포맷 확장자')"""
+        input_path_obj = Path(input_path)
+        ext_map = {'JPEG': '.jpg', 'PNG': '.png', 'WEBP': '.webp'}
+        output_ext = ext_map.get(output_format, '.jpg')
+        return str(input_path_obj.parent / f"{input_path_obj.stem}{output_suffix}{output_ext}")
+
+    @staticmethod
+    def is_compressed_output(file_path: str, output_suffix: str = '_compressed') -> bool:
+        """이전 압축 결과 파일인지 여부 (파일 이름이 접미사로 끝나는지)"""
+        return bool(output_suffix) and Path(file_path).stem.endswith(output_suffix)
+
     @staticmethod
     def compress(
         input_path: str,
         quality: int = 80,
         max_width: Optional[int] = None,
         output_format: str = 'JPEG',
-        output_suffix: str = '_compressed'
+        output_suffix: str = '_compressed',
+        target_size: Optional[int] = None,
+        allow_resize: bool = True,
+        progress: Optional[Callable[[int], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        output_path: Optional[str] = None
     ) -> CompressionResult:
         """이미지 압축
 
         Args:
             input_path: 입력 파일 경로
-            quality: JPEG 품질 (1-100)
+            quality: JPEG 품질 (1-100), 목표 크기 모드에서는 품질 상한
             max_width: 최대 너비 (None이면 원본 유지)
             output_format: 출력 포맷 (JPEG, PNG, WEBP)
             output_suffix: 출력 파일 접미사
+            target_size: 목표 파일 크기 (바이트, None이면 고정 품질)
+            allow_resize: 목표 크기 모드에서 최저 품질로도 초과하면 해상도 축소 허용
+            progress: 진행률(0-100)을 받을 콜백
+            is_cancelled: True를 반환하면 단계 사이에서 중단 (파일은 쓰지 않음)
+            output_path: 출력 파일 경로 (None이면 output_path_for로 생성)
 
         Returns:
-            CompressionResult 객체
+            CompressionResult 객체 (목표를 못 맞추면 가장 작은 결과를 저장, target_met=False)
         """
         original_size = 0
 
+        def step(percent: int):
+            if is_cancelled and is_cancelled():
+                raise CompressionCancelled()
+            if progress:
+                progress(percent)
+
         try:
             original_size = os.path.getsize(input_path)
 
             # 출력 경로 생성
-            input_path_obj = Path(input_path)
-            ext_map = {'JPEG': '.jpg', 'PNG': '.png', 'WEBP': '.webp'}
-            output_ext = ext_map.get(output_format, '.jpg')
-            output_path = str(
-                input_path_obj.parent /
-                f"{input_path_obj.stem}{output_suffix}{output_ext}"
-            )
+            if output_path is None:
+                output_path = ImageCompressor.output_path_for(input_path, output_format, output_suffix)
 
             # 이미지 로드
-            with Image.open(input_path) as img:
+            step(0)
+            with ImageLoader.open_image(input_path) as img:
+                img.load()
+                step(30)
+
                 # EXIF 회전 적용
                 img = ImageLoader._apply_exif_rotation(img)
 
                 # 리사이즈
-                if max_width and img.width > max_width:
-                    ratio = max_width / img.width
-                    new_height = int(img.height * ratio)
-                    img = img.resize((max_width, new_height), Image.Resampling.LANCZOS)
-
-                # RGB로 변환 (JPEG는 RGBA 미지원)
-                if output_format == 'JPEG' and img.mode in ('RGBA', 'P'):
-                    # 투명 배경을 흰색으로
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[3] if len(img.split()) == 4 else None)
-                    img = background
-                elif img.mode not in ('RGB', 'RGBA'):
-                    img = img.convert('RGB')
-
-                # 저장 옵션
-                save_kwargs = {'quality': quality, 'optimize': True}
-
-                if output_format == 'JPEG':
-                    save_kwargs['progressive'] = True
-                elif output_format == 'WEBP':
-                    save_kwargs['method'] = 4  # 압축 품질 (0-6)
-                elif output_format == 'PNG':
-                    save_kwargs = {'optimize': True, 'compress_level': 9}
-
-                # 저장
-                img.save(output_path, output_format, **save_kwargs)
-
-            compressed_size = os.path.getsize(output_path)
+                output_size = ImageCompressor._output_size(img.size, max_width)
+                if output_size != img.size:
+                    img = img.resize(output_size, Image.Resampling.LANCZOS)
+
+                img = ImageCompressor._prepare_for_format(img, output_format)
+                step(50)
+
+                # 메모리에서 인코딩 (목표 크기 모드는 같은 디코딩 결과로 반복 인코딩)
+                if target_size:
+                    encodes = [0]
+
+                    def on_encode():
+                        encodes[0] += 1
+                        step(min(95, 50 + encodes[0] * 5))
+
+                    data, quality, size = ImageCompressor._encode_to_target(
+                        img, output_format, quality, target_size, allow_resize, on_encode
+                    )
+                else:
+                    data = ImageCompressor._encode(img, output_format, quality)
+                    size = img.size
+            step(95)
+
+            # 저장 (최종 결과만 한 번 기록)
+            with open(output_path, 'wb') as f:
+                f.write(data)
 
             return CompressionResult(
                 success=True,
                 original_path=input_path,
                 output_path=output_path,
                 original_size=original_size,
-                compressed_size=compressed_size
+                compressed_size=len(data),
+                target_size=target_size or 0,
+                quality=quality,
+                width=size[0],
+                height=size[1]
+            )
+
+        except CompressionCancelled:
+            return CompressionResult(
+                success=False,
+                original_path=input_path,
+                output_path="",
+                original_size=original_size,
+                compressed_size=0,
+                error_message="취소됨",
+                cancelled=True
             )
 
         except Exception as e:
@@ -145,6 +250,229 @@ class ImageCompressor:
                 error_message=str(e)
             )
 
+    @staticmethod
+    def _output_size(size: Tuple[int, int], max_width: Optional[int]) -> Tuple[int, int]:
+        """max_width를 적용한 출력 해상도 (비율 유지, 확대하지 않음)"""
+        width, height = size
+        if max_width and width > max_width:
+            return max_width, int(height * max_width / width)
+        return width, height
+
+    @staticmethod
+    def _prepare_for_format(img: Image.Image, output_format: str) -> Image.Image:
+        """출력 포맷이 지원하는 모드로 변환"""
+        # RGB로 변환 (JPEG는 RGBA 미지원)
+        if output_format == 'JPEG' and img.mode in ('RGBA', 'P'):
+            # 투명 배경을 흰색으로
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+            background.paste(img, mask=img.split()[3] if len(img.split()) == 4 else None)
+            img = background
+        elif img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGB')
+        return img
+
+    @staticmethod
+    def _encode(img: Image.Image, output_format: str, quality: int) -> bytes:
+        """지정 품질로 메모리 버퍼에 인코딩"""
+        # 저장 옵션
+        save_kwargs = {'quality': quality, 'optimize': True}
+
+        if output_format == 'JPEG':
+            save_kwargs['progressive'] = True
+        elif output_format == 'WEBP':
+            save_kwargs['method'] = 4  # 압축 품질 (0-6)
+        elif output_format == 'PNG':
+            save_kwargs = {'optimize': True, 'compress_level': 9}
+
+        buffer = BytesIO()
+        img.save(buffer, output_format, **save_kwargs)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _encode_to_target(img: Image.Image, output_format: str, max_quality: int,
+                          target_size: int, allow_resize: bool,
+                          on_encode: Optional[Callable[[], None]] = None) -> Tuple[bytes, int, Tuple[int, int]]:
+        """target_size 이하가 되는 가장 높은 품질(필요하면 더 작은 해상도)로 인코딩
+
+        상한 품질과 최저 품질을 먼저 확인한 뒤 그 사이를 이진 탐색한다.
+        최저 품질로도 넘치면 크기 비율의 제곱근만큼 해상도를 줄여 다시 시도한다.
+        PNG는 품질이 없어 해상도만 조절한다. on_encode는 인코딩할 때마다 호출된다.
+
+        Returns:
+            (인코딩 결과, 품질, 해상도) - 목표를 못 맞추면 가장 작은 결과
+        """
+        def encode(image: Image.Image, quality: int) -> bytes:
+            data = ImageCompressor._encode(image, output_format, quality)
+            if on_encode:
+                on_encode()
+            return data
+
+        source = img
+        high = max_quality
+        low = high if output_format == 'PNG' else min(high, ImageCompressor.MIN_TARGET_QUALITY)
+        smallest = None
+
+        for _ in range(ImageCompressor.MAX_RESIZE_ROUNDS + 1):
+            # 상한 품질로 목표 이하이면 인코딩 1회로 끝
+            data = encode(img, high)
+            if len(data) <= target_size:
+                return data, high, img.size
+            best = None
+            if low < high:
+                data = encode(img, low)
+                if len(data) <= target_size:
+                    best = (data, low, img.size)
+            if smallest is None or len(data) < len(smallest[0]):
+                smallest = (data, low, img.size)
+
+            if best is not None:
+                # low는 목표 이하, high는 초과 - 그 사이에서 가장 높은 품질 탐색
+                lo, hi = low + 1, high - 1
+                while lo <= hi:
+                    quality = (lo + hi) // 2
+                    data = encode(img, quality)
+                    if len(data) <= target_size:
+                        best = (data, quality, img.size)
+                        lo = quality + 1
+                    else:
+                        hi = quality - 1
+                return best
+
+            if not allow_resize:
+                break
+
+            # 최저 품질로도 초과 - 원본에서 다시 축소 (면적 ∝ 파일 크기로 가정)
+            ratio = math.sqrt(target_size / len(smallest[0])) * ImageCompressor.RESIZE_MARGIN
+            new_size = (max(1, int(img.width * ratio)), max(1, int(img.height * ratio)))
+            if max(new_size) < ImageCompressor.MIN_TARGET_SIDE:
+                break
+            img = source.resize(new_size, Image.Resampling.LANCZOS)
+
+        return smallest
+
+    @staticmethod
+    def compress_batch(
+        input_paths: List[str],
+        quality: int = 80,
+        max_width: Optional[int] = None,
+        output_format: str = 'JPEG',
+        output_suffix: str = '_compressed',
+        target_size: Optional[int] = None,
+        allow_resize: bool = True,
+        max_workers: Optional[int] = None,
+        progress: Optional[Callable[[int, int, CompressionResult], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None
+    ) -> BatchCompressionResult:
+        """여러 파일을 프로세스 풀에서 병렬 압축 (옵션은 compress와 동일)
+
+        Args:
+            input_paths: 입력 파일 경로 목록
+            max_workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+            progress: 파일 하나가 끝날 때마다 (완료 수, 전체 수, 결과)로 호출
+            is_cancelled: True를 반환하면 대기 중인 파일을 취소하고 중단
+
+        Returns:
+            BatchCompressionResult 객체 (완료 순서대로 결과 저장)
+        """
+        batch = BatchCompressionResult(total=len(input_paths))
+        if not input_paths:
+            return batch
+
+        # 시작 시간에 영향이 없도록 프로세스 풀 모듈은 사용할 때 import
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        from multiprocessing import get_context
+
+        output_paths = ImageCompressor._unique_output_paths(input_paths, output_format, output_suffix)
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(input_paths)))
+        # Qt 스레드가 있는 프로세스를 fork하지 않도록 모든 플랫폼에서 spawn 사용
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn'))
+
+        def collect(future):
+            """끝난 작업의 결과를 batch에 추가하고 진행 상황 알림"""
+            try:
+                result = future.result()
+            except Exception as e:
+                result = CompressionResult(
+                    success=False,
+                    original_path=futures[future],
+                    output_path="",
+                    original_size=0,
+                    compressed_size=0,
+                    error_message=str(e)
+                )
+            batch.results.append(result)
+            if progress:
+                progress(len(batch.results), batch.total, result)
+
+        futures = {}
+        collected = set()
+        jobs = iter(zip(input_paths, output_paths))
+
+        def submit_next() -> bool:
+            """다음 파일을 풀에 넣음 (남은 파일이 없으면 False)"""
+            job = next(jobs, None)
+            if job is None:
+                return False
+            path, output_path = job
+            future = executor.submit(ImageCompressor.compress, path, quality, max_width,
+                                     output_format, output_suffix, target_size, allow_resize,
+                                     output_path=output_path)
+            futures[future] = path
+            pending.add(future)
+            return True
+
+        # 취소 시 대기열에 미리 들어간 파일까지 압축하지 않도록 워커 수만큼만 넣어 둠
+        pending = set()
+        try:
+            while len(pending) < workers and submit_next():
+                pass
+            while pending:
+                # 오래 걸리는 파일 하나에 막히지 않도록 일정 간격으로 취소 확인
+                done, pending = wait(pending, timeout=ImageCompressor.CANCEL_POLL_INTERVAL,
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    collected.add(future)
+                    collect(future)  # 취소 확인 전에 이미 끝난 파일은 결과에 포함
+                if is_cancelled and is_cancelled():
+                    batch.cancelled = True
+                    break
+                while len(pending) < workers and submit_next():
+                    pass
+        finally:
+            # 취소 시 실행 중인 파일만 마무리
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        # 취소 후 마무리된 파일도 디스크에 남으므로 결과에 포함
+        for future in futures:
+            if future not in collected and future.done() and not future.cancelled():
+                collect(future)
+
+        return batch
+
+    @staticmethod
+    def _unique_output_paths(input_paths: List[str], output_format: str,
+                             output_suffix: str) -> List[str]:
+        """입력마다 겹치지 않는 출력 경로 (a.jpg, a.png → a_compressed.jpg, a_2_compressed.jpg)
+
+        여러 프로세스가 같은 파일에 동시에 쓰거나 다른 작업의 입력을 덮어쓰지
+        않도록 작업을 넣기 전에 정한다.
+        """
+        used = {os.path.normcase(os.path.abspath(path)) for path in input_paths}
+        output_paths = []
+        for path in input_paths:
+            output_path = ImageCompressor.output_path_for(path, output_format, output_suffix)
+            base = Path(output_path)
+            stem = Path(path).stem
+            n = 2
+            while os.path.normcase(os.path.abspath(output_path)) in used:
+                output_path = str(base.parent / f"{stem}_{n}{output_suffix}{base.suffix}")
+                n += 1
+            used.add(os.path.normcase(os.path.abspath(output_path)))
+            output_paths.append(output_path)
+        return output_paths
+
     @staticmethod
     def convert_heic_to_jpeg(
         input_path: str,
@@ -176,25 +504,337 @@ class ImageCompressor:
     def estimate_compressed_size(
         input_path: str,
         quality: int = 80,
-        max_width: Optional[int] = None
+        max_width: Optional[int] = None,
+        output_format: str = 'JPEG'
     ) -> int:
-        """압축 후 예상 파일 크기 추정 (대략적)"""
+        """압축 후 예상 파일 크기 (실제 인코더로 샘플을 압축해 추정, 실패 시 0)
+
+        같은 파일을 여러 설정으로 추정할 때는 SizeEstimator를 재사용한다.
+        """
+        estimate = SizeEstimator(input_path).estimate(quality, max_width, output_format)
+        return estimate.size if estimate else 0
+
+
+@dataclass
+class SizeEstimate:
+    """압축 크기 추정 결과 (바이트, low~high는 신뢰 구간)"""
+    size: int
+    low: int
+    high: int
+    width: int = 0   # 출력 해상도
+    height: int = 0
+
+    @property
+    def size_str(self) -> str:
+        return ImageLoader.format_file_size(self.size)
+
+    @property
+    def range_str(self) -> str:
+        return f"{ImageLoader.format_file_size(self.low)} ~ {ImageLoader.format_file_size(self.high)}"
+
+
+class SizeEstimator:
+    """샘플 인코딩 기반 압축 크기 추정기
+
+    처음 추정할 때 한 번만 디코딩해 축소본과 샘플 타일(격자 배치)을 만들어 두고,
+    추정할 때마다 실제 인코더 설정으로 샘플만 압축한다.
+    - JPEG은 draft()로 출력 배율이 허용하는 만큼 줄여 디코딩하고, 더 큰 출력을
+      요청받을 때만 다시 디코딩한다. 축소본은 reduce() 후 LANCZOS로 만든다.
+    - EXIF 회전은 축소본에만 적용한다 (타일 방향은 압축 크기와 무관)
+    - 출력이 축소본 이하 크기면 축소본을 출력 크기로 줄여 통째로 인코딩
+    - 그 외에는 타일 중앙을 출력 배율에서 샘플 크기가 되도록 잘라 줄이고
+      행마다 이어 붙인 띠로 인코딩한다. 헤더를 뺀 픽셀당 바이트의 평균으로
+      전체 크기를 외삽한다 (띠 간 편차로 신뢰 구간 계산). 샘플이 너무 작으면
+      경계 비용 때문에 과대 추정되므로 출력 배율 기준으로 크기를 유지한다.
+    샘플은 교체만 하고 수정하지 않으므로 여러 워커 스레드에서 동시에 estimate()를 호출해도 된다.
+    """
+
+    PREVIEW_SIDE = 1024      # 축소본 긴 변 (이하 출력은 통째로 인코딩)
+    TILE_SIZE = 512          # 보관하는 샘플 타일 크기 (디코딩 해상도 기준)
+    # 인코딩할 샘플 타일 크기 (출력 배율 기준) - 인코딩이 느린 포맷은 작게 잡아 추정 시간을 맞춤
+    SAMPLE_SIZE = {'JPEG': 256, 'WEBP': 192, 'PNG': 128}
+    TILE_GRID = (4, 3)       # 샘플 타일 배치 (가로, 세로) - 행마다 띠 하나
+    MAX_DRAFT_SCALE = 8      # JPEG DCT 스케일링 최대 축소 배율
+    PREVIEW_ERROR = 0.1      # 축소본을 출력 크기로 줄여 인코딩할 때의 오차 범위
+    # 외삽 시 최소 오차 범위 (PNG는 이미지 전체의 연속성에 크게 좌우되어 넓게 잡음)
+    MIN_SAMPLE_ERROR = {'JPEG': 0.1, 'WEBP': 0.15, 'PNG': 0.35}
+
+    def __init__(self, input_path: str):
+        self.input_path = input_path
+        self._mutex = QMutex()
+        self._failed = False
+        self._source_size: Tuple[int, int] = (0, 0)  # EXIF 회전 적용 후 원본 크기
+        self._scale = 0          # 샘플을 디코딩한 축소 배율 (0이면 아직 없음)
+        self._preview: Optional[Image.Image] = None
+        self._tiles: List[List[Image.Image]] = []  # 행별 타일 목록
+        self._strip_cache = None  # (키, 샘플 띠 목록)
+
+    def _samples(self, max_width: Optional[int]):
+        """출력 너비에 충분한 해상도의 (축소본, 타일, 디코딩 배율) (필요할 때만 디코딩, 실패 시 None)"""
+        with QMutexLocker(self._mutex):
+            if self._failed:
+                return None
+            if not self._scale or self._scale > self._draft_scale(self._source_size, max_width):
+                try:
+                    self._load_samples(max_width)
+                except Exception as e:
+                    print(f"크기 추정 샘플 준비 실패: {self.input_path} - {e}")
+                    self._failed = True
+                    return None
+            return self._preview, self._tiles, self._scale
+
+    @staticmethod
+    def _draft_scale(source_size: Tuple[int, int], max_width: Optional[int]) -> int:
+        """출력 너비 이상을 유지하는 가장 큰 2의 거듭제곱 축소 배율"""
+        output_width = ImageCompressor._output_size(source_size, max_width)[0]
+        scale = SizeEstimator.MAX_DRAFT_SCALE
+        while scale > 1 and source_size[0] / scale < output_width:
+            scale //= 2
+        return scale
+
+    def _load_samples(self, max_width: Optional[int]):
+        with ImageLoader.open_image(self.input_path) as img:
+            orientation = ImageLoader._get_exif_orientation(img)
+            width, height = img.size
+            self._source_size = (height, width) if orientation in TRANSPOSED_ORIENTATIONS else (width, height)
+
+            # 출력 크기 이상으로만 줄여 디코딩 (JPEG만 적용됨, 그 외 포맷은 원본 해상도)
+            scale = self._draft_scale(self._source_size, max_width)
+            if scale > 1 and img.format == 'JPEG':
+                img.draft(None, (math.ceil(width / scale), math.ceil(height / scale)))
+
+            if img.mode not in ('RGB', 'RGBA'):
+                has_alpha = img.mode in ('LA', 'PA') or 'transparency' in img.info
+                img = img.convert('RGBA' if has_alpha else 'RGB')
+            img.load()
+            # draft 결과는 요청보다 클 수 있으므로 실제 배율로 기록 (다른 포맷은 1)
+            self._scale = max(1, width // img.width)
+
+            # 샘플 타일 (격자 각 칸의 중앙)
+            tile = min(self.TILE_SIZE, img.width // self.TILE_GRID[0], img.height // self.TILE_GRID[1])
+            columns, rows = self.TILE_GRID
+            tiles = []
+            if tile >= max(self.SAMPLE_SIZE.values()) // 2:
+                for row in range(rows):
+                    y = int((row + 0.5) * img.height / rows - tile / 2)
+                    tiles.append([
+                        img.crop((x, y, x + tile, y + tile))
+                        for x in (int((column + 0.5) * img.width / columns - tile / 2)
+                                  for column in range(columns))
+                    ])
+
+            # 축소본: 정수배 reduce()로 PREVIEW_SIDE 근처까지 줄인 뒤 LANCZOS
+            factor = max(1, max(img.size) // self.PREVIEW_SIDE)
+            preview = img.reduce(factor) if factor > 1 else img.copy()
+            preview.thumbnail((self.PREVIEW_SIDE, self.PREVIEW_SIDE), Image.Resampling.LANCZOS)
+            preview = ImageLoader._apply_orientation(preview, orientation)
+
+            self._tiles = tiles
+            self._preview = preview
+            self._strip_cache = None
+
+    def estimate(self, quality: int = 80, max_width: Optional[int] = None,
+                 output_format: str = 'JPEG') -> Optional[SizeEstimate]:
+        """지정한 설정으로 압축했을 때의 예상 크기 (실패 시 None)"""
+        samples = self._samples(max_width)
+        if samples is None:
+            return None
+
+        preview, tiles, scale = samples
+        output_size = ImageCompressor._output_size(self._source_size, max_width)
         try:
-            original_size = os.path.getsize(input_path)
+            if max(output_size) <= self.PREVIEW_SIDE or not tiles:
+                return self._estimate_from_preview(preview, output_size, quality, output_format)
+            return self._estimate_from_strips(tiles, scale, output_size, quality, output_format)
+        except Exception as e:
+            print(f"크기 추정 실패: {self.input_path} - {e}")
+            return None
+
+    def _estimate_from_preview(self, preview: Image.Image, output_size: Tuple[int, int],
+                               quality: int, output_format: str) -> SizeEstimate:
+        """축소본을 출력 크기로 맞춰 통째로 인코딩 (출력이 축소본보다 크면 면적 비율로 외삽)"""
+        sample = preview
+        if sample.size != output_size and max(output_size) <= max(sample.size):
+            sample = sample.resize(output_size, Image.Resampling.LANCZOS)
+        sample = ImageCompressor._prepare_for_format(sample, output_format)
+        size = len(ImageCompressor._encode(sample, output_format, quality))
+
+        error = self.PREVIEW_ERROR
+        if sample.size != output_size:
+            overhead = self._header_overhead(output_format, quality, sample.mode)
+            scale = (output_size[0] * output_size[1]) / (sample.width * sample.height)
+            size = int(overhead + max(0, size - overhead) * scale)
+            error = self.MIN_SAMPLE_ERROR.get(output_format, 0.1)
+        return self._make_estimate(size, error, output_size)
+
+    def _estimate_from_strips(self, tiles: List[List[Image.Image]], scale: int,
+                              output_size: Tuple[int, int], quality: int,
+                              output_format: str) -> SizeEstimate:
+        """샘플 띠를 출력 배율로 인코딩해 픽셀당 바이트로 외삽"""
+        strips = self._strips(tiles, scale, output_size, output_format)
+        overhead = self._header_overhead(output_format, quality, strips[0].mode)
+        rates = [
+            max(0, len(ImageCompressor._encode(strip, output_format, quality)) - overhead)
+            / (strip.width * strip.height)
+            for strip in strips
+        ]
+
+        mean = sum(rates) / len(rates)
+        pixels = output_size[0] * output_size[1]
+        size = int(overhead + mean * pixels)
+
+        # 띠 간 편차로 평균의 표준 오차 계산 (약 95% 구간)
+        error = self.MIN_SAMPLE_ERROR.get(output_format, 0.1)
+        if mean > 0 and len(rates) > 1:
+            variance = sum((r - mean) ** 2 for r in rates) / (len(rates) - 1)
+            error = max(error, 2 * math.sqrt(variance / len(rates)) / mean)
+        return self._make_estimate(size, error, output_size)
+
+    def _strips(self, tiles: List[List[Image.Image]], scale: int,
+                output_size: Tuple[int, int], output_format: str) -> List[Image.Image]:
+        """출력 배율로 줄인 샘플 띠 (품질만 바뀌면 다시 만들지 않도록 마지막 결과 보관)"""
+        key = (id(tiles), scale, output_size, output_format)
+        cached = self._strip_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        ratio = output_size[0] * scale / self._source_size[0]  # 디코딩 해상도 기준 배율
+        tile_size = tiles[0][0].width
+        crop = min(tile_size, max(1, round(self.SAMPLE_SIZE.get(output_format, 256) / ratio)))
+        sample = max(8, round(crop * ratio))
+        offset = (tile_size - crop) // 2
+
+        strips = []
+        for row in tiles:
+            strip = Image.new(row[0].mode, (sample * len(row), sample))
+            for column, tile in enumerate(row):
+                tile = tile.crop((offset, offset, offset + crop, offset + crop))
+                if sample != crop:
+                    tile = tile.resize((sample, sample), Image.Resampling.LANCZOS)
+                strip.paste(tile, (column * sample, 0))
+            strips.append(ImageCompressor._prepare_for_format(strip, output_format))
+
+        self._strip_cache = (key, strips)  # 통째로 교체하므로 다른 스레드와 공유해도 안전
+        return strips
 
-            # 품질에 따른 대략적인 압축률
-            quality_factor = quality / 100
+    @staticmethod
+    def _header_overhead(output_format: str, quality: int, mode: str) -> int:
+        """픽셀 데이터와 무관한 헤더 크기 (아주 작은 단색 이미지 인코딩 크기)"""
+        blank = Image.new(mode, (8, 8), (128,) * len(mode))
+        return len(ImageCompressor._encode(blank, output_format, quality))
 
-            # 리사이즈 비율
-            resize_factor = 1.0
-            if max_width:
-                with Image.open(input_path) as img:
-                    if img.width > max_width:
-                        resize_factor = (max_width / img.width) ** 2  # 면적 비율
+    @staticmethod
+    def _make_estimate(size: int, error: float, output_size: Tuple[int, int]) -> SizeEstimate:
+        return SizeEstimate(
+            size=size,
+            low=int(size * max(0.0, 1 - error)),
+            high=int(size * (1 + error)),
+            width=output_size[0],
+            height=output_size[1]
+        )
 
-            # 추정 크기 (실제와 다를 수 있음)
-            estimated = int(original_size * quality_factor * 0.5 * resize_factor)
-            return max(estimated, 1024)  # 최소 1KB
 
-        except Exception:
-            return 0
+class CompressionWorker(QRunnable):
+    """단일 파일 압축 워커 (GUI 스레드를 막지 않음)"""
+
+    class Signals(QObject):
+        progress = Signal(int)  # 0-100
+        finished = Signal(object)  # CompressionResult
+
+    def __init__(self, input_path: str, quality: int = 80, max_width: Optional[int] = None,
+                 output_format: str = 'JPEG', target_size: Optional[int] = None):
+        super().__init__()
+        self.input_path = input_path
+        self.quality = quality
+        self.max_width = max_width
+        self.output_format = output_format
+        self.target_size = target_size
+        self.signals = CompressionWorker.Signals()
+        self._is_cancelled = False
+
+    def cancel(self):
+        self._is_cancelled = True
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._is_cancelled
+
+    def run(self):
+        result = ImageCompressor.compress(
+            self.input_path,
+            quality=self.quality,
+            max_width=self.max_width,
+            output_format=self.output_format,
+            target_size=self.target_size,
+            progress=self.signals.progress.emit,
+            is_cancelled=lambda: self._is_cancelled
+        )
+        self.signals.finished.emit(result)
+
+
+class BatchCompressionWorker(QRunnable):
+    """일괄 압축 워커 (GUI를 막지 않도록 스레드에서 프로세스 풀 관리)"""
+
+    class Signals(QObject):
+        progress = Signal(int, int, object)  # done, total, CompressionResult
+        finished = Signal(object)  # BatchCompressionResult
+
+    def __init__(self, input_paths: List[str], quality: int = 80,
+                 max_width: Optional[int] = None, output_format: str = 'JPEG',
+                 target_size: Optional[int] = None):
+        super().__init__()
+        self.input_paths = list(input_paths)
+        self.quality = quality
+        self.max_width = max_width
+        self.output_format = output_format
+        self.target_size = target_size
+        self.signals = BatchCompressionWorker.Signals()
+        self._is_cancelled = False
+
+    def cancel(self):
+        self._is_cancelled = True
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._is_cancelled
+
+    def run(self):
+        batch = ImageCompressor.compress_batch(
+            self.input_paths,
+            quality=self.quality,
+            max_width=self.max_width,
+            output_format=self.output_format,
+            target_size=self.target_size,
+            progress=lambda done, total, result: self.signals.progress.emit(done, total, result),
+            is_cancelled=lambda: self._is_cancelled
+        )
+        self.signals.finished.emit(batch)
+
+
+class SizeEstimateWorker(QRunnable):
+    """압축 크기 추정 워커 (첫 실행 시 SizeEstimator 샘플 준비 포함)"""
+
+    class Signals(QObject):
+        finished = Signal(int, object)  # generation, SizeEstimate (실패 시 None)
+
+    def __init__(self, estimator: SizeEstimator, generation: int, quality: int,
+                 max_width: Optional[int], output_format: str):
+        super().__init__()
+        self.estimator = estimator
+        self.generation = generation
+        self.quality = quality
+        self.max_width = max_width
+        self.output_format = output_format
+        self.signals = SizeEstimateWorker.Signals()
+        self._is_cancelled = False
+
+    def cancel(self):
+        """결과를 보내지 않음 (시작 전이면 추정하지 않음)"""
+        self._is_cancelled = True
+
+    def run(self):
+        if self._is_cancelled:
+            return
+        estimate = self.estimator.estimate(self.quality, self.max_width, self.output_format)
+        if not self._is_cancelled:
+            self.signals.finished.emit(self.generation, estimate)
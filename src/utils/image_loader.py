@@ -2,30 +2,101 @@
 이미지 로딩 유틸리티 - HEIC 포함 다양한 포맷 지원
 """
 import os
+import time
+import importlib.util
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Callable, Optional, Tuple, List
 from io import BytesIO
 
-from PIL import Image, ExifTags
-from PySide6.QtCore import QThread, Signal, QObject, QRunnable, QThreadPool, QMutex, QMutexLocker
+from PIL import Image, ExifTags, UnidentifiedImageError
+from PySide6.QtCore import (
+    QThread, Signal, QObject, QRunnable, QThreadPool, QMutex, QMutexLocker, QSize, QBuffer, QIODevice
+)
 from PySide6.QtGui import QImage, QPixmap
 
+from .metadata import ImageMetadata, MetadataCache
+
 # HEIC 지원 - 설치되어 있으면 활성화
-try:
-    import pillow_heif
-    pillow_heif.register_heif_opener()
-    HEIC_SUPPORTED = True
-except ImportError:
-    HEIC_SUPPORTED = False
+# pillow-heif import는 수백 ms가 걸리므로 설치 여부만 확인하고, opener는 HEIC 파일을 처음 열 때 등록
+HEIC_SUPPORTED = importlib.util.find_spec('pillow_heif') is not None
+HEIF_EXTENSIONS = {'.heic', '.heif'}
+# 확장자가 다른 HEIF 파일을 알아보는 ftyp 브랜드 (AVIF는 Pillow가 직접 연다)
+HEIF_BRANDS = {b'heic', b'heix', b'hevc', b'hevx', b'heim', b'heis', b'hevm', b'hevs', b'mif1', b'msf1'}
 
 # 지원 포맷
-IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.webp', '.gif'}
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.webp', '.gif', '.tif', '.tiff'}
 if HEIC_SUPPORTED:
-    IMAGE_EXTENSIONS.update({'.heic', '.heif'})
+    IMAGE_EXTENSIONS.update(HEIF_EXTENSIONS)
 
 VIDEO_EXTENSIONS = {'.mp4', '.mkv', '.avi', '.mov', '.webm'}
 ALL_EXTENSIONS = IMAGE_EXTENSIONS | VIDEO_EXTENSIONS
 
+# 헤더만 읽거나 타일 피라미드를 만들 때 허용하는 픽셀 수 (open_image(allow_large=True))
+# 그 외 디코딩(썸네일, 프리페치, 압축 등)은 Pillow 기본 압축 폭탄 제한을 그대로 사용
+LARGE_IMAGE_MAX_PIXELS = 1_000_000_000
+
+# 축소 디코딩 시 최종 크기 대비 여유 배율 (DCT 스케일링/reduce 후 LANCZOS로 마무리)
+REDUCING_GAP = 2.0
+
+# EXIF 방향 값 → 회전/반전 방법
+EXIF_TRANSPOSE_METHODS = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+# 가로/세로가 뒤바뀌는 EXIF 방향 값
+TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+# EXIF IFD1 내장 썸네일 태그
+EXIF_THUMBNAIL_OFFSET = 0x0201  # JPEGInterchangeFormat
+EXIF_THUMBNAIL_LENGTH = 0x0202  # JPEGInterchangeFormatLength
+
+# 내장 썸네일 허용 종횡비 오차 (레터박스 썸네일 제외용)
+EMBEDDED_ASPECT_TOLERANCE = 0.02
+
+_heif_registered = False
+_heif_failed = False
+_heif_mutex = QMutex()
+_pixel_limit_mutex = QMutex()
+
+
+def _register_heif_opener() -> bool:
+    """pillow-heif opener 등록 (처음 한 번만 시도, 여러 스레드에서 호출 가능)
+
+    Returns:
+        HEIF를 열 수 있으면 True
+    """
+    global _heif_registered, _heif_failed
+    if not HEIC_SUPPORTED or _heif_failed:
+        return False
+    with QMutexLocker(_heif_mutex):
+        if not _heif_registered and not _heif_failed:
+            try:
+                import pillow_heif
+                pillow_heif.register_heif_opener()
+            except Exception as e:
+                print(f"pillow-heif 초기화 실패: {e}")
+                _heif_failed = True
+                return False
+            _heif_registered = True
+    return _heif_registered
+
+
+# 메타데이터 공유 캐시 (디코딩 중 기록, 정보 바/대화상자에서 조회)
+_metadata_cache = MetadataCache()
+
+
+def _pixmap_nbytes(pixmap: QPixmap) -> int:
+    """픽스맵 실제 메모리 크기 (저장 형식 depth, 줄 단위 4바이트 정렬 반영)"""
+    bytes_per_line = (pixmap.width() * max(pixmap.depth(), 1) + 31) // 32 * 4
+    return bytes_per_line * pixmap.height()
+
 
 class ImageLoader:
     """이미지 로딩 및 처리 클래스"""
@@ -49,21 +120,83 @@ class ImageLoader:
         return ext in ALL_EXTENSIONS
 
     @staticmethod
-    def get_files_in_folder(folder_path: str) -> List[str]:
-        """폴더 내 지원되는 모든 미디어 파일 목록 반환"""
+    def get_files_in_folder(folder_path: str,
+                            on_progress: Optional[Callable[[List[str]], None]] = None,
+                            progress_interval: float = 0.5) -> List[str]:
+        """폴더 내 지원되는 모든 미디어 파일 목록 반환
+
+        Args:
+            folder_path: 폴더 경로
+            on_progress: 열거가 오래 걸릴 때 progress_interval(초)마다
+                직전 호출 이후 새로 찾은 파일 목록(정렬됨)을 받는 콜백
+            progress_interval: on_progress 호출 간격 (초)
+        """
         files = []
+        reported = 0  # on_progress로 전달한 파일 수
         try:
+            last_progress = time.perf_counter()
             for entry in os.scandir(folder_path):
                 if entry.is_file() and ImageLoader.is_supported_file(entry.path):
                     files.append(entry.path)
-            files.sort(key=lambda x: x.lower())
-        except PermissionError:
+                    if on_progress is not None and time.perf_counter() - last_progress >= progress_interval:
+                        on_progress(sorted(files[reported:], key=lambda x: x.lower()))
+                        reported = len(files)
+                        last_progress = time.perf_counter()
+        except OSError:  # 권한 없음, 그사이 삭제된 폴더 등
             pass
+        files.sort(key=lambda x: x.lower())
         return files
 
+    @staticmethod
+    def open_image(file_path: str, allow_large: bool = False) -> Image.Image:
+        """PIL 이미지 열기 (Image.open 대신 사용, HEIC/HEIF이면 먼저 pillow-heif opener 등록)
+
+        압축/타일 생성 등 PIL 이미지를 직접 다루는 모듈도 이 함수로 연다.
+
+        Args:
+            allow_large: 여는 동안만 픽셀 제한을 LARGE_IMAGE_MAX_PIXELS로 올림
+                (헤더만 읽거나 행 단위로 디코딩하는 경우에만 사용)
+        """
+        if not allow_large:
+            return ImageLoader._open_image(file_path)
+
+        # 제한은 전역 값이므로 헤더를 읽는 동안만 바꾸고 바로 되돌림
+        with QMutexLocker(_pixel_limit_mutex):
+            default_limit = Image.MAX_IMAGE_PIXELS
+            if default_limit is not None and default_limit < LARGE_IMAGE_MAX_PIXELS:
+                Image.MAX_IMAGE_PIXELS = LARGE_IMAGE_MAX_PIXELS
+            try:
+                return ImageLoader._open_image(file_path)
+            finally:
+                Image.MAX_IMAGE_PIXELS = default_limit
+
+    @staticmethod
+    def _open_image(file_path: str) -> Image.Image:
+        """open_image 본체 (픽셀 제한은 호출 시점의 전역 값 사용)"""
+        if not _heif_registered and os.path.splitext(file_path)[1].lower() in HEIF_EXTENSIONS:
+            _register_heif_opener()
+        try:
+            return Image.open(file_path)
+        except UnidentifiedImageError:
+            # 확장자와 달리 실제로는 HEIF인 파일일 수 있음 (손상/비이미지 파일은 헤더로 걸러 냄)
+            if _heif_registered or not ImageLoader._has_heif_header(file_path) \
+                    or not _register_heif_opener():
+                raise
+            return Image.open(file_path)
+
+    @staticmethod
+    def _has_heif_header(file_path: str) -> bool:
+        """ISO BMFF ftyp 상자의 주 브랜드가 HEIF인지 확인"""
+        try:
+            with open(file_path, 'rb') as f:
+                header = f.read(12)
+        except OSError:
+            return False
+        return header[4:8] == b'ftyp' and header[8:12] in HEIF_BRANDS
+
     @staticmethod
     def load_image(file_path: str, max_size: Optional[Tuple[int, int]] = None) -> Optional[QPixmap]:
-        """이미지 파일을 QPixmap으로 로드
+        """이미지 파일을 QPixmap으로 로드 (GUI 스레드 전용)
 
         Args:
             file_path: 이미지 파일 경로
@@ -72,76 +205,245 @@ class ImageLoader:
         Returns:
             QPixmap 또는 실패 시 None
         """
+        qimage = ImageLoader.load_qimage(file_path, max_size)
+        if qimage is None:
+            return None
+        return QPixmap.fromImage(qimage)
+
+    @staticmethod
+    def load_qimage(file_path: str, max_size: Optional[Tuple[int, int]] = None) -> Optional[QImage]:
+        """이미지 파일을 QImage로 로드 (워커 스레드에서 호출 가능)
+
+        Args:
+            file_path: 이미지 파일 경로
+            max_size: 최대 크기 (width, height) - 썸네일용
+
+        Returns:
+            QImage 또는 실패 시 None
+        """
+        result = ImageLoader.load_preview(file_path, max_size)
+        return result[0] if result else None
+
+    @staticmethod
+    def load_preview(file_path: str,
+                     max_size: Optional[Tuple[int, int]] = None) -> Optional[Tuple[QImage, QSize]]:
+        """max_size 이하로 축소 디코딩한 QImage와 원본 크기(회전 반영)를 함께 반환
+
+        뷰어는 원본 크기를 기준으로 줌을 계산하므로, 화면 크기로 먼저 디코딩한
+        이미지를 표시하다가 확대 시 원본 해상도로 교체할 수 있다.
+        워커 스레드에서 호출 가능하다.
+        """
         try:
-            with Image.open(file_path) as img:
-                # EXIF 회전 정보 적용
-                img = ImageLoader._apply_exif_rotation(img)
-
-                # 리사이즈 (썸네일용)
-                if max_size:
-                    img.thumbnail(max_size, Image.Resampling.LANCZOS)
-
-                # RGBA로 변환 (투명도 지원)
-                if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
-                    img = img.convert('RGBA')
-                    qimage = ImageLoader._pil_to_qimage_rgba(img)
-                else:
-                    img = img.convert('RGB')
-                    qimage = ImageLoader._pil_to_qimage_rgb(img)
-
-                return QPixmap.fromImage(qimage)
+            img, metadata = ImageLoader._decode_preview(file_path, max_size)
+            qimage = ImageLoader._pil_to_qimage(img)
+            return (qimage, QSize(metadata.width, metadata.height)) if qimage is not None else None
         except Exception as e:
             print(f"이미지 로드 실패: {file_path} - {e}")
             return None
 
     @staticmethod
-    def _apply_exif_rotation(img: Image.Image) -> Image.Image:
-        """EXIF 회전 정보 적용"""
+    def _decode_preview(file_path: str,
+                        max_size: Optional[Tuple[int, int]] = None) -> Tuple[Image.Image, ImageMetadata]:
+        """load_preview의 디코딩 단계 (Qt 객체 없이 픽셀을 읽은 PIL 이미지 반환, 실패 시 예외)"""
+        with ImageLoader.open_image(file_path) as img:
+            orientation = ImageLoader._get_exif_orientation(img)
+            metadata = ImageLoader._record_metadata(file_path, img, orientation)
+
+            # 리사이즈 (썸네일용) - 축소 디코딩 후 작은 이미지에 회전 적용
+            if max_size:
+                if orientation in TRANSPOSED_ORIENTATIONS:
+                    max_size = (max_size[1], max_size[0])
+                img = ImageLoader._decode_reduced(img, max_size)
+
+            # EXIF 회전 정보 적용
+            img = ImageLoader._apply_orientation(img, orientation)
+            img.load()
+            return img, metadata
+
+    @staticmethod
+    def load_embedded_thumbnail(file_path: str, max_size: Tuple[int, int]) -> Optional[QImage]:
+        """파일에 내장된 썸네일(EXIF IFD1 / HEIF 썸네일)을 QImage로 로드
+
+        전체 디코딩 없이 수 ms 안에 읽을 수 있다. 내장 썸네일이 없거나
+        max_size를 채우기에 작으면 None을 반환하므로 load_image로 대체해야 한다.
+        """
+        thumb = ImageLoader._decode_embedded_thumbnail(file_path, max_size)
+        return ImageLoader._pil_to_qimage(thumb) if thumb is not None else None
+
+    @staticmethod
+    def _decode_embedded_thumbnail(file_path: str, max_size: Tuple[int, int]) -> Optional[Image.Image]:
+        """load_embedded_thumbnail의 디코딩 단계 (PIL 이미지 반환)"""
+        try:
+            with ImageLoader.open_image(file_path) as img:
+                orientation = ImageLoader._get_exif_orientation(img)
+                ImageLoader._record_metadata(file_path, img, orientation)
+                box = max_size
+                if orientation in TRANSPOSED_ORIENTATIONS:
+                    box = (max_size[1], max_size[0])
+
+                # 최종 썸네일 크기 (원본 비율 유지)
+                scale = min(box[0] / img.width, box[1] / img.height, 1.0)
+                needed = (max(1, int(img.width * scale)), max(1, int(img.height * scale)))
+
+                thumb = ImageLoader._read_exif_thumbnail(img)
+                if thumb is None and img.format == 'HEIF':
+                    # pillow-heif는 draft()로 조건에 맞는 내장 썸네일을 선택한다
+                    if img.draft(None, needed) is not None:
+                        img.load()
+                        thumb = img
+
+                if thumb is None:
+                    return None
+                if thumb.width < needed[0] or thumb.height < needed[1]:
+                    return None
+                if abs(thumb.width / thumb.height - img.width / img.height) > \
+                        EMBEDDED_ASPECT_TOLERANCE * img.width / img.height:
+                    return None
+
+                thumb.thumbnail(box, Image.Resampling.LANCZOS)
+                thumb = ImageLoader._apply_orientation(thumb, orientation)
+                thumb.load()
+                return thumb
+        except Exception:
+            return None
+
+    @staticmethod
+    def get_metadata(file_path: str) -> Optional[ImageMetadata]:
+        """이미지 메타데이터 (캐시에 없으면 헤더만 읽음, 픽셀 디코딩 없음)"""
+        metadata = _metadata_cache.get(file_path)
+        if metadata is not None:
+            return metadata
+
+        try:
+            with ImageLoader.open_image(file_path, allow_large=True) as img:
+                orientation = ImageLoader._get_exif_orientation(img)
+                return ImageLoader._record_metadata(file_path, img, orientation)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _record_metadata(file_path: str, img: Image.Image, orientation: int) -> ImageMetadata:
+        """디코딩 전 헤더 정보로 메타데이터를 만들어 캐시에 기록 (draft/축소 전에 호출)"""
+        width, height = img.size
+        if orientation in TRANSPOSED_ORIENTATIONS:
+            width, height = height, width
+
+        metadata = ImageMetadata.from_image(file_path, img, orientation, width, height)
+        if metadata is None:
+            return ImageMetadata(file_path, 0, 0, width, height, orientation, img.format or "")
+        _metadata_cache.put(metadata)
+        return metadata
+
+    @staticmethod
+    def _read_exif_thumbnail(img: Image.Image) -> Optional[Image.Image]:
+        """EXIF IFD1에 저장된 JPEG 썸네일 추출 (없으면 None)"""
+        raw = img.info.get('exif')
+        if not raw:
+            return None
+
+        ifd1 = img.getexif().get_ifd(ExifTags.IFD.IFD1)
+        offset = ifd1.get(EXIF_THUMBNAIL_OFFSET)
+        length = ifd1.get(EXIF_THUMBNAIL_LENGTH)
+        if not offset or not length:
+            return None
+
+        # 오프셋은 TIFF 헤더 기준 (APP1의 'Exif' 식별자 6바이트 제외)
+        if raw.startswith(b'Exif\x00\x00'):
+            raw = raw[6:]
+        data = raw[offset:offset + length]
+        if len(data) != length:
+            return None
+
+        thumb = Image.open(BytesIO(data))
+        thumb.load()
+        return thumb
+
+    @staticmethod
+    def _decode_reduced(img: Image.Image, max_size: Tuple[int, int]) -> Image.Image:
+        """축소 해상도 디코딩 후 max_size에 맞게 리사이즈
+
+        픽셀을 읽기 전에 draft()로 디코더에 목표 크기를 알려서
+        JPEG은 DCT 스케일링(1/2~1/8), HEIF는 내장 썸네일로 디코딩하고,
+        그 외 포맷은 thumbnail()의 reduce() 단계로 정수배 축소 후 LANCZOS로 마무리한다.
+        """
+        width, height = img.size
+        scale = min(max_size[0] / width, max_size[1] / height, 1.0)
+        draft_size = (
+            max(1, int(width * scale * REDUCING_GAP)),
+            max(1, int(height * scale * REDUCING_GAP)),
+        )
+        img.draft(None, draft_size)
+        img.thumbnail(max_size, Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP)
+        return img
+
+    @staticmethod
+    def _get_exif_orientation(img: Image.Image) -> int:
+        """EXIF 방향 값 (없으면 1)"""
         try:
             exif = img.getexif()
-            if exif:
-                orientation_key = None
-                for key, val in ExifTags.TAGS.items():
-                    if val == 'Orientation':
-                        orientation_key = key
-                        break
-
-                if orientation_key and orientation_key in exif:
-                    orientation = exif[orientation_key]
-
-                    if orientation == 2:
-                        img = img.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-                    elif orientation == 3:
-                        img = img.rotate(180)
-                    elif orientation == 4:
-                        img = img.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-                    elif orientation == 5:
-                        img = img.rotate(-90, expand=True).transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-                    elif orientation == 6:
-                        img = img.rotate(-90, expand=True)
-                    elif orientation == 7:
-                        img = img.rotate(90, expand=True).transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-                    elif orientation == 8:
-                        img = img.rotate(90, expand=True)
+            orientation = exif.get(ExifTags.Base.Orientation, 1) if exif else 1
+            return orientation if orientation in range(1, 9) else 1
         except Exception:
-            pass
+            return 1
+
+    @staticmethod
+    def _apply_orientation(img: Image.Image, orientation: int) -> Image.Image:
+        """EXIF 방향 값에 따라 회전/반전 (보간 없는 transpose 사용)"""
+        method = EXIF_TRANSPOSE_METHODS.get(orientation)
+        if method is not None:
+            img = img.transpose(method)
         return img
 
     @staticmethod
-    def _pil_to_qimage_rgb(img: Image.Image) -> QImage:
-        """PIL RGB 이미지를 QImage로 변환"""
-        data = img.tobytes('raw', 'RGB')
-        return QImage(data, img.width, img.height, img.width * 3, QImage.Format.Format_RGB888)
+    def _apply_exif_rotation(img: Image.Image) -> Image.Image:
+        """EXIF 회전 정보 적용"""
+        try:
+            return ImageLoader._apply_orientation(img, ImageLoader._get_exif_orientation(img))
+        except Exception:
+            return img
+
+    @staticmethod
+    def _pil_to_qimage(img: Image.Image) -> Optional[QImage]:
+        """PIL 이미지를 픽셀 메모리를 소유하는 QImage로 변환 (복사 1회)
+
+        QImage가 할당한 버퍼를 PIL 이미지로 감싸 디코딩 결과를 한 번만 붙여 넣는다.
+        tobytes() 버퍼를 빌려 쓰는 QImage와 달리 다른 스레드로 넘겨도 안전하다.
+        PIL의 RGB 이미지는 내부적으로 픽셀당 4바이트라 RGBX8888과 레이아웃이 같다.
+        """
+        img, has_alpha = ImageLoader._to_qimage_mode(img)
+        qimage = QImage(img.width, img.height, ImageLoader._qimage_format(has_alpha))
+        if qimage.isNull():
+            return None
+
+        ImageLoader._paste_into_buffer(img, has_alpha, qimage.bits(), qimage.bytesPerLine())
+        return qimage
+
+    @staticmethod
+    def _to_qimage_mode(img: Image.Image) -> Tuple[Image.Image, bool]:
+        """QImage로 옮길 수 있는 모드(RGB/RGBA)로 변환, 투명도 여부와 함께 반환"""
+        has_alpha = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+        source_mode = 'RGBA' if has_alpha else 'RGB'
+        if img.mode != source_mode:
+            img = img.convert(source_mode)
+        img.load()
+        return img, has_alpha
+
+    @staticmethod
+    def _qimage_format(has_alpha: bool) -> QImage.Format:
+        return QImage.Format.Format_RGBA8888 if has_alpha else QImage.Format.Format_RGBX8888
 
     @staticmethod
-    def _pil_to_qimage_rgba(img: Image.Image) -> QImage:
-        """PIL RGBA 이미지를 QImage로 변환"""
-        data = img.tobytes('raw', 'RGBA')
-        return QImage(data, img.width, img.height, img.width * 4, QImage.Format.Format_RGBA8888)
+    def _paste_into_buffer(img: Image.Image, has_alpha: bool, buffer, bytes_per_line: int):
+        """RGB/RGBA 이미지를 RGBX8888/RGBA8888 레이아웃의 쓰기 가능한 버퍼에 복사"""
+        target_mode = 'RGBA' if has_alpha else 'RGBX'
+        target = Image.frombuffer(
+            target_mode, img.size, buffer, 'raw', target_mode, bytes_per_line, 1
+        )
+        target.im.paste(img.im, (0, 0, img.width, img.height))
 
     @staticmethod
     def get_image_info(file_path: str) -> dict:
-        """이미지 파일 정보 반환"""
+        """이미지 파일 정보 반환 (메타데이터 캐시 사용, 이미지가 아니면 크기만)"""
         info = {
             'filename': os.path.basename(file_path),
             'size_bytes': 0,
@@ -149,15 +451,16 @@ class ImageLoader:
             'height': 0,
         }
 
-        try:
-            info['size_bytes'] = os.path.getsize(file_path)
-            with Image.open(file_path) as img:
-                # EXIF 회전 고려한 실제 표시 크기
-                img = ImageLoader._apply_exif_rotation(img)
-                info['width'] = img.width
-                info['height'] = img.height
-        except Exception:
-            pass
+        metadata = ImageLoader.get_metadata(file_path) if ImageLoader.is_supported_image(file_path) else None
+        if metadata is not None:
+            info['size_bytes'] = metadata.file_size
+            info['width'] = metadata.width
+            info['height'] = metadata.height
+        else:
+            try:
+                info['size_bytes'] = os.path.getsize(file_path)
+            except OSError:
+                pass
 
         return info
 
@@ -173,88 +476,382 @@ class ImageLoader:
 
 
 class ThumbnailWorker(QRunnable):
-    """비동기 썸네일 로딩 워커"""
+    """비동기 썸네일 로딩 워커
+
+    disk_cache(ThumbnailDiskCache)를 주면 디코딩 전에 디스크 캐시를 확인하고,
+    디코딩한 썸네일은 디스크 캐시에 저장한다 (SQLite 접근을 GUI 스레드 밖에서 처리).
+    """
 
     class Signals(QObject):
-        finished = Signal(str, QPixmap)  # file_path, pixmap
+        finished = Signal(str, QImage)  # file_path, image
         error = Signal(str, str)  # file_path, error_message
 
-    def __init__(self, file_path: str, size: Tuple[int, int] = (80, 80)):
+    def __init__(self, file_path: str, size: Tuple[int, int] = (80, 80), disk_cache=None):
         super().__init__()
         self.file_path = file_path
         self.size = size
         self.signals = ThumbnailWorker.Signals()
+        self._disk_cache = disk_cache
+        self._is_cancelled = False
+
+    def cancel(self):
+        self._is_cancelled = True
+
+    def run(self):
+        if self._is_cancelled:
+            return
+
+        # 디스크 캐시 확인 (이전 실행에서 생성된 썸네일)
+        thumb_size = max(self.size)
+        if self._disk_cache is not None:
+            data = self._disk_cache.get(self.file_path, thumb_size)
+            if data:
+                image = QImage()
+                if image.loadFromData(data):
+                    if not self._is_cancelled:
+                        self.signals.finished.emit(self.file_path, image)
+                    return
+
+        from .process_decoder import ProcessDecoder
+        if ProcessDecoder.is_enabled():
+            image = ProcessDecoder.load_thumbnail(self.file_path, self.size)
+        else:
+            # 내장 썸네일 우선, 없거나 작으면 축소 디코딩
+            image = ImageLoader.load_embedded_thumbnail(self.file_path, self.size)
+            if image is None:
+                image = ImageLoader.load_qimage(self.file_path, max_size=self.size)
+
+        if image is None:
+            if not self._is_cancelled:
+                self.signals.error.emit(self.file_path, "로드 실패")
+            return
+
+        if self._is_cancelled:
+            return
+        self.signals.finished.emit(self.file_path, image)
+        # 표시 후 디스크 캐시에 저장
+        if self._disk_cache is not None:
+            self._disk_cache.put(self.file_path, thumb_size, self._encode(image))
+
+    @staticmethod
+    def _encode(image: QImage) -> bytes:
+        """디스크 캐시용 썸네일 인코딩 (투명도 있으면 PNG, 없으면 JPEG)"""
+        buffer = QBuffer()
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        if image.hasAlphaChannel() or not image.save(buffer, 'JPG', 85):
+            buffer.seek(0)
+            if not image.save(buffer, 'PNG'):
+                return b''
+        return bytes(buffer.data())
+
+
+class ImageLoadWorker(QRunnable):
+    """비동기 이미지 로딩 워커 (프리페치/원본 해상도 로딩용)"""
+
+    class Signals(QObject):
+        finished = Signal(str, QImage, QSize)  # file_path, image, original_size
+        error = Signal(str, str)  # file_path, error_message
+        skipped = Signal(str)  # file_path - 타일 모드 대상이라 디코딩하지 않음 (skip_tiled일 때)
+
+    def __init__(self, file_path: str, max_size: Optional[Tuple[int, int]] = None,
+                 startup_decoder=None, skip_tiled: bool = False):
+        super().__init__()
+        self.file_path = file_path
+        self.max_size = max_size  # None이면 원본 해상도
+        self.signals = ImageLoadWorker.Signals()
         self._is_cancelled = False
+        self._startup_decoder = startup_decoder  # 시작 시 미리 디코딩 중인 결과 (StartupDecoder)
+        self._skip_tiled = skip_tiled  # 초대형 이미지는 헤더만 확인하고 건너뜀 (프리페치용)
 
     def cancel(self):
         self._is_cancelled = True
 
+    @property
+    def is_cancelled(self) -> bool:
+        return self._is_cancelled
+
     def run(self):
         if self._is_cancelled:
             return
 
-        pixmap = ImageLoader.load_image(self.file_path, max_size=self.size)
+        if self._skip_tiled:
+            from .tiled_image import TiledImage
+            if TiledImage.should_tile(self.file_path):
+                if not self._is_cancelled:
+                    self.signals.skipped.emit(self.file_path)
+                return
+
+        result = self._startup_decoder.result() if self._startup_decoder is not None else None
+        if result is None:
+            from .process_decoder import ProcessDecoder
+            if ProcessDecoder.is_enabled():
+                result = ProcessDecoder.load_preview(self.file_path, self.max_size)
+            else:
+                result = ImageLoader.load_preview(self.file_path, self.max_size)
 
         if self._is_cancelled:
             return
 
-        if pixmap:
-            self.signals.finished.emit(self.file_path, pixmap)
+        if result is not None:
+            self.signals.finished.emit(self.file_path, *result)
         else:
             self.signals.error.emit(self.file_path, "로드 실패")
 
 
+class FolderScanWorker(QRunnable):
+    """비동기 폴더 스캔 워커 (파일 열기 시 첫 이미지를 먼저 표시하고 목록은 나중에 채움)
+
+    열거가 오래 걸리는 폴더(네트워크 드라이브, 수만 개 파일)는 중간 결과도 전달한다.
+    중간 결과와 완료 결과는 모두 새로 찾은 파일만 담으므로 받는 쪽에서 목록에 병합한다.
+    generation은 요청 구분용 - 그사이 다른 파일을 열었으면 받는 쪽에서 결과를 버린다.
+    """
+
+    class Signals(QObject):
+        progress = Signal(int, list)  # generation, 새로 찾은 파일 (정렬됨)
+        finished = Signal(int, list)  # generation, 아직 전달하지 않은 나머지 파일 (정렬됨)
+
+    PROGRESS_INTERVAL = 0.5  # 중간 결과 전달 간격 (초)
+
+    def __init__(self, folder_path: str, generation: int):
+        super().__init__()
+        self.folder_path = folder_path
+        self.generation = generation
+        self.signals = FolderScanWorker.Signals()
+        self._is_cancelled = False
+        self._reported = set()  # progress로 전달한 파일
+
+    def cancel(self):
+        self._is_cancelled = True
+
+    def run(self):
+        if self._is_cancelled:
+            return
+
+        files = ImageLoader.get_files_in_folder(self.folder_path, self._on_progress,
+                                                self.PROGRESS_INTERVAL)
+
+        if not self._is_cancelled:
+            remaining = [f for f in files if f not in self._reported] if self._reported else files
+            self.signals.finished.emit(self.generation, remaining)
+
+    def _on_progress(self, files: List[str]):
+        self._reported.update(files)
+        if not self._is_cancelled:
+            self.signals.progress.emit(self.generation, files)
+
+
 class ThumbnailCache:
-    """LRU 기반 썸네일 캐시"""
+    """LRU 기반 썸네일 캐시
+
+    OrderedDict로 조회/삽입/제거가 모두 O(1)이며, 메모리는 픽스맵의 실제
+    저장 형식(depth, 줄 정렬) 기준으로 계산한다. 화면에 보이는 항목은
+    pin()으로 고정해 제한을 넘어도 제거되지 않게 할 수 있다.
+    """
 
     def __init__(self, max_items: int = 500, max_memory_mb: int = 100):
-        self._cache = {}  # {path: (pixmap, access_order)}
-        self._access_order = 0
+        self._cache = OrderedDict()  # {path: (pixmap, nbytes)}
+        self._pinned = set()
         self._max_items = max_items
         self._max_memory_bytes = max_memory_mb * 1024 * 1024
         self._current_memory = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
         self._mutex = QMutex()
 
     def get(self, path: str) -> Optional[QPixmap]:
+        """썸네일 반환 (최근 사용으로 표시, 통계 반영)"""
         with QMutexLocker(self._mutex):
-            if path in self._cache:
-                pixmap, _ = self._cache[path]
-                self._access_order += 1
-                self._cache[path] = (pixmap, self._access_order)
-                return pixmap
-            return None
+            entry = self._cache.get(path)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._cache.move_to_end(path)
+            return entry[0]
+
+    def peek(self, path: str) -> Optional[QPixmap]:
+        """썸네일 반환 (LRU 순서/통계에 영향 없음 - 그리기용)"""
+        with QMutexLocker(self._mutex):
+            entry = self._cache.get(path)
+            return entry[0] if entry is not None else None
+
+    def contains(self, path: str) -> bool:
+        with QMutexLocker(self._mutex):
+            return path in self._cache
 
     def put(self, path: str, pixmap: QPixmap):
+        nbytes = _pixmap_nbytes(pixmap)
         with QMutexLocker(self._mutex):
-            # 이미 캐시에 있으면 업데이트
-            if path in self._cache:
-                old_pixmap, _ = self._cache[path]
-                self._current_memory -= self._estimate_pixmap_memory(old_pixmap)
+            # 이미 캐시에 있으면 교체
+            old = self._cache.pop(path, None)
+            if old is not None:
+                self._current_memory -= old[1]
 
-            # 캐시 정리
+            self._cache[path] = (pixmap, nbytes)
+            self._current_memory += nbytes
             self._evict_if_needed()
 
-            # 새 항목 추가
-            self._access_order += 1
-            self._cache[path] = (pixmap, self._access_order)
-            self._current_memory += self._estimate_pixmap_memory(pixmap)
+    def remove(self, path: str):
+        """항목 제거 (파일이 바뀌었을 때)"""
+        with QMutexLocker(self._mutex):
+            entry = self._cache.pop(path, None)
+            if entry is not None:
+                self._current_memory -= entry[1]
 
-    def _estimate_pixmap_memory(self, pixmap: QPixmap) -> int:
-        """픽스맵 메모리 사용량 추정"""
-        return pixmap.width() * pixmap.height() * 4  # RGBA 기준
+    def pin(self, paths):
+        """고정할 항목 설정 (이전 고정은 해제, 고정 항목은 제거 대상에서 제외)"""
+        with QMutexLocker(self._mutex):
+            self._pinned = set(paths)
+
+    def _evict_if_needed(self):
+        """제한 초과 시 가장 오래 사용하지 않은 항목부터 제거 (고정 항목 제외)"""
+        while len(self._cache) > self._max_items or self._current_memory > self._max_memory_bytes:
+            victim = next((path for path in self._cache if path not in self._pinned), None)
+            if victim is None:
+                break
+            _, nbytes = self._cache.pop(victim)
+            self._current_memory -= nbytes
+            self._evictions += 1
+
+    def set_limits(self, max_items: Optional[int] = None, max_memory_mb: Optional[int] = None):
+        """항목 수/메모리 제한 변경 (None이면 유지)"""
+        with QMutexLocker(self._mutex):
+            if max_items is not None:
+                self._max_items = max_items
+            if max_memory_mb is not None:
+                self._max_memory_bytes = max_memory_mb * 1024 * 1024
+            self._evict_if_needed()
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        with QMutexLocker(self._mutex):
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'items': len(self._cache),
+                'pinned': len(self._pinned),
+                'bytes': self._current_memory,
+                'max_items': self._max_items,
+                'max_bytes': self._max_memory_bytes,
+            }
+
+    def clear(self):
+        with QMutexLocker(self._mutex):
+            self._cache.clear()
+            self._pinned.clear()
+            self._current_memory = 0
+
+
+class ImageCache:
+    """디코딩된 이미지 캐시 (바이트 예산 기반 LRU)
+
+    (경로, 파일 크기, 수정 시각)을 키로 사용하므로 파일이 변경되면
+    기존 항목은 무효화된다. 화면 크기로 축소 디코딩된 이미지와 원본 해상도
+    이미지를 모두 담을 수 있으며, 항목마다 원본 크기를 함께 저장한다.
+    """
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256MB
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._cache = OrderedDict()  # {path: (key, pixmap, nbytes, original_size)}
+        self._max_bytes = max_bytes
+        self._current_memory = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._mutex = QMutex()
+
+    @staticmethod
+    def _make_key(path: str) -> Optional[Tuple[str, int, int]]:
+        """캐시 키 생성 (path, size, mtime)"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (path, stat.st_size, stat.st_mtime_ns)
+
+    def get(self, path: str) -> Optional[Tuple[QPixmap, QSize]]:
+        """(pixmap, 원본 크기) 반환 (없으면 None)"""
+        key = self._make_key(path)
+        with QMutexLocker(self._mutex):
+            entry = self._lookup(path, key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._cache.move_to_end(path)
+            return entry[1], entry[3]
+
+    def contains(self, path: str) -> bool:
+        """캐시 적중 여부 (통계/LRU 순서에 영향 없음)"""
+        key = self._make_key(path)
+        with QMutexLocker(self._mutex):
+            return self._lookup(path, key) is not None
+
+    def put(self, path: str, pixmap: QPixmap, original_size: Optional[QSize] = None):
+        key = self._make_key(path)
+        if key is None:
+            return
+
+        nbytes = _pixmap_nbytes(pixmap)
+        with QMutexLocker(self._mutex):
+            # 이미 더 큰 해상도가 캐시되어 있으면 유지
+            entry = self._lookup(path, key)
+            if entry is not None and entry[1].width() > pixmap.width():
+                return
+            self._remove(path)
+
+            # 예산보다 큰 이미지는 캐시하지 않음
+            if nbytes > self._max_bytes:
+                return
+
+            self._cache[path] = (key, pixmap, nbytes, original_size or pixmap.size())
+            self._current_memory += nbytes
+            self._evict_if_needed()
+
+    def _lookup(self, path: str, key: Optional[Tuple[str, int, int]]):
+        """유효한 항목 조회 (파일이 변경되었으면 제거)"""
+        entry = self._cache.get(path)
+        if entry is None:
+            return None
+        if entry[0] != key:
+            self._remove(path)
+            return None
+        return entry
+
+    def _remove(self, path: str):
+        entry = self._cache.pop(path, None)
+        if entry is not None:
+            self._current_memory -= entry[2]
 
     def _evict_if_needed(self):
         """캐시 정리 (LRU)"""
-        while (len(self._cache) >= self._max_items or
-               self._current_memory >= self._max_memory_bytes) and self._cache:
-            # 가장 오래된 항목 찾기
-            oldest_path = min(self._cache.keys(),
-                            key=lambda k: self._cache[k][1])
-            old_pixmap, _ = self._cache.pop(oldest_path)
-            self._current_memory -= self._estimate_pixmap_memory(old_pixmap)
+        while self._current_memory > self._max_bytes and self._cache:
+            _, (_, _, nbytes, _) = self._cache.popitem(last=False)
+            self._current_memory -= nbytes
+            self._evictions += 1
+
+    def set_max_bytes(self, max_bytes: int):
+        """메모리 예산 변경"""
+        with QMutexLocker(self._mutex):
+            self._max_bytes = max_bytes
+            self._evict_if_needed()
+
+    def stats(self) -> dict:
+        """캐시 통계"""
+        with QMutexLocker(self._mutex):
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'items': len(self._cache),
+                'bytes': self._current_memory,
+                'max_bytes': self._max_bytes,
+            }
 
     def clear(self):
         with QMutexLocker(self._mutex):
             self._cache.clear()
             self._current_memory = 0
-            self._access_order = 0
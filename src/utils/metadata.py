@@ -0,0 +1,102 @@
+"""
+이미지 메타데이터 - 크기/방향/포맷/촬영 일시를 한 번만 읽어 캐시
+"""
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from PIL import Image, ExifTags
+from PySide6.QtCore import QMutex, QMutexLocker
+
+
+@dataclass
+class ImageMetadata:
+    """이미지 메타데이터 (크기는 EXIF 회전 반영)"""
+    file_path: str
+    file_size: int
+    mtime_ns: int
+    width: int
+    height: int
+    orientation: int = 1
+    format: str = ""
+    date_taken: Optional[str] = None  # EXIF 촬영 일시 ('YYYY:MM:DD HH:MM:SS')
+
+    @staticmethod
+    def from_image(file_path: str, img: Image.Image, orientation: int,
+                   width: int, height: int) -> Optional['ImageMetadata']:
+        """열려 있는 이미지 헤더에서 메타데이터 생성 (픽셀 디코딩 없음)
+
+        Args:
+            file_path: 파일 경로
+            img: Image.open으로 연 이미지 (축소/회전 전)
+            orientation: EXIF 방향 값
+            width, height: 회전 반영된 원본 크기
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        date_taken = None
+        try:
+            exif = img.getexif()
+            if exif:
+                date_taken = (exif.get_ifd(ExifTags.IFD.Exif).get(ExifTags.Base.DateTimeOriginal)
+                              or exif.get(ExifTags.Base.DateTime))
+        except Exception:
+            pass
+
+        return ImageMetadata(
+            file_path=file_path,
+            file_size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            width=width,
+            height=height,
+            orientation=orientation,
+            format=img.format or "",
+            date_taken=str(date_taken).strip('\x00 ') if date_taken else None,
+        )
+
+
+class MetadataCache:
+    """메타데이터 캐시 (LRU)
+
+    파일 크기나 수정 시각이 바뀌면 기존 항목은 무효화된다.
+    디코딩 워커와 GUI 스레드가 함께 사용한다.
+    """
+
+    DEFAULT_MAX_ITEMS = 10000
+
+    def __init__(self, max_items: int = DEFAULT_MAX_ITEMS):
+        self._cache = OrderedDict()  # {path: ImageMetadata}
+        self._max_items = max_items
+        self._mutex = QMutex()
+
+    def get(self, path: str) -> Optional[ImageMetadata]:
+        """유효한 메타데이터 반환 (없거나 파일이 변경되었으면 None)"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        with QMutexLocker(self._mutex):
+            metadata = self._cache.get(path)
+            if metadata is None:
+                return None
+            if (metadata.file_size, metadata.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+                del self._cache[path]
+                return None
+            self._cache.move_to_end(path)
+            return metadata
+
+    def put(self, metadata: ImageMetadata):
+        with QMutexLocker(self._mutex):
+            self._cache[metadata.file_path] = metadata
+            self._cache.move_to_end(metadata.file_path)
+            while len(self._cache) > self._max_items:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        with QMutexLocker(self._mutex):
+            self._cache.clear()
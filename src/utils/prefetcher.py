@@ -0,0 +1,148 @@
+"""
+이미지 프리페처 - 현재 이미지 앞뒤 파일을 백그라운드에서 미리 디코딩
+"""
+import os
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal, QThreadPool, QSize
+from PySide6.QtGui import QImage, QPixmap
+
+from .image_loader import ImageLoader, ImageLoadWorker, ImageCache
+
+
+class ImagePrefetcher(QObject):
+    """이웃 이미지 프리페치 엔진
+
+    현재 인덱스를 기준으로 진행 방향 앞쪽 AHEAD개, 뒤쪽 BEHIND개 파일을
+    백그라운드에서 디코딩해 공유 ImageCache에 넣어 두고, 탐색 시 즉시
+    꺼내 쓸 수 있게 한다. 창 밖으로 벗어난 작업은 취소하고 결과도 버린다.
+    디코딩에 실패했거나 타일 모드 대상인 파일은 수정되기 전까지 다시 요청하지 않는다.
+    """
+
+    image_ready = Signal(str, QPixmap, QSize)  # file_path, pixmap, original_size
+
+    AHEAD = 2        # 진행 방향 프리페치 개수
+    BEHIND = 1       # 반대 방향 프리페치 개수
+    MAX_THREADS = 2  # 프리페치 전용 스레드 수
+
+    def __init__(self, cache: ImageCache, parent=None,
+                 ahead: int = AHEAD, behind: int = BEHIND):
+        super().__init__(parent)
+        self._cache = cache
+        self._files: List[str] = []
+        self._ahead = ahead
+        self._behind = behind
+        self._window: List[str] = []
+        self._max_size: Optional[Tuple[int, int]] = None
+        self._pending_workers: Dict[str, ImageLoadWorker] = {}
+        self._skipped: Dict[str, Optional[int]] = {}  # {경로: 기록 시 수정 시각} - 실패/타일 모드 대상
+
+        # 썸네일 로딩과 경쟁하지 않도록 전용 스레드 풀 사용
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(self.MAX_THREADS)
+
+    def set_files(self, files: List[str]):
+        """파일 목록 설정 (목록에서 빠진 파일의 작업만 취소)
+
+        새 파일 추가나 폴더 스캔으로 목록만 바뀐 경우 진행 중인 디코딩은 그대로
+        이어 간다. 호출자는 현재 파일이 프리페치 중이면 직접 로드하지 않으므로
+        (is_pending) 여기서 취소하면 현재 이미지가 표시되지 않는다.
+        """
+        remaining = set(files)
+        for path in list(self._pending_workers):
+            if path not in remaining:
+                self._pending_workers.pop(path).cancel()
+        self._window = [path for path in self._window if path in remaining]
+        self._files = files
+
+    def set_max_size(self, max_size: Optional[Tuple[int, int]]):
+        """디코딩 최대 크기 설정 (None이면 원본 해상도)"""
+        self._max_size = max_size
+
+    def is_pending(self, file_path: str) -> bool:
+        """해당 파일을 디코딩 중인지 여부"""
+        return file_path in self._pending_workers
+
+    def update(self, index: int, direction: int = 1):
+        """현재 인덱스/진행 방향에 맞춰 프리페치 창 갱신
+
+        Args:
+            index: 현재 파일 인덱스
+            direction: 진행 방향 (1: 다음, -1: 이전, 0은 다음으로 취급)
+        """
+        if not (0 <= index < len(self._files)):
+            return
+
+        step = -1 if direction < 0 else 1
+        window = self._compute_window(index, step)
+        self._window = window
+        wanted = set(window)
+
+        # 창 밖으로 벗어난 작업 취소
+        for path in list(self._pending_workers):
+            if path not in wanted:
+                self._pending_workers.pop(path).cancel()
+
+        # 가까운 파일부터 높은 우선순위로 시작 (현재 파일은 호출자가 직접 로드)
+        for order, path in enumerate(window[1:]):
+            if path in self._pending_workers or self._cache.contains(path):
+                continue
+            if not ImageLoader.is_supported_image(path):
+                continue
+            if path in self._skipped:
+                if self._skipped[path] == self._mtime(path):
+                    continue
+                del self._skipped[path]  # 수정된 파일은 다시 시도
+
+            # 초대형 이미지는 표시할 때 타일 피라미드로 로드 (헤더 확인은 워커에서)
+            worker = ImageLoadWorker(path, self._max_size, skip_tiled=True)
+            worker.signals.finished.connect(self._on_image_loaded)
+            worker.signals.error.connect(self._on_image_error)
+            worker.signals.skipped.connect(self._on_image_skipped)
+            self._pending_workers[path] = worker
+            self._thread_pool.start(worker, len(window) - order)
+
+    def _compute_window(self, index: int, step: int) -> List[str]:
+        """프리페치 대상 경로 목록 (현재 파일 → 가까운 순)"""
+        indices = [index]
+        for distance in range(1, max(self._ahead, self._behind) + 1):
+            if distance <= self._ahead:
+                indices.append(index + distance * step)
+            if distance <= self._behind:
+                indices.append(index - distance * step)
+        return [self._files[i] for i in indices if 0 <= i < len(self._files)]
+
+    def _on_image_loaded(self, file_path: str, image: QImage, original_size: QSize):
+        """프리페치 완료 (GUI 스레드에서 QPixmap 변환)"""
+        worker = self._pending_workers.pop(file_path, None)
+        if worker is None or worker.is_cancelled:
+            return
+
+        if file_path in self._window:
+            pixmap = QPixmap.fromImage(image)
+            self._cache.put(file_path, pixmap, original_size)
+            self.image_ready.emit(file_path, pixmap, original_size)
+
+    def _on_image_error(self, file_path: str, error: str):
+        """프리페치 실패 (파일이 바뀌기 전까지 다시 시도하지 않음)"""
+        if self._pending_workers.pop(file_path, None) is not None:
+            self._skipped[file_path] = self._mtime(file_path)
+
+    def _on_image_skipped(self, file_path: str):
+        """타일 모드 대상 (프리페치하지 않음)"""
+        if self._pending_workers.pop(file_path, None) is not None:
+            self._skipped[file_path] = self._mtime(file_path)
+
+    @staticmethod
+    def _mtime(file_path: str) -> Optional[int]:
+        try:
+            return os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def clear(self):
+        """모든 프리페치 작업 취소"""
+        for worker in self._pending_workers.values():
+            worker.cancel()
+        self._pending_workers.clear()
+        self._window = []
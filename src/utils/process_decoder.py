@@ -0,0 +1,193 @@
+"""
+프로세스 디코더 - 별도 프로세스에서 디코딩해 GIL 경합 없이 썸네일/이미지 로드
+
+환경 변수 LIGHTWEIGHT_VIEWER_PROCESS_DECODE=1 로 켠다 (기본은 스레드 디코딩).
+"""
+import os
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from PySide6.QtCore import QMutex, QMutexLocker, QSize
+from PySide6.QtGui import QImage
+
+from .image_loader import ImageLoader, _metadata_cache
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+PROCESS_DECODE_ENV = 'LIGHTWEIGHT_VIEWER_PROCESS_DECODE'
+
+# 디코딩 종류
+DECODE_THUMBNAIL = 'thumbnail'  # 내장 썸네일 우선, 없으면 축소 디코딩
+DECODE_PREVIEW = 'preview'      # max_size 이하로 축소 (None이면 원본)
+
+
+def _warm_up() -> int:
+    """워커 프로세스를 미리 띄우기 위한 빈 작업 (모듈 import는 이미 끝난 상태)"""
+    return os.getpid()
+
+
+def _decode_into_shared_memory(kind: str, file_path: str, max_size: Optional[Tuple[int, int]],
+                               shm_name: str, capacity: int):
+    """워커 프로세스에서 디코딩 후 픽셀을 공유 메모리에 기록
+
+    Returns:
+        (width, height, has_alpha, metadata) 또는 실패 시 None
+        (메타데이터는 썸네일을 내장 썸네일로 읽은 경우 None일 수 있음)
+    """
+    from multiprocessing import shared_memory
+
+    metadata = None
+    if kind == DECODE_THUMBNAIL:
+        img = ImageLoader._decode_embedded_thumbnail(file_path, max_size)
+        if img is None:
+            img, metadata = ImageLoader._decode_preview(file_path, max_size)
+        else:
+            metadata = _metadata_cache.get(file_path)
+    else:
+        img, metadata = ImageLoader._decode_preview(file_path, max_size)
+
+    img, has_alpha = ImageLoader._to_qimage_mode(img)
+    bytes_per_line = img.width * 4
+    if bytes_per_line * img.height > capacity:
+        return None
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        ImageLoader._paste_into_buffer(img, has_alpha, shm.buf, bytes_per_line)
+    finally:
+        shm.close()
+    return img.width, img.height, has_alpha, metadata
+
+
+class ProcessDecoder:
+    """프로세스 풀 디코딩 백엔드
+
+    HEIC 디코딩, EXIF 처리, thumbnail() 리샘플링처럼 GIL을 오래 잡는 작업을
+    워커 프로세스로 옮긴다. 픽셀은 pickle 대신 공유 메모리로 돌려받는다.
+    호출 스레드(QRunnable 워커)는 결과를 기다리는 동안 GIL을 놓으므로
+    기존 워커 구조를 그대로 쓴다. 풀은 첫 사용 시 생성하며 모든 워커
+    프로세스를 미리 띄워 둔다. 풀이 깨지면 스레드 디코딩으로 되돌아간다.
+    """
+
+    _executor: Optional['ProcessPoolExecutor'] = None
+    _mutex = QMutex()
+    _disabled = False
+    _FALLBACK = object()  # 프로세스 풀을 쓸 수 없음 - 스레드 디코딩으로 대체
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """환경 변수로 켜져 있고 풀이 정상인지 여부"""
+        if ProcessDecoder._disabled:
+            return False
+        return os.environ.get(PROCESS_DECODE_ENV, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+    @staticmethod
+    def max_workers() -> int:
+        """워커 프로세스 수 (CPU 코어 수)"""
+        return max(1, os.cpu_count() or 1)
+
+    @staticmethod
+    def _get_executor() -> 'ProcessPoolExecutor':
+        # 기본(스레드 디코딩)일 때 시작 시간에 영향이 없도록 사용할 때 import
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import get_context
+
+        with QMutexLocker(ProcessDecoder._mutex):
+            if ProcessDecoder._executor is None:
+                # Qt 스레드가 있는 프로세스를 fork하지 않도록 모든 플랫폼에서 spawn 사용
+                executor = ProcessPoolExecutor(max_workers=ProcessDecoder.max_workers(),
+                                               mp_context=get_context('spawn'))
+                for _ in range(ProcessDecoder.max_workers()):
+                    executor.submit(_warm_up)
+                ProcessDecoder._executor = executor
+            return ProcessDecoder._executor
+
+    @staticmethod
+    def load_thumbnail(file_path: str, size: Tuple[int, int]) -> Optional[QImage]:
+        """썸네일 로드 (ImageLoader.load_embedded_thumbnail → load_qimage와 동일한 결과)"""
+        result = ProcessDecoder._decode(DECODE_THUMBNAIL, file_path, size, size[0] * size[1] * 4)
+        if result is ProcessDecoder._FALLBACK:
+            image = ImageLoader.load_embedded_thumbnail(file_path, size)
+            return image if image is not None else ImageLoader.load_qimage(file_path, max_size=size)
+        return result[0] if result else None
+
+    @staticmethod
+    def load_preview(file_path: str,
+                     max_size: Optional[Tuple[int, int]] = None) -> Optional[Tuple[QImage, QSize]]:
+        """ImageLoader.load_preview와 동일 (max_size가 None이면 원본 해상도)"""
+        metadata = ImageLoader.get_metadata(file_path)
+        if metadata is None:
+            return None
+        capacity = metadata.width * metadata.height
+        if max_size:
+            capacity = min(capacity, max_size[0] * max_size[1])
+
+        result = ProcessDecoder._decode(DECODE_PREVIEW, file_path, max_size, capacity * 4)
+        if result is ProcessDecoder._FALLBACK:
+            return ImageLoader.load_preview(file_path, max_size)
+        if not result:
+            return None
+        return result[0], QSize(metadata.width, metadata.height)
+
+    @staticmethod
+    def _decode(kind: str, file_path: str, max_size: Optional[Tuple[int, int]], capacity: int):
+        """워커 프로세스에 디코딩을 맡기고 공유 메모리에서 QImage로 복사
+
+        Returns:
+            (QImage, metadata), 디코딩 실패 시 None, 풀 사용 불가 시 _FALLBACK
+        """
+        try:
+            executor = ProcessDecoder._get_executor()
+        except Exception as e:
+            print(f"프로세스 디코더 시작 실패: {e}")
+            ProcessDecoder._disabled = True
+            return ProcessDecoder._FALLBACK
+
+        from concurrent.futures.process import BrokenProcessPool
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(create=True, size=max(1, capacity))
+        try:
+            try:
+                result = executor.submit(_decode_into_shared_memory, kind, file_path, max_size,
+                                         shm.name, shm.size).result()
+            except BrokenProcessPool as e:
+                print(f"프로세스 디코더 중단, 스레드 디코딩으로 전환: {e}")
+                ProcessDecoder._disabled = True
+                return ProcessDecoder._FALLBACK
+            except Exception as e:
+                print(f"이미지 로드 실패: {file_path} - {e}")
+                return None
+
+            if result is None:
+                return ProcessDecoder._FALLBACK  # 예상 크기 초과
+
+            width, height, has_alpha, metadata = result
+            if metadata is not None:
+                _metadata_cache.put(metadata)
+
+            qimage = QImage(width, height, ImageLoader._qimage_format(has_alpha))
+            if qimage.isNull():
+                return None
+            bits = qimage.bits()
+            bytes_per_line = qimage.bytesPerLine()
+            row = width * 4
+            if bytes_per_line == row:
+                bits[:row * height] = shm.buf[:row * height]
+            else:
+                for y in range(height):
+                    bits[y * bytes_per_line:y * bytes_per_line + row] = shm.buf[y * row:(y + 1) * row]
+            del bits
+            return qimage, metadata
+        finally:
+            shm.close()
+            shm.unlink()
+
+    @staticmethod
+    def shutdown():
+        """워커 프로세스 종료 (대기 중인 작업 취소)"""
+        with QMutexLocker(ProcessDecoder._mutex):
+            executor = ProcessDecoder._executor
+            ProcessDecoder._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,123 @@
+"""
+단일 인스턴스 - 이미 실행 중인 뷰어에 파일 경로를 넘겨 새 프로세스 시작 비용을 없앰
+
+명령줄 옵션 --single-instance 또는 환경 변수 LIGHTWEIGHT_VIEWER_SINGLE_INSTANCE=1 로 켠다.
+main.py가 GUI 초기화 전에 확인하므로 모듈 수준에서 Qt를 import하지 않는다
+(QtNetwork는 이 모드를 켰을 때만 로드).
+"""
+import os
+from typing import Callable, List, Optional
+
+SINGLE_INSTANCE_ENV = 'LIGHTWEIGHT_VIEWER_SINGLE_INSTANCE'
+SINGLE_INSTANCE_FLAG = '--single-instance'
+
+
+class SingleInstance:
+    """실행 중인 인스턴스 찾기/파일 전달 (새로 실행된 쪽에서 사용)
+
+    메시지는 UTF-8 파일 경로 한 줄 (빈 줄이면 창만 앞으로 가져옴).
+    """
+
+    CONNECT_TIMEOUT_MS = 200  # 실행 중인 인스턴스 연결 대기 (없으면 즉시 실패)
+    WRITE_TIMEOUT_MS = 1000
+
+    @staticmethod
+    def is_enabled(argv: List[str]) -> bool:
+        """명령줄 옵션 또는 환경 변수로 켜져 있는지 여부"""
+        if SINGLE_INSTANCE_FLAG in argv:
+            return True
+        return os.environ.get(SINGLE_INSTANCE_ENV, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+    @staticmethod
+    def server_name() -> str:
+        """로컬 서버 이름 (사용자별로 구분)"""
+        user = os.environ.get('USERNAME') or os.environ.get('USER') or 'default'
+        return f"LightweightViewer-{user}"
+
+    @staticmethod
+    def forward(file_path: Optional[str]) -> bool:
+        """실행 중인 인스턴스에 파일 경로 전달
+
+        QApplication 없이 호출 가능하다 (GUI 초기화 전에 확인하고 종료하기 위함).
+
+        Returns:
+            전달했으면 True, 실행 중인 인스턴스가 없으면 False
+        """
+        from PySide6.QtNetwork import QLocalSocket
+
+        socket = QLocalSocket()
+        socket.connectToServer(SingleInstance.server_name())
+        if not socket.waitForConnected(SingleInstance.CONNECT_TIMEOUT_MS):
+            return False
+
+        # 작업 디렉터리가 다를 수 있으므로 절대 경로로 전달
+        message = os.path.abspath(file_path) if file_path else ''
+        socket.write((message + '\n').encode('utf-8'))
+        written = socket.waitForBytesWritten(SingleInstance.WRITE_TIMEOUT_MS)
+        socket.disconnectFromServer()
+        if socket.state() != QLocalSocket.LocalSocketState.UnconnectedState:
+            socket.waitForDisconnected(SingleInstance.WRITE_TIMEOUT_MS)
+        return written
+
+
+class SingleInstanceServer:
+    """다른 실행에서 넘어온 파일 경로 수신 (실행 중인 인스턴스에서 사용)
+
+    Args:
+        on_file_requested: 경로를 받을 때마다 GUI 스레드에서 호출
+            (절대 경로, 빈 문자열이면 창만 활성화)
+        parent: 서버 소켓의 부모 QObject (보통 메인 윈도우)
+    """
+
+    def __init__(self, on_file_requested: Callable[[str], None], parent=None):
+        from PySide6.QtNetwork import QLocalServer
+
+        self._on_file_requested = on_file_requested
+        self._server = QLocalServer(parent)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._buffers = {}  # {QLocalSocket: bytes} - 줄 단위로 모을 때까지 보관
+
+    def listen(self) -> bool:
+        """서버 시작 (이미 다른 인스턴스가 서버를 열었으면 False)"""
+        from PySide6.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+        name = SingleInstance.server_name()
+        if self._server.listen(name):
+            return True
+
+        # 비정상 종료로 남은 소켓 파일이면 지우고 다시 시도 (살아 있는 서버는 연결로 확인)
+        if self._server.serverError() == QAbstractSocket.SocketError.AddressInUseError:
+            probe = QLocalSocket()
+            probe.connectToServer(name)
+            if probe.waitForConnected(SingleInstance.CONNECT_TIMEOUT_MS):
+                probe.disconnectFromServer()
+                return False
+            QLocalServer.removeServer(name)
+            if self._server.listen(name):
+                return True
+
+        print(f"단일 인스턴스 서버 시작 실패: {self._server.errorString()}")
+        return False
+
+    def close(self):
+        self._server.close()
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            self._buffers[socket] = b''
+            socket.readyRead.connect(lambda s=socket: self._on_ready_read(s))
+            socket.disconnected.connect(lambda s=socket: self._on_disconnected(s))
+
+    def _on_ready_read(self, socket):
+        buffer = self._buffers.get(socket, b'') + bytes(socket.readAll())
+        *lines, rest = buffer.split(b'\n')
+        self._buffers[socket] = rest
+        for line in lines:
+            self._on_file_requested(line.decode('utf-8', errors='replace'))
+
+    def _on_disconnected(self, socket):
+        if socket.bytesAvailable():
+            self._on_ready_read(socket)
+        self._buffers.pop(socket, None)
+        socket.deleteLater()
@@ -0,0 +1,89 @@
+"""
+시작 디코더 - Qt 초기화와 동시에 명령줄로 받은 이미지를 읽고 디코딩
+
+main.py가 PySide6 import 전에 시작하므로 모듈 수준에서 Qt를 import하지 않는다.
+"""
+import os
+import threading
+from typing import Optional, Tuple
+
+# 미리 읽어 OS 캐시에 올릴 최대 크기 (초대형 이미지는 앞부분만)
+WARM_UP_LIMIT = 64 * 1024 * 1024
+WARM_UP_CHUNK = 1024 * 1024
+
+
+class StartupDecoder:
+    """명령줄 이미지 선행 디코딩 (앱 시작 시 한 번만 사용)
+
+    1. start() 직후: 파일을 읽어 OS 캐시에 올리고 PIL(HEIC이면 pillow-heif)을 import
+    2. set_max_size() 후: 화면 크기로 축소 디코딩 (QApplication 생성 직후 호출)
+    3. MainWindow의 이미지 로딩 워커가 result()로 결과를 받음 (끝나지 않았으면 대기)
+
+    파일 읽기와 디코딩은 GIL을 놓으므로 GUI 스레드의 Qt/테마/창 초기화와 겹쳐 실행된다.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._max_size: Optional[Tuple[int, int]] = None
+        self._result = None  # (QImage, QSize) 또는 None
+        self._cancelled = False
+        self._size_ready = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='StartupDecoder', daemon=True)
+
+    @property
+    def max_size(self) -> Optional[Tuple[int, int]]:
+        return self._max_size
+
+    def start(self):
+        self._thread.start()
+
+    def set_max_size(self, max_size: Tuple[int, int]):
+        """디코딩 크기 지정 (이후 디코딩 시작)"""
+        self._max_size = max_size
+        self._size_ready.set()
+
+    def cancel(self):
+        """결과를 쓰지 않음 (디코딩 전이면 시작하지 않음)"""
+        self._cancelled = True
+        self._size_ready.set()
+
+    def result(self):
+        """디코딩 결과 (QImage, 원본 QSize) - 끝날 때까지 대기, 실패/취소 시 None"""
+        self._done.wait()
+        return None if self._cancelled else self._result
+
+    def _run(self):
+        try:
+            self._warm_up()
+            self._size_ready.wait()
+            if self._cancelled or self._max_size is None:
+                return
+
+            # GUI 스레드가 이미 import한 모듈이므로 여기서는 비용 없음
+            from .image_loader import ImageLoader
+            from .tiled_image import TiledImage
+            if not ImageLoader.is_supported_image(self.file_path) or TiledImage.should_tile(self.file_path):
+                return
+            self._result = ImageLoader.load_preview(self.file_path, self._max_size)
+        except Exception as e:
+            print(f"시작 디코딩 실패: {self.file_path} - {e}")
+        finally:
+            self._done.set()
+
+    def _warm_up(self):
+        """Qt 초기화 중에 디코딩 준비 (파일 읽기, 디코더 모듈 import)"""
+        try:
+            with open(self.file_path, 'rb') as f:
+                remaining = WARM_UP_LIMIT
+                while remaining > 0 and f.read(min(WARM_UP_CHUNK, remaining)):
+                    remaining -= WARM_UP_CHUNK
+        except OSError:
+            return
+
+        from PIL import Image  # noqa: F401
+        if os.path.splitext(self.file_path)[1].lower() in ('.heic', '.heif'):
+            try:
+                import pillow_heif  # noqa: F401
+            except ImportError:
+                pass
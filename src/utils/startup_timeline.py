@@ -0,0 +1,163 @@
+"""
+시작 타임라인 - 시작 단계별 시각을 기록해 표와 JSON으로 출력 (README 성능 목표 회귀 확인용)
+
+명령줄 옵션 --startup-timeline[=파일.json] 또는 환경 변수
+LIGHTWEIGHT_VIEWER_STARTUP_TIMELINE=1 (또는 JSON 파일 경로)로 켠다.
+main.py가 가장 먼저 import하므로 모듈 수준에서 Qt를 import하지 않는다.
+"""
+import json
+import os
+import sys
+import time
+from typing import List, Optional, Tuple
+
+STARTUP_TIMELINE_ENV = 'LIGHTWEIGHT_VIEWER_STARTUP_TIMELINE'
+STARTUP_TIMELINE_FLAG = '--startup-timeline'
+
+_TRUE_VALUES = ('1', 'true', 'yes', 'on')
+_FALSE_VALUES = ('', '0', 'false', 'no', 'off')
+
+
+def _process_uptime() -> Optional[float]:
+    """프로세스가 시작된 뒤 지난 시간 (초, 알 수 없으면 None)
+
+    인터프리터 시작 시간을 타임라인에 포함하기 위해 사용한다.
+    (PyInstaller onefile은 압축 해제 후 띄운 자식 프로세스 기준)
+    """
+    try:
+        if sys.platform.startswith('linux'):
+            with open('/proc/self/stat') as f:
+                # comm 필드에 공백이 있을 수 있으므로 마지막 ')' 뒤부터 분리 (starttime은 22번째 필드)
+                fields = f.read().rsplit(')', 1)[1].split()
+            start_ticks = int(fields[19])
+            with open('/proc/uptime') as f:
+                uptime = float(f.read().split()[0])
+            return uptime - start_ticks / os.sysconf('SC_CLK_TCK')
+
+        if os.name == 'nt':
+            import ctypes
+            from ctypes import wintypes
+
+            creation, exit_time, kernel, user = (wintypes.FILETIME() for _ in range(4))
+            now = wintypes.FILETIME()
+            kernel32 = ctypes.windll.kernel32
+            if not kernel32.GetProcessTimes(kernel32.GetCurrentProcess(), ctypes.byref(creation),
+                                            ctypes.byref(exit_time), ctypes.byref(kernel),
+                                            ctypes.byref(user)):
+                return None
+            kernel32.GetSystemTimeAsFileTime(ctypes.byref(now))
+
+            def to_int(filetime):
+                return (filetime.dwHighDateTime << 32) | filetime.dwLowDateTime
+
+            return (to_int(now) - to_int(creation)) / 1e7  # 100ns 단위
+    except Exception:
+        pass
+    return None
+
+
+class StartupTimeline:
+    """시작 단계 기록 (꺼져 있으면 mark/report는 아무 일도 하지 않음)
+
+    단계마다 처음 도달한 시각만 남긴다. 시각은 프로세스 시작 기준이며,
+    프로세스 시작 시각을 알 수 없으면 main.py 실행 시작 기준이다.
+    """
+
+    _enabled = False
+    _output_path: Optional[str] = None  # JSON 저장 경로 (None이면 표준 출력)
+    _origin = 0.0  # 기준 시각 (perf_counter)
+    _origin_kind = 'main'  # 'process' 또는 'main'
+    _marks: List[Tuple[str, float]] = []
+    _reported = False
+
+    @staticmethod
+    def enable_from(argv: List[str]) -> bool:
+        """명령줄 옵션/환경 변수를 확인해 켜고, 'interpreter' 단계를 기록
+
+        Returns:
+            켜졌으면 True
+        """
+        value = None
+        for arg in argv[1:]:
+            if arg == STARTUP_TIMELINE_FLAG:
+                value = '1'
+            elif arg.startswith(STARTUP_TIMELINE_FLAG + '='):
+                value = arg.split('=', 1)[1]
+        if value is None:
+            value = os.environ.get(STARTUP_TIMELINE_ENV, '')
+        value = value.strip()
+        if value.lower() in _FALSE_VALUES:
+            return False
+
+        now = time.perf_counter()
+        uptime = _process_uptime()
+        StartupTimeline._enabled = True
+        StartupTimeline._output_path = None if value.lower() in _TRUE_VALUES else value
+        if uptime is not None and uptime >= 0:
+            StartupTimeline._origin = now - uptime
+            StartupTimeline._origin_kind = 'process'
+        else:
+            StartupTimeline._origin = now
+        StartupTimeline.mark('interpreter')
+        return True
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return StartupTimeline._enabled
+
+    @staticmethod
+    def mark(name: str):
+        """단계 도달 기록 (이미 기록된 단계는 무시)"""
+        if not StartupTimeline._enabled or StartupTimeline._reported:
+            return
+        if any(mark_name == name for mark_name, _ in StartupTimeline._marks):
+            return
+        StartupTimeline._marks.append((name, time.perf_counter()))
+
+    @staticmethod
+    def phases() -> List[dict]:
+        """기록된 단계 목록 ({name, t_ms: 기준 시각부터, delta_ms: 이전 단계부터})"""
+        phases = []
+        previous = StartupTimeline._origin
+        for name, at in StartupTimeline._marks:
+            phases.append({
+                'name': name,
+                't_ms': round((at - StartupTimeline._origin) * 1000, 1),
+                'delta_ms': round((at - previous) * 1000, 1),
+            })
+            previous = at
+        return phases
+
+    @staticmethod
+    def report():
+        """요약 표와 JSON 출력 (한 번만, 이후 기록은 무시)"""
+        if not StartupTimeline._enabled or StartupTimeline._reported:
+            return
+        StartupTimeline._reported = True
+
+        phases = StartupTimeline.phases()
+        data = {
+            'origin': StartupTimeline._origin_kind,
+            'python': sys.version.split()[0],
+            'frozen': bool(getattr(sys, 'frozen', False)),
+            'phases': phases,
+            'total_ms': phases[-1]['t_ms'] if phases else 0.0,
+        }
+
+        lines = [f"[시작 타임라인] 기준: {'프로세스 시작' if data['origin'] == 'process' else 'main.py 시작'}",
+                 f"{'단계':<14}{'시각(ms)':>8}{'구간(ms)':>8}"]  # 한글은 두 칸 폭
+        for phase in phases:
+            lines.append(f"{phase['name']:<16}{phase['t_ms']:>10.1f}{phase['delta_ms']:>10.1f}")
+        print('\n'.join(lines))
+
+        text = json.dumps(data, ensure_ascii=False)
+        if StartupTimeline._output_path:
+            try:
+                with open(StartupTimeline._output_path, 'w', encoding='utf-8') as f:
+                    f.write(text + '\n')
+            except OSError as e:
+                print(f"시작 타임라인 저장 실패: {StartupTimeline._output_path} - {e}")
+        else:
+            print(text)
+        if sys.stdout is not None:  # 콘솔 없는 빌드에서는 None
+            sys.stdout.flush()
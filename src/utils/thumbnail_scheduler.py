@@ -0,0 +1,120 @@
+"""
+썸네일 스케줄러 - 화면 중심에서 바깥쪽 순서로 썸네일 디코딩 작업 배분
+"""
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal, QThread, QThreadPool
+from PySide6.QtGui import QImage
+
+from .image_loader import ThumbnailWorker
+from .process_decoder import ProcessDecoder
+
+
+class ThumbnailScheduler(QObject):
+    """뷰포트 기반 썸네일 작업 스케줄러
+
+    대기열은 스레드 풀이 아니라 여기서 관리한다. 스레드 수만큼만 워커를
+    실행하고, 스크롤할 때마다 대기열을 새 우선순위(화면 중심 → 바깥)로
+    교체하므로 지나간 항목의 작업은 시작되지 않는다. 이미 실행 중인 작업은
+    끝까지 수행해 결과를 캐시에 남긴다.
+    disk_cache(ThumbnailDiskCache)를 주면 워커가 디코딩 전후로 디스크 캐시를 읽고 쓴다.
+    """
+
+    thumbnail_ready = Signal(str, QImage)  # file_path, image
+    thumbnail_failed = Signal(str)  # file_path
+
+    MAX_QUEUE = 64  # 대기열 최대 길이 (초과분은 버림)
+    THROUGHPUT_SMOOTHING = 0.2  # 디코딩 시간 지수 이동 평균 가중치
+
+    def __init__(self, size: Tuple[int, int], parent=None, max_threads: int = 0, disk_cache=None):
+        super().__init__(parent)
+        self._size = size
+        self._disk_cache = disk_cache
+        self._queue: List[str] = []
+        self._running: Dict[str, ThumbnailWorker] = {}
+        self._started_at: Dict[str, float] = {}
+        self._avg_decode_time = 0.0  # 작업 1개당 평균 디코딩 시간 (초, 0이면 측정 전)
+
+        self._thread_pool = QThreadPool(self)
+        if not max_threads:
+            # 프로세스 디코딩 시에는 워커 프로세스 수만큼 동시에 요청
+            max_threads = (ProcessDecoder.max_workers() if ProcessDecoder.is_enabled()
+                           else max(2, QThread.idealThreadCount() // 2))
+        self._thread_pool.setMaxThreadCount(max_threads)
+
+    def is_pending(self, file_path: str) -> bool:
+        """대기 중이거나 실행 중인지 여부"""
+        return file_path in self._running or file_path in self._queue
+
+    def throughput(self) -> float:
+        """측정된 디코딩 처리량 (초당 썸네일 수, 측정 전이면 0)"""
+        if self._avg_decode_time <= 0:
+            return 0.0
+        return self._thread_pool.maxThreadCount() / self._avg_decode_time
+
+    def schedule(self, paths: Iterable[str]):
+        """대기열 교체 (앞쪽일수록 먼저 실행, 실행 중인 항목은 제외)"""
+        queue = []
+        seen = set()
+        for path in paths:
+            if path in self._running or path in seen:
+                continue
+            seen.add(path)
+            queue.append(path)
+            if len(queue) >= self.MAX_QUEUE:
+                break
+        self._queue = queue
+        self._start_next()
+
+    def _start_next(self):
+        """빈 스레드 수만큼 대기열 앞에서 작업 시작"""
+        while self._queue and len(self._running) < self._thread_pool.maxThreadCount():
+            path = self._queue.pop(0)
+            worker = ThumbnailWorker(path, size=self._size, disk_cache=self._disk_cache)
+            worker.signals.finished.connect(self._on_finished)
+            worker.signals.error.connect(self._on_error)
+            self._running[path] = worker
+            self._started_at[path] = time.perf_counter()
+            self._thread_pool.start(worker)
+
+    def _take_running(self, file_path: str) -> Optional[float]:
+        """신호를 보낸 워커가 이 경로의 현재 작업이면 목록에서 빼고 시작 시각 반환
+
+        clear() 후 같은 경로를 다시 요청하면 취소된 워커의 늦은 신호가 새 작업보다
+        먼저 도착할 수 있으므로 경로가 아니라 보낸 워커로 확인한다.
+        """
+        worker = self._running.get(file_path)
+        if worker is None or worker.signals is not self.sender():
+            return None
+        del self._running[file_path]
+        return self._started_at.pop(file_path)
+
+    def _on_finished(self, file_path: str, image: QImage):
+        started_at = self._take_running(file_path)
+        if started_at is not None:
+            elapsed = time.perf_counter() - started_at
+            if self._avg_decode_time <= 0:
+                self._avg_decode_time = elapsed
+            else:
+                self._avg_decode_time += self.THROUGHPUT_SMOOTHING * (elapsed - self._avg_decode_time)
+            self.thumbnail_ready.emit(file_path, image)
+        self._start_next()
+
+    def _on_error(self, file_path: str, error: str):
+        if self._take_running(file_path) is not None:
+            self.thumbnail_failed.emit(file_path)
+        self._start_next()
+
+    def clear(self):
+        """대기열 비우고 실행 중인 작업 결과 무시"""
+        self._queue = []
+        for worker in self._running.values():
+            worker.cancel()
+        self._running.clear()
+        self._started_at.clear()
+
+    def shutdown(self):
+        """모든 작업을 취소하고 실행 중인 워커가 끝날 때까지 대기 (종료 시)"""
+        self.clear()
+        self._thread_pool.waitForDone()
@@ -0,0 +1,204 @@
+"""
+썸네일 디스크 캐시 - SQLite 기반 영구 저장소 (사용자별 단일 파일)
+"""
+import os
+import sys
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+def get_cache_dir() -> str:
+    """사용자별 캐시 디렉토리 경로"""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'LightweightViewer')
+
+
+class ThumbnailDiskCache:
+    """썸네일 영구 캐시
+
+    (경로, 파일 크기, 수정 시각, 썸네일 크기)가 일치할 때만 적중한다.
+    WAL 모드와 busy timeout으로 여러 뷰어 인스턴스가 동시에 접근해도 안전하며,
+    전체 크기가 max_bytes를 넘으면 오래 사용하지 않은 항목부터 정리한다.
+    연결은 스레드마다 열고, 종료 시 close()로 한꺼번에 닫는다.
+    """
+
+    DB_NAME = 'thumbnails.db'
+    DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # 200MB
+    GC_INTERVAL = 200          # put 횟수마다 크기 점검
+    GC_TARGET_RATIO = 0.8      # 정리 시 목표 크기 (max_bytes 대비)
+    TOUCH_INTERVAL = 24 * 3600  # 마지막 접근 시각 갱신 주기 (초)
+    BUSY_TIMEOUT = 5.0
+
+    def __init__(self, db_path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._db_path = db_path or os.path.join(get_cache_dir(), self.DB_NAME)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # {스레드 ID: 연결} - Qt 스레드 풀 스레드는 작업마다 파이썬 스레드 상태가 새로 만들어져
+        # threading.local 값이 사라지므로 스레드 ID로 보관
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._puts_since_gc = 0
+        self._disabled = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """스레드별 연결 반환 (실패 시 캐시 비활성화)"""
+        if self._disabled:
+            return None
+
+        thread_id = threading.get_ident()
+        with self._lock:
+            conn = self._connections.get(thread_id)
+        if conn is not None:
+            return conn
+
+        try:
+            os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+            # 종료 시 GUI 스레드에서 닫을 수 있도록 스레드 검사 해제 (한 연결은 한 스레드 ID에서만 사용)
+            conn = sqlite3.connect(self._db_path, timeout=self.BUSY_TIMEOUT,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS thumbnails (
+                    path TEXT NOT NULL,
+                    thumb_size INTEGER NOT NULL,
+                    file_size INTEGER NOT NULL,
+                    mtime INTEGER NOT NULL,
+                    last_access INTEGER NOT NULL,
+                    data BLOB NOT NULL,
+                    PRIMARY KEY (path, thumb_size)
+                )
+            """)
+            conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_thumbnails_access ON thumbnails (last_access)'
+            )
+        except (sqlite3.Error, OSError) as e:
+            print(f"썸네일 캐시 사용 불가: {self._db_path} - {e}")
+            self._disabled = True
+            return None
+
+        with self._lock:
+            if self._disabled:  # 연결하는 사이 close()가 호출됨
+                conn.close()
+                return None
+            self._connections[thread_id] = conn
+        return conn
+
+    @staticmethod
+    def _file_signature(path: str):
+        """(파일 크기, 수정 시각) - 파일이 없으면 None"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def get(self, path: str, thumb_size: int) -> Optional[bytes]:
+        """캐시된 썸네일 데이터(인코딩된 이미지 바이트) 반환"""
+        signature = self._file_signature(path)
+        conn = self._connect()
+        if signature is None or conn is None:
+            return None
+
+        try:
+            row = conn.execute(
+                'SELECT file_size, mtime, last_access, data FROM thumbnails '
+                'WHERE path = ? AND thumb_size = ?',
+                (path, thumb_size)
+            ).fetchone()
+            if row is None or (row[0], row[1]) != signature:
+                return None
+
+            # 접근 시각은 가끔만 갱신 (읽기마다 쓰기 방지)
+            now = int(time.time())
+            if now - row[2] > self.TOUCH_INTERVAL:
+                conn.execute(
+                    'UPDATE thumbnails SET last_access = ? WHERE path = ? AND thumb_size = ?',
+                    (now, path, thumb_size)
+                )
+            return row[3]
+        except sqlite3.Error:
+            return None
+
+    def put(self, path: str, thumb_size: int, data: bytes):
+        """썸네일 데이터 저장"""
+        signature = self._file_signature(path)
+        conn = self._connect()
+        if signature is None or conn is None or not data:
+            return
+
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO thumbnails '
+                '(path, thumb_size, file_size, mtime, last_access, data) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (path, thumb_size, signature[0], signature[1], int(time.time()), data)
+            )
+        except sqlite3.Error:
+            return
+
+        with self._lock:
+            self._puts_since_gc += 1
+            run_gc = self._puts_since_gc >= self.GC_INTERVAL
+            if run_gc:
+                self._puts_since_gc = 0
+        if run_gc:
+            self.collect_garbage()
+
+    def collect_garbage(self):
+        """크기 제한 초과 시 오래 사용하지 않은 항목부터 삭제"""
+        conn = self._connect()
+        if conn is None:
+            return
+
+        try:
+            total = conn.execute(
+                'SELECT COALESCE(SUM(LENGTH(data)), 0) FROM thumbnails'
+            ).fetchone()[0]
+            if total <= self._max_bytes:
+                return
+
+            excess = total - int(self._max_bytes * self.GC_TARGET_RATIO)
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                rows = conn.execute(
+                    'SELECT rowid, LENGTH(data) FROM thumbnails ORDER BY last_access'
+                )
+                victims = []
+                for rowid, size in rows:
+                    if excess <= 0:
+                        break
+                    victims.append((rowid,))
+                    excess -= size
+                conn.executemany('DELETE FROM thumbnails WHERE rowid = ?', victims)
+                conn.execute('COMMIT')
+            except sqlite3.Error:
+                conn.execute('ROLLBACK')
+                raise
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        """모든 스레드의 연결을 닫고 캐시 비활성화 (캐시를 쓰는 워커가 끝난 뒤 호출)"""
+        with self._lock:
+            self._disabled = True
+            connections, self._connections = self._connections, {}
+        for conn in connections.values():
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def clear(self):
+        """모든 항목 삭제"""
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            conn.execute('DELETE FROM thumbnails')
+        except sqlite3.Error:
+            pass
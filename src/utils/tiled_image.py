@@ -0,0 +1,535 @@
+"""
+타일 이미지 - 초대형 이미지를 타일 피라미드로 나눠 보이는 부분만 로드
+"""
+import os
+import json
+import shutil
+import hashlib
+import math
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import PIL
+from PIL import Image
+from PySide6.QtCore import QObject, Signal, QRunnable, QThreadPool, QSize
+from PySide6.QtGui import QImage, QPixmap
+
+from .image_loader import ImageLoader, _pixmap_nbytes
+from .thumbnail_store import get_cache_dir
+
+TILE_SIZE = 512
+PREVIEW_MAX = 2048          # 미리보기(밑그림) 최대 크기
+MANIFEST_NAME = 'manifest.json'
+PREVIEW_NAME = 'preview'
+MAX_CACHED_PYRAMIDS = 5     # 디스크에 보관할 피라미드 수
+
+# 타일 모드 전환 기준 (픽셀 수 또는 한 변 길이)
+TILED_MIN_PIXELS = 100_000_000
+TILED_MIN_SIDE = 16384
+
+# 행 단위로 나눌 수 없는 포맷(PNG, JPEG, 압축 TIFF 등)을 한 번에 디코딩할 최대 픽셀 수
+# (RGBA 약 600MB, Pillow 기본 압축 폭탄 제한 이하) - 넘으면 축소 디코딩하거나 생성 실패
+FULL_DECODE_MAX_PIXELS = 150_000_000
+MAX_DRAFT_SCALE = 8  # JPEG DCT 스케일링 최대 축소 배율
+
+# 행 묶음 디코딩은 Pillow 내부 속성(_size, _tile_size, tile)을 바꾸므로 확인한 버전에서만 사용
+ROW_GROUP_PILLOW_VERSIONS = ((9, 0), (13, 0))  # [최소, 최대) - 범위 밖이면 전체 디코딩
+
+
+def _pillow_version() -> Tuple[int, int]:
+    try:
+        major, minor = PIL.__version__.split('.')[:2]
+        return int(major), int(minor)
+    except ValueError:
+        return 0, 0
+
+
+_ROW_GROUPS_SUPPORTED = ROW_GROUP_PILLOW_VERSIONS[0] <= _pillow_version() < ROW_GROUP_PILLOW_VERSIONS[1]
+
+TileKey = Tuple[int, int, int]  # (level, tx, ty)
+
+
+def _pyramid_dir(file_path: str) -> Optional[str]:
+    """원본 파일(경로, 크기, 수정 시각)에 대응하는 피라미드 디렉토리"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    key = f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return os.path.join(get_cache_dir(), 'tiles', digest)
+
+
+def _level_sizes(width: int, height: int) -> List[Tuple[int, int]]:
+    """레벨별 크기 (0: 원본, 레벨마다 절반, 타일 하나에 들어가면 끝)"""
+    sizes = [(width, height)]
+    while max(sizes[-1]) > TILE_SIZE:
+        w, h = sizes[-1]
+        sizes.append(((w + 1) // 2, (h + 1) // 2))
+    return sizes
+
+
+class _LevelWriter:
+    """한 레벨의 행 스트림을 받아 타일로 저장하고, 절반 크기 행을 다음 레벨로 넘김"""
+
+    def __init__(self, root: str, level: int, sizes: List[Tuple[int, int]], ext: str):
+        self._dir = os.path.join(root, str(level))
+        os.makedirs(self._dir, exist_ok=True)
+        self._width = sizes[level][0]
+        self._ext = ext
+        self._pending: Optional[Image.Image] = None
+        self._next_row = 0
+        self._child = _LevelWriter(root, level + 1, sizes, ext) if level + 1 < len(sizes) else None
+
+    def add(self, rows: Image.Image):
+        """행 추가 (TILE_SIZE 행이 모이면 타일 한 줄 저장)"""
+        if self._pending is None:
+            self._pending = rows
+        else:
+            merged = Image.new(rows.mode, (self._width, self._pending.height + rows.height))
+            merged.paste(self._pending, (0, 0))
+            merged.paste(rows, (0, self._pending.height))
+            self._pending = merged
+
+        while self._pending is not None and self._pending.height >= TILE_SIZE:
+            band = self._pending.crop((0, 0, self._width, TILE_SIZE))
+            rest = self._pending.height - TILE_SIZE
+            self._pending = (
+                self._pending.crop((0, TILE_SIZE, self._width, self._pending.height))
+                if rest else None
+            )
+            self._write_band(band)
+
+    def finish(self):
+        """남은 행 저장 후 하위 레벨도 마무리"""
+        if self._pending is not None:
+            self._write_band(self._pending)
+            self._pending = None
+        if self._child is not None:
+            self._child.finish()
+
+    def _write_band(self, band: Image.Image):
+        ty = self._next_row // TILE_SIZE
+        for tx in range((self._width + TILE_SIZE - 1) // TILE_SIZE):
+            x0 = tx * TILE_SIZE
+            tile = band.crop((x0, 0, min(x0 + TILE_SIZE, self._width), band.height))
+            path = os.path.join(self._dir, f"{tx}_{ty}.{self._ext}")
+            if self._ext == 'jpg':
+                tile.save(path, 'JPEG', quality=92)
+            else:
+                tile.save(path, 'PNG', compress_level=1)
+        self._next_row += band.height
+
+        if self._child is not None:
+            self._child.add(band.reduce(2))
+
+
+class TilePyramidBuilder(QRunnable):
+    """원본을 위에서부터 행 단위로 디코딩해 레벨별 타일을 디스크에 기록
+
+    무압축 TIFF/PPM처럼 Pillow 타일 목록이 행 단위로 나뉜 파일은 행 묶음씩
+    디코딩하므로 메모리가 이미지 크기와 무관하다. PNG, JPEG, 압축 TIFF처럼
+    단일 스트림인 포맷은 FULL_DECODE_MAX_PIXELS 이하면 생성 시 한 번만 전체를
+    디코딩하고, 넘으면 JPEG은 DCT 스케일링으로 예산 안에 들도록 축소해
+    피라미드를 만들며(레벨 0이 원본보다 작음) 그 외에는 생성에 실패한다.
+    EXIF 방향 정보는 적용하지 않는다 (회전 정보가 있는 초대형 사진은 눕힌 채 표시).
+    """
+
+    class Signals(QObject):
+        finished = Signal(str)  # pyramid_dir
+        error = Signal(str)  # error_message
+
+    def __init__(self, file_path: str, pyramid_dir: str):
+        super().__init__()
+        self.file_path = file_path
+        self.pyramid_dir = pyramid_dir
+        self.signals = TilePyramidBuilder.Signals()
+        self._is_cancelled = False
+
+    def cancel(self):
+        self._is_cancelled = True
+
+    def run(self):
+        if self._is_cancelled:
+            return
+
+        tmp_dir = self.pyramid_dir + '.tmp'
+        try:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            os.makedirs(tmp_dir)
+
+            with ImageLoader.open_image(self.file_path, allow_large=True) as img:
+                groups = self._row_groups(img)
+                if groups is None:
+                    self._fit_full_decode(img)
+                width, height = img.size
+                has_alpha = img.mode in ('RGBA', 'LA') or 'transparency' in img.info
+                mode = 'RGBA' if has_alpha else 'RGB'
+                ext = 'png' if has_alpha else 'jpg'
+                sizes = _level_sizes(width, height)
+
+                writer = _LevelWriter(tmp_dir, 0, sizes, ext)
+                for rows in self._iter_rows(img, groups):
+                    if self._is_cancelled:
+                        shutil.rmtree(tmp_dir, ignore_errors=True)
+                        return
+                    writer.add(rows if rows.mode == mode else rows.convert(mode))
+                writer.finish()
+
+            preview_level = next(
+                (i for i, size in enumerate(sizes) if max(size) <= PREVIEW_MAX),
+                len(sizes) - 1
+            )
+            self._write_preview(tmp_dir, sizes, preview_level, mode, ext)
+
+            manifest = {
+                'width': width,
+                'height': height,
+                'tile_size': TILE_SIZE,
+                'levels': sizes,
+                'ext': ext,
+            }
+            with open(os.path.join(tmp_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+
+            shutil.rmtree(self.pyramid_dir, ignore_errors=True)
+            os.replace(tmp_dir, self.pyramid_dir)
+            self._collect_garbage()
+        except Exception as e:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not self._is_cancelled:
+                self.signals.error.emit(str(e))
+            return
+
+        if not self._is_cancelled:
+            self.signals.finished.emit(self.pyramid_dir)
+
+    @staticmethod
+    def _fit_full_decode(img: Image.Image):
+        """전체 디코딩이 FULL_DECODE_MAX_PIXELS 안에 들도록 축소 디코딩 설정 (불가능하면 예외)"""
+        width, height = img.size
+        if width * height <= FULL_DECODE_MAX_PIXELS:
+            return
+
+        # 가장 작은 2의 거듭제곱 배율로 축소 (JPEG만 적용됨, draft는 요청 크기 이상으로 디코딩)
+        scale = 2 ** math.ceil(math.log2(math.sqrt(width * height / FULL_DECODE_MAX_PIXELS)))
+        if scale <= MAX_DRAFT_SCALE:
+            img.draft(None, (math.ceil(width / scale), math.ceil(height / scale)))
+        if img.width * img.height > FULL_DECODE_MAX_PIXELS:
+            raise ValueError(f"행 단위로 읽을 수 없는 포맷이라 너무 큼 ({width} x {height})")
+
+    def _iter_rows(self, img: Image.Image, groups) -> Iterator[Image.Image]:
+        """원본을 위에서부터 행 묶음으로 디코딩 (groups가 None이면 전체 디코딩)"""
+        if groups is None:
+            # 단일 스트림 포맷 - 전체 디코딩 후 TILE_SIZE 행씩 전달 (_fit_full_decode로 크기 제한)
+            img.load()
+            for y in range(0, img.height, TILE_SIZE):
+                yield img.crop((0, y, img.width, min(y + TILE_SIZE, img.height)))
+            return
+
+        for (y0, y1), tiles in groups:
+            band = self._decode_row_group(img.width, y0, y1, tiles)
+            if band is None:
+                # Pillow 내부 구조가 달라 행 묶음 디코딩이 안 되면 남은 행은 전체 디코딩으로 처리
+                if img.width * img.height > FULL_DECODE_MAX_PIXELS:
+                    raise ValueError(f"행 단위 디코딩 실패, 전체 디코딩하기에는 너무 큼 ({img.width} x {img.height})")
+                img.load()
+                for y in range(y0, img.height, TILE_SIZE):
+                    yield img.crop((0, y, img.width, min(y + TILE_SIZE, img.height)))
+                return
+            yield band
+
+    def _decode_row_group(self, width: int, y0: int, y1: int, tiles: list) -> Optional[Image.Image]:
+        """행 구간 하나만 디코딩 (파일을 새로 열어 타일 목록만 교체, 실패 시 None)
+
+        Pillow 공개 API로는 일부 행만 디코딩할 수 없어 내부 속성(_size, tile)을 바꾼다.
+        """
+        try:
+            with ImageLoader.open_image(self.file_path, allow_large=True) as band:
+                if not hasattr(band, '_size'):
+                    return None
+                band._size = (width, y1 - y0)
+                if hasattr(band, '_tile_size'):
+                    band._tile_size = band._size  # TIFF는 디코딩 버퍼 크기를 별도로 보관
+                band.tile = [
+                    (name, (x0, ty0 - y0, x1, ty1 - y0), offset, args)
+                    for name, (x0, ty0, x1, ty1), offset, args in tiles
+                ]
+                band.load()
+                if band.size != (width, y1 - y0):
+                    return None
+                return band.copy()  # 파일을 닫은 뒤에도 쓸 수 있도록 픽셀만 복사
+        except Exception as e:
+            print(f"행 단위 디코딩 실패, 전체 디코딩으로 전환: {self.file_path} - {e}")
+            return None
+
+    @staticmethod
+    def _row_groups(img: Image.Image):
+        """Pillow 타일 목록을 겹치지 않는 행 구간별로 묶음 (불가능하면 None)"""
+        if not _ROW_GROUPS_SUPPORTED:
+            return None
+        tiles = [tuple(tile) for tile in img.tile]
+        if len(tiles) == 1:
+            tiles = TilePyramidBuilder._split_raw_tile(img, tiles[0])
+        if len(tiles) < 2:
+            return None
+
+        groups: Dict[Tuple[int, int], list] = {}
+        for tile in tiles:
+            _, (_, y0, _, y1), _, _ = tile
+            groups.setdefault((y0, y1), []).append(tile)
+
+        ordered = sorted(groups.items())
+        expected = 0
+        for (y0, y1), _ in ordered:
+            if y0 != expected:
+                return None
+            expected = y1
+        return ordered if expected >= img.height else None
+
+    @staticmethod
+    def _split_raw_tile(img: Image.Image, tile: tuple) -> list:
+        """무압축 단일 타일(무압축 TIFF, PPM 등)을 TILE_SIZE 행 단위로 분할"""
+        name, extents, offset, args = tile
+        if name != 'raw' or extents != (0, 0, img.width, img.height):
+            return [tile]
+
+        rawmode, stride, orientation = (tuple(args) + (0, 1))[:3] if isinstance(args, tuple) else (args, 0, 1)
+        if rawmode != img.mode or img.mode not in ('L', 'LA', 'RGB', 'RGBA') or orientation != 1:
+            return [tile]
+
+        stride = stride or img.width * len(img.mode)
+        return [
+            (name, (0, y, img.width, min(y + TILE_SIZE, img.height)), offset + y * stride, args)
+            for y in range(0, img.height, TILE_SIZE)
+        ]
+
+    @staticmethod
+    def _write_preview(root: str, sizes, level: int, mode: str, ext: str):
+        """미리보기 레벨의 타일을 하나의 이미지로 합쳐 저장"""
+        width, height = sizes[level]
+        preview = Image.new(mode, (width, height))
+        for ty in range((height + TILE_SIZE - 1) // TILE_SIZE):
+            for tx in range((width + TILE_SIZE - 1) // TILE_SIZE):
+                path = os.path.join(root, str(level), f"{tx}_{ty}.{ext}")
+                with Image.open(path) as tile:
+                    preview.paste(tile, (tx * TILE_SIZE, ty * TILE_SIZE))
+        preview.save(os.path.join(root, f"{PREVIEW_NAME}.png"), 'PNG', compress_level=1)
+
+    def _collect_garbage(self):
+        """오래된 피라미드 삭제 (최근 MAX_CACHED_PYRAMIDS개만 유지)"""
+        root = os.path.dirname(self.pyramid_dir)
+        try:
+            entries = [
+                e for e in os.scandir(root)
+                if e.is_dir() and not e.name.endswith('.tmp')
+            ]
+        except OSError:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        for entry in entries[MAX_CACHED_PYRAMIDS:]:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+class TileLoadWorker(QRunnable):
+    """디스크 타일 비동기 로딩 워커"""
+
+    class Signals(QObject):
+        finished = Signal(int, int, int, QImage)  # level, tx, ty, image
+        error = Signal(int, int, int)  # level, tx, ty
+
+    def __init__(self, key: TileKey, path: str):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.signals = TileLoadWorker.Signals()
+        self._is_cancelled = False
+
+    def cancel(self):
+        self._is_cancelled = True
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._is_cancelled
+
+    def run(self):
+        if self._is_cancelled:
+            return
+
+        image = None
+        try:
+            with Image.open(self.path) as tile:
+                image = ImageLoader._pil_to_qimage(tile)
+        except Exception:
+            pass
+
+        if self._is_cancelled:
+            return
+
+        if image is not None:
+            self.signals.finished.emit(*self.key, image)
+        else:
+            self.signals.error.emit(*self.key)
+
+
+class TiledImage(QObject):
+    """타일 피라미드 기반 초대형 이미지
+
+    피라미드가 없으면 백그라운드에서 한 번 생성해 디스크 캐시에 보관하고,
+    뷰어가 요청한 타일만 비동기로 읽어 바이트 예산 내 LRU로 유지한다.
+    """
+
+    pyramid_ready = Signal()
+    build_failed = Signal(str)
+    tile_ready = Signal()
+
+    MAX_TILE_MEMORY = 128 * 1024 * 1024  # 128MB
+    MAX_THREADS = 2
+
+    def __init__(self, file_path: str, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self._dir = _pyramid_dir(file_path)
+        self._manifest: Optional[dict] = None
+        self._tiles = OrderedDict()  # {key: (pixmap, nbytes)}
+        self._memory = 0
+        self._pending_workers: Dict[TileKey, TileLoadWorker] = {}
+        self._missing = set()
+        self._builder: Optional[TilePyramidBuilder] = None
+
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(self.MAX_THREADS)
+
+    @staticmethod
+    def needs_tiling(width: int, height: int) -> bool:
+        """타일 모드로 표시해야 하는 크기인지 여부"""
+        return width * height >= TILED_MIN_PIXELS or max(width, height) > TILED_MIN_SIDE
+
+    @staticmethod
+    def should_tile(file_path: str) -> bool:
+        """파일 헤더 기준 타일 모드 대상 여부"""
+        info = ImageLoader.get_image_info(file_path)
+        return TiledImage.needs_tiling(info['width'], info['height'])
+
+    def start(self):
+        """피라미드 준비 (디스크 캐시에 있으면 즉시 pyramid_ready)"""
+        if self._dir is None:
+            self.build_failed.emit("파일 정보를 읽을 수 없음")
+            return
+
+        if self._load_manifest():
+            self.pyramid_ready.emit()
+            return
+
+        self._builder = TilePyramidBuilder(self.file_path, self._dir)
+        self._builder.signals.finished.connect(self._on_pyramid_built)
+        self._builder.signals.error.connect(self.build_failed)
+        # 생성은 오래 걸릴 수 있으므로 전역 풀 사용 (객체 삭제 시 대기하지 않도록)
+        QThreadPool.globalInstance().start(self._builder)
+
+    def _load_manifest(self) -> bool:
+        try:
+            with open(os.path.join(self._dir, MANIFEST_NAME), encoding='utf-8') as f:
+                self._manifest = json.load(f)
+            os.utime(self._dir)  # 최근 사용 표시 (GC 순서)
+            return True
+        except (OSError, ValueError):
+            self._manifest = None
+            return False
+
+    def _on_pyramid_built(self, pyramid_dir: str):
+        self._builder = None
+        if self._load_manifest():
+            self.pyramid_ready.emit()
+        else:
+            self.build_failed.emit("타일 피라미드 생성 실패")
+
+    def is_ready(self) -> bool:
+        return self._manifest is not None
+
+    @property
+    def size(self) -> QSize:
+        if not self._manifest:
+            return QSize()
+        return QSize(self._manifest['width'], self._manifest['height'])
+
+    @property
+    def tile_size(self) -> int:
+        return self._manifest['tile_size'] if self._manifest else TILE_SIZE
+
+    @property
+    def level_count(self) -> int:
+        return len(self._manifest['levels']) if self._manifest else 0
+
+    def level_size(self, level: int) -> Tuple[int, int]:
+        return tuple(self._manifest['levels'][level])
+
+    def level_for_scale(self, scale: float) -> int:
+        """화면 픽셀/원본 픽셀 비율에 맞는 레벨 (해상도가 모자라지 않는 가장 작은 레벨)"""
+        level = 0
+        while level + 1 < self.level_count and scale <= 1 / (2 ** (level + 1)):
+            level += 1
+        return level
+
+    def load_preview(self) -> Optional[QPixmap]:
+        """전체 미리보기 (타일이 로드되기 전 밑그림)"""
+        if not self._manifest:
+            return None
+        pixmap = QPixmap(os.path.join(self._dir, f"{PREVIEW_NAME}.png"))
+        return pixmap if not pixmap.isNull() else None
+
+    def tile(self, level: int, tx: int, ty: int) -> Optional[QPixmap]:
+        """타일 반환 (메모리에 없으면 비동기 로딩 요청 후 None)"""
+        key = (level, tx, ty)
+        entry = self._tiles.get(key)
+        if entry is not None:
+            self._tiles.move_to_end(key)
+            return entry[0]
+
+        if self._manifest and key not in self._pending_workers and key not in self._missing:
+            path = os.path.join(self._dir, str(level), f"{tx}_{ty}.{self._manifest['ext']}")
+            worker = TileLoadWorker(key, path)
+            worker.signals.finished.connect(self._on_tile_loaded)
+            worker.signals.error.connect(self._on_tile_error)
+            self._pending_workers[key] = worker
+            self._thread_pool.start(worker)
+        return None
+
+    def retain(self, keys: Iterable[TileKey]):
+        """보이는 타일 외의 대기 중인 로딩 취소"""
+        visible = set(keys)
+        for key in list(self._pending_workers):
+            if key not in visible:
+                self._pending_workers.pop(key).cancel()
+
+    def _on_tile_loaded(self, level: int, tx: int, ty: int, image: QImage):
+        key = (level, tx, ty)
+        worker = self._pending_workers.pop(key, None)
+        if worker is None or worker.is_cancelled:
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        nbytes = _pixmap_nbytes(pixmap)
+        self._tiles[key] = (pixmap, nbytes)
+        self._memory += nbytes
+        while self._memory > self.MAX_TILE_MEMORY and len(self._tiles) > 1:
+            _, (_, old_bytes) = self._tiles.popitem(last=False)
+            self._memory -= old_bytes
+
+        self.tile_ready.emit()
+
+    def _on_tile_error(self, level: int, tx: int, ty: int):
+        key = (level, tx, ty)
+        self._pending_workers.pop(key, None)
+        self._missing.add(key)
+
+    def close(self):
+        """모든 작업 취소 및 메모리 해제"""
+        if self._builder is not None:
+            self._builder.cancel()
+            self._builder = None
+        for worker in self._pending_workers.values():
+            worker.cancel()
+        self._pending_workers.clear()
+        self._tiles.clear()
+        self._memory = 0
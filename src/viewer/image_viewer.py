@@ -1,9 +1,77 @@
 """
 이미지 뷰어 위젯 - 확대/축소, 드래그, 전체화면 지원
 """
+import math
+from typing import Optional
+
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy
-from PySide6.QtCore import Qt, Signal, QPoint, QSize, QRectF
-from PySide6.QtGui import QPixmap, QPainter, QWheelEvent, QMouseEvent, QKeyEvent
+from PySide6.QtCore import (
+    Qt, Signal, QObject, QRunnable, QThreadPool, QTimer, QPoint, QSize, QRect, QRectF
+)
+from PySide6.QtGui import QImage, QPixmap, QPainter, QWheelEvent, QMouseEvent, QKeyEvent
+
+
+class RenderCacheWorker(QRunnable):
+    """현재 줌에 맞게 미리 스케일한 렌더 캐시 생성 워커 (고품질 필터)"""
+
+    class Signals(QObject):
+        finished = Signal(int, QImage)  # generation, scaled_image
+
+    def __init__(self, generation: int, source: QImage, scaled_size: QSize,
+                 region: QRect, dpr: float):
+        """
+        Args:
+            generation: 요청 번호 (오래된 결과 무시용)
+            source: 원본 픽스맵 이미지
+            scaled_size: 줌 적용된 전체 이미지 크기 (논리 픽셀)
+            region: 캐시할 영역 (줌 적용 좌표계, 논리 픽셀)
+            dpr: 장치 픽셀 비율
+        """
+        super().__init__()
+        self.generation = generation
+        self.source = source
+        self.scaled_size = scaled_size
+        self.region = region
+        self.dpr = dpr
+        self.signals = RenderCacheWorker.Signals()
+        self._is_cancelled = False
+
+    def cancel(self):
+        self._is_cancelled = True
+
+    def run(self):
+        if self._is_cancelled:
+            return
+
+        # 줌 좌표 1픽셀당 원본 픽셀
+        sx = self.source.width() / self.scaled_size.width()
+        sy = self.source.height() / self.scaled_size.height()
+        region = self.region
+
+        # 필요한 원본 영역만 잘라서 스케일 (필터 경계용 1픽셀 여유)
+        left = max(int(region.x() * sx) - 1, 0)
+        top = max(int(region.y() * sy) - 1, 0)
+        right = min(math.ceil((region.x() + region.width()) * sx) + 1, self.source.width())
+        bottom = min(math.ceil((region.y() + region.height()) * sy) + 1, self.source.height())
+        crop = self.source.copy(left, top, right - left, bottom - top)
+
+        scaled = crop.scaled(
+            max(round((right - left) / sx * self.dpr), 1),
+            max(round((bottom - top) / sy * self.dpr), 1),
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        if self._is_cancelled:
+            return
+
+        result = scaled.copy(
+            round((region.x() - left / sx) * self.dpr),
+            round((region.y() - top / sy) * self.dpr),
+            round(region.width() * self.dpr),
+            round(region.height() * self.dpr)
+        )
+        result.setDevicePixelRatio(self.dpr)
+        self.signals.finished.emit(self.generation, result)
 
 
 class ImageViewer(QWidget):
@@ -13,20 +81,45 @@ class ImageViewer(QWidget):
     next_requested = Signal()      # 다음 이미지 요청
     prev_requested = Signal()      # 이전 이미지 요청
     fullscreen_toggled = Signal()  # 전체화면 토글
+    full_resolution_requested = Signal()  # 표시 중인 축소본보다 높은 해상도 필요
+    image_painted = Signal()  # set_image 후 이미지를 처음 그림 (첫 화면 표시 시점 측정용)
 
     # 줌 설정
     MIN_ZOOM = 0.1   # 10%
     MAX_ZOOM = 10.0  # 1000%
     ZOOM_STEP = 1.15  # 15% 단위
+    RESOLUTION_TOLERANCE = 1.05  # 축소본 해상도 허용 오차 (5%)
+
+    # 렌더 캐시 설정
+    RENDER_CACHE_DELAY = 150       # 줌/팬이 멈춘 뒤 캐시를 다시 만들기까지 (ms)
+    RENDER_CACHE_FULL_RATIO = 4    # 줌 적용 이미지가 창 면적의 이 배수 이하면 전체를 캐시
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._pixmap: QPixmap = None
+        self._image_size = QSize()  # 원본 이미지 크기 (줌 계산 기준)
+        self._full_res_requested = False
+        self._tiled = None  # 타일 모드일 때 TiledImage
         self._zoom = 1.0
         self._pan_offset = QPoint(0, 0)
         self._is_panning = False
         self._pan_start = QPoint(0, 0)
         self._fit_mode = True  # True: 창에 맞춤, False: 실제 크기/줌
+        self._paint_pending = False  # 새 이미지를 아직 그리지 않음 (image_painted 발생 전)
+
+        # 렌더 캐시: 현재 줌으로 미리 스케일한 픽스맵 (팬은 복사만 수행)
+        self._render_cache: Optional[QPixmap] = None
+        self._render_cache_key = None   # (pixmap cacheKey, 줌 적용 크기, dpr)
+        self._render_cache_rect = QRect()  # 캐시 영역 (줌 적용 좌표계)
+        self._render_generation = 0
+        self._render_worker: Optional[RenderCacheWorker] = None
+        self._pending_render = None  # 생성 중인 캐시의 (키, 영역)
+        self._interacting = False  # 줌/팬 중에는 빠른 필터로 그림
+
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(self.RENDER_CACHE_DELAY)
+        self._render_timer.timeout.connect(self._rebuild_render_cache)
 
         self._setup_ui()
 
@@ -39,16 +132,72 @@ class ImageViewer(QWidget):
         # 배경색 설정
         self.setStyleSheet("background-color: #000000;")
 
-    def set_image(self, pixmap: QPixmap):
-        """이미지 설정"""
+    def set_image(self, pixmap: QPixmap, original_size: Optional[QSize] = None):
+        """이미지 설정
+
+        Args:
+            pixmap: 표시할 이미지 (화면 크기로 축소된 버전일 수 있음)
+            original_size: 원본 이미지 크기 (None이면 pixmap 크기)
+        """
+        self._release_tiled()
+        self._invalidate_render_cache()
         self._pixmap = pixmap
+        self._image_size = QSize(original_size) if original_size is not None else pixmap.size()
+        self._full_res_requested = False
         self._zoom = 1.0
         self._pan_offset = QPoint(0, 0)
         self._fit_mode = True
+        self._paint_pending = True
         self.update()
+        self._check_resolution()
+
+    def set_tiled_image(self, tiled):
+        """타일 모드 전환 (set_image로 설정한 미리보기를 밑그림으로 사용)
+
+        Args:
+            tiled: 피라미드가 준비된 TiledImage
+        """
+        self._release_tiled()
+        self._tiled = tiled
+        self._image_size = tiled.size
+        tiled.tile_ready.connect(self.update)
+        self.update()
+
+    def _release_tiled(self):
+        """타일 모드 해제"""
+        if self._tiled is not None:
+            self._tiled.tile_ready.disconnect(self.update)
+            self._tiled = None
+
+    def upgrade_image(self, pixmap: QPixmap):
+        """같은 이미지의 고해상도 버전으로 교체 (줌/팬 유지)"""
+        if not self._pixmap:
+            return
+        self._pixmap = pixmap
+        self._schedule_render_cache()
+        self.update()
+
+    def is_full_resolution(self) -> bool:
+        """원본 해상도 이미지를 표시 중인지 여부"""
+        if self._tiled is not None:
+            return True  # 타일이 줌에 맞는 해상도를 제공
+        return bool(self._pixmap) and self._pixmap.width() >= self._image_size.width()
+
+    def _check_resolution(self):
+        """현재 줌에서 축소본 해상도가 부족하면 원본 해상도 요청 (이미지당 1회)"""
+        if self._full_res_requested or not self._pixmap or self.is_full_resolution():
+            return
+
+        needed_width = (self._image_size.width() * self._get_effective_zoom()
+                        * self.devicePixelRatioF())
+        if needed_width > self._pixmap.width() * self.RESOLUTION_TOLERANCE:
+            self._full_res_requested = True
+            self.full_resolution_requested.emit()
 
     def clear(self):
         """이미지 제거"""
+        self._release_tiled()
+        self._invalidate_render_cache()
         self._pixmap = None
         self.update()
 
@@ -64,10 +213,10 @@ class ImageViewer(QWidget):
             return 1.0
 
         widget_size = self.size()
-        pixmap_size = self._pixmap.size()
+        image_size = self._image_size
 
-        width_ratio = widget_size.width() / pixmap_size.width()
-        height_ratio = widget_size.height() / pixmap_size.height()
+        width_ratio = widget_size.width() / image_size.width()
+        height_ratio = widget_size.height() / image_size.height()
 
         return min(width_ratio, height_ratio, 1.0)  # 원본보다 크게 확대하지 않음
 
@@ -85,6 +234,7 @@ class ImageViewer(QWidget):
             self._fit_mode = False
         self._zoom = min(self._zoom * self.ZOOM_STEP, self.MAX_ZOOM)
         self.update()
+        self._check_resolution()
 
     def zoom_out(self):
         """축소"""
@@ -107,11 +257,22 @@ class ImageViewer(QWidget):
         self._zoom = 1.0
         self._pan_offset = QPoint(0, 0)
         self.update()
+        self._check_resolution()
+
+    def _scaled_geometry(self) -> QRect:
+        """줌 적용된 이미지 영역 (위젯 좌표, 원본 크기 기준 - 축소본도 같은 영역에 그림)"""
+        zoom = self._get_effective_zoom()
+        scaled_width = max(int(self._image_size.width() * zoom), 1)
+        scaled_height = max(int(self._image_size.height() * zoom), 1)
+
+        # 중앙 정렬 + 팬 오프셋
+        x = (self.width() - scaled_width) // 2 + self._pan_offset.x()
+        y = (self.height() - scaled_height) // 2 + self._pan_offset.y()
+        return QRect(x, y, scaled_width, scaled_height)
 
     def paintEvent(self, event):
-        """이미지 그리기"""
+        """이미지 그리기 (보이는 영역만, 렌더 캐시가 있으면 복사만 수행)"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
 
         # 배경
         painter.fillRect(self.rect(), Qt.GlobalColor.black)
@@ -119,20 +280,163 @@ class ImageViewer(QWidget):
         if not self._pixmap:
             return
 
-        # 줌 적용된 크기
         zoom = self._get_effective_zoom()
-        scaled_width = int(self._pixmap.width() * zoom)
-        scaled_height = int(self._pixmap.height() * zoom)
+        image_rect = self._scaled_geometry()
+        visible = self.rect().intersected(image_rect)
+        if visible.isEmpty():
+            return
 
-        # 중앙 정렬 + 팬 오프셋
-        x = (self.width() - scaled_width) // 2 + self._pan_offset.x()
-        y = (self.height() - scaled_height) // 2 + self._pan_offset.y()
+        if not self._draw_render_cache(painter, image_rect, visible):
+            self._draw_clipped(painter, image_rect, visible)
+            self._schedule_render_cache()
+
+        if self._tiled is not None:
+            self._paint_tiles(painter, QRectF(image_rect), zoom)
 
-        # 대상 영역
-        target_rect = QRectF(x, y, scaled_width, scaled_height)
-        source_rect = QRectF(0, 0, self._pixmap.width(), self._pixmap.height())
+        if self._paint_pending:
+            self._paint_pending = False
+            painter.end()
+            self.image_painted.emit()
+
+    def _paint_tiles(self, painter: QPainter, image_rect: QRectF, zoom: float):
+        """보이는 영역과 겹치는 타일만 줌에 맞는 레벨에서 그림
+
+        아직 로드되지 않은 타일 자리는 밑그림(미리보기)이 그대로 보인다.
+        """
+        tiled = self._tiled
+        visible = QRectF(self.rect()).intersected(image_rect)
+        if visible.isEmpty():
+            return
+
+        level = tiled.level_for_scale(zoom * self.devicePixelRatioF())
+        factor = 2 ** level                     # 레벨 픽셀당 원본 픽셀
+        span = tiled.tile_size * factor * zoom  # 위젯 좌표계 타일 크기
+        level_width, level_height = tiled.level_size(level)
+        columns = (level_width + tiled.tile_size - 1) // tiled.tile_size
+        rows = (level_height + tiled.tile_size - 1) // tiled.tile_size
+
+        tx0 = max(int((visible.left() - image_rect.left()) // span), 0)
+        tx1 = min(int((visible.right() - image_rect.left()) // span), columns - 1)
+        ty0 = max(int((visible.top() - image_rect.top()) // span), 0)
+        ty1 = min(int((visible.bottom() - image_rect.top()) // span), rows - 1)
+
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, not self._interacting)
+        keys = []
+        for ty in range(ty0, ty1 + 1):
+            for tx in range(tx0, tx1 + 1):
+                keys.append((level, tx, ty))
+                tile = tiled.tile(level, tx, ty)
+                if tile is None:
+                    continue
+
+                # 경계를 정수로 맞춰 이웃 타일 사이 틈 방지
+                left = round(image_rect.left() + tx * span)
+                top = round(image_rect.top() + ty * span)
+                right = round(image_rect.left() + tx * span + tile.width() * factor * zoom)
+                bottom = round(image_rect.top() + ty * span + tile.height() * factor * zoom)
+                painter.drawPixmap(QRectF(left, top, right - left, bottom - top),
+                                   tile, QRectF(tile.rect()))
+
+        tiled.retain(keys)
+
+    def _render_key(self, image_rect: QRect):
+        """렌더 캐시 유효성 키"""
+        return (self._pixmap.cacheKey(), image_rect.size(), self.devicePixelRatioF())
+
+    def _draw_render_cache(self, painter: QPainter, image_rect: QRect, visible: QRect) -> bool:
+        """렌더 캐시가 보이는 영역을 덮으면 스케일 없이 복사 (성공 여부 반환)"""
+        if self._render_cache is None or self._render_cache_key != self._render_key(image_rect):
+            return False
+
+        region = visible.translated(-image_rect.topLeft())
+        if not self._render_cache_rect.contains(region):
+            return False
+
+        dpr = self._render_cache.devicePixelRatio()
+        offset = region.topLeft() - self._render_cache_rect.topLeft()
+        source = QRectF(offset.x() * dpr, offset.y() * dpr,
+                        region.width() * dpr, region.height() * dpr)
+        painter.drawPixmap(QRectF(visible), self._render_cache, source)
+        return True
+
+    def _draw_clipped(self, painter: QPainter, image_rect: QRect, visible: QRect):
+        """보이는 영역에 해당하는 원본 부분만 스케일해서 그림 (캐시가 없을 때)"""
+        sx = self._pixmap.width() / image_rect.width()
+        sy = self._pixmap.height() / image_rect.height()
+        source = QRectF((visible.x() - image_rect.x()) * sx,
+                        (visible.y() - image_rect.y()) * sy,
+                        visible.width() * sx,
+                        visible.height() * sy)
+
+        # 상호작용 중에는 빠른 필터, 멈춘 상태에서는 부드러운 필터
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, not self._interacting)
+        painter.drawPixmap(QRectF(visible), self._pixmap, source)
+
+    def _schedule_render_cache(self):
+        """줌/팬이 멈춘 뒤 렌더 캐시 재생성 예약 (연속 호출 시 지연 갱신)"""
+        self._render_timer.start()
+
+    def _rebuild_render_cache(self):
+        """현재 줌/팬 기준으로 렌더 캐시를 백그라운드에서 생성"""
+        self._interacting = False
+        if not self._pixmap:
+            return
+
+        image_rect = self._scaled_geometry()
+        scaled = QRect(QPoint(0, 0), image_rect.size())
+        viewport = self.width() * self.height()
+
+        if scaled.width() * scaled.height() <= viewport * self.RENDER_CACHE_FULL_RATIO:
+            region = scaled
+        else:
+            # 확대 상태 - 보이는 영역 + 창 절반 여유만 캐시
+            margin_x = self.width() // 2
+            margin_y = self.height() // 2
+            view = QRect(-image_rect.x(), -image_rect.y(), self.width(), self.height())
+            region = view.adjusted(-margin_x, -margin_y, margin_x, margin_y).intersected(scaled)
+        if region.isEmpty():
+            return
+
+        key = self._render_key(image_rect)
+        if (self._render_cache is not None and self._render_cache_key == key
+                and self._render_cache_rect.contains(region)):
+            self.update()
+            return
+
+        if self._render_worker is not None:
+            self._render_worker.cancel()
+
+        self._render_generation += 1
+        worker = RenderCacheWorker(self._render_generation, self._pixmap.toImage(),
+                                   image_rect.size(), region, self.devicePixelRatioF())
+        worker.signals.finished.connect(self._on_render_cache_ready)
+        self._render_worker = worker
+        self._pending_render = (key, region)
+        QThreadPool.globalInstance().start(worker)
+
+        # 캐시가 오기 전까지 부드러운 필터로 다시 그림
+        self.update()
+
+    def _on_render_cache_ready(self, generation: int, image: QImage):
+        """렌더 캐시 생성 완료"""
+        if generation != self._render_generation:
+            return
+
+        self._render_worker = None
+        self._render_cache_key, self._render_cache_rect = self._pending_render
+        self._render_cache = QPixmap.fromImage(image)
+        self.update()
 
-        painter.drawPixmap(target_rect, self._pixmap, source_rect)
+    def _invalidate_render_cache(self):
+        """렌더 캐시 폐기"""
+        self._render_timer.stop()
+        if self._render_worker is not None:
+            self._render_worker.cancel()
+            self._render_worker = None
+        self._render_generation += 1
+        self._render_cache = None
+        self._render_cache_key = None
+        self._render_cache_rect = QRect()
 
     def wheelEvent(self, event: QWheelEvent):
         """마우스 휠 - 줌"""
@@ -140,6 +444,7 @@ class ImageViewer(QWidget):
             return
 
         # 휠 방향에 따라 줌
+        self._interacting = True
         delta = event.angleDelta().y()
         if delta > 0:
             self.zoom_in()
@@ -161,6 +466,7 @@ class ImageViewer(QWidget):
             self._pan_offset += delta
             self._pan_start = event.pos()
             self._fit_mode = False
+            self._interacting = True
             self.update()
         super().mouseMoveEvent(event)
 
@@ -204,3 +510,4 @@ class ImageViewer(QWidget):
         """창 크기 변경 시 업데이트"""
         super().resizeEvent(event)
         self.update()
+        self._check_resolution()
@@ -2,6 +2,8 @@
 메인 윈도우 - 전체 앱 구성
 """
 import os
+import bisect
+import heapq
 from pathlib import Path
 from typing import Optional
 
@@ -9,42 +11,36 @@ from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QMenu, QFileDialog, QMessageBox, QDialog, QComboBox,
     QPushButton, QGroupBox, QFormLayout, QSpinBox, QDialogButtonBox,
-    QStackedWidget
+    QStackedWidget, QProgressBar, QCheckBox, QApplication
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QAction, QKeySequence, QDragEnterEvent, QDropEvent
+from PySide6.QtCore import Qt, QSize, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QAction, QKeySequence, QDragEnterEvent, QDropEvent, QImage, QPixmap
 
 from .image_viewer import ImageViewer
-from .video_player import VideoPlayer
 from .thumbnail_strip import ThumbnailStrip
-from utils.image_loader import ImageLoader
-from utils.compressor import ImageCompressor
+from utils.image_loader import ImageLoader, ImageCache, ImageLoadWorker, FolderScanWorker
+from utils.compressor import (
+    ImageCompressor, CompressionWorker, BatchCompressionWorker, BatchCompressionResult, SizeEstimator, SizeEstimateWorker
+)
+from utils.prefetcher import ImagePrefetcher
+from utils.startup_timeline import StartupTimeline
+from utils.tiled_image import TiledImage
 
 
-class CompressionDialog(QDialog):
-    """이미지 압축 대화상자"""
+def _path_key(path: str) -> str:
+    """같은 파일인지 비교하기 위한 정규화 경로"""
+    return os.path.normcase(os.path.abspath(path))
 
-    def __init__(self, file_path: str, parent=None):
-        super().__init__(parent)
-        self.file_path = file_path
-        self.result = None
 
-        self._setup_ui()
+class CompressionOptions(QWidget):
+    """압축 옵션 (품질/해상도/포맷) - 단일/일괄 압축 대화상자 공용"""
 
-    def _setup_ui(self):
-        self.setWindowTitle("이미지 압축")
-        self.setFixedWidth(350)
+    changed = Signal()  # 옵션 변경
 
+    def __init__(self, parent=None):
+        super().__init__(parent)
         layout = QVBoxLayout(self)
-
-        # 파일 정보
-        info = ImageLoader.get_image_info(self.file_path)
-        info_label = QLabel(
-            f"파일: {info['filename']}\n"
-            f"크기: {ImageLoader.format_file_size(info['size_bytes'])}\n"
-            f"해상도: {info['width']} x {info['height']}"
-        )
-        layout.addWidget(info_label)
+        layout.setContentsMargins(0, 0, 0, 0)
 
         # 품질 설정
         quality_group = QGroupBox("품질")
@@ -85,31 +81,384 @@ class CompressionDialog(QDialog):
 
         layout.addWidget(format_group)
 
+        # 목표 크기 (품질/해상도 자동 조절, 선택한 품질은 상한으로 사용)
+        target_group = QGroupBox("목표 크기")
+        target_layout = QFormLayout(target_group)
+
+        self._target_check = QCheckBox("파일 크기 제한")
+        target_layout.addRow(self._target_check)
+
+        self._target_spin = QSpinBox()
+        self._target_spin.setRange(10, 100 * 1024)
+        self._target_spin.setValue(500)
+        self._target_spin.setSuffix(" KB")
+        self._target_spin.setEnabled(False)
+        target_layout.addRow("최대 크기:", self._target_spin)
+
+        self._target_check.toggled.connect(self._target_spin.setEnabled)
+        layout.addWidget(target_group)
+
+        for combo in (self._quality_combo, self._resolution_combo, self._format_combo):
+            combo.currentIndexChanged.connect(self.changed)
+        self._target_check.toggled.connect(self.changed)
+        self._target_spin.valueChanged.connect(self.changed)
+
+    def quality(self) -> int:
+        return self._quality_combo.currentData()
+
+    def max_width(self) -> Optional[int]:
+        return self._resolution_combo.currentData()
+
+    def output_format(self) -> str:
+        return self._format_combo.currentData()
+
+    def target_size(self) -> Optional[int]:
+        """목표 파일 크기 (바이트, 사용하지 않으면 None)"""
+        if not self._target_check.isChecked():
+            return None
+        return self._target_spin.value() * 1024
+
+
+class CompressionDialog(QDialog):
+    """이미지 압축 대화상자 (모달 아님, 백그라운드에서 압축)"""
+
+    compression_finished = Signal(object)  # CompressionResult (취소 시에는 발생하지 않음)
+
+    # 크기 추정 풀 - 대화상자가 닫힐 때 실행 중인 추정(전체 디코딩)을 기다리지 않도록 앱 수명으로 공유
+    _estimate_pool: Optional[QThreadPool] = None
+
+    @staticmethod
+    def _shared_estimate_pool() -> QThreadPool:
+        if CompressionDialog._estimate_pool is None:
+            CompressionDialog._estimate_pool = QThreadPool(QApplication.instance())
+            CompressionDialog._estimate_pool.setMaxThreadCount(1)
+        return CompressionDialog._estimate_pool
+
+    def __init__(self, file_path: str, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.result = None
+        self._worker: Optional[CompressionWorker] = None
+
+        # 크기 추정 - 단일 스레드, 최신 요청만 유효
+        self._estimator = SizeEstimator(file_path)
+        self._estimate_generation = 0
+        self._estimate_worker: Optional[SizeEstimateWorker] = None
+
+        self._setup_ui()
+        self._update_estimate()
+
+    def _setup_ui(self):
+        self.setWindowTitle("이미지 압축")
+        self.setFixedWidth(350)
+
+        layout = QVBoxLayout(self)
+
+        # 파일 정보
+        info = ImageLoader.get_image_info(self.file_path)
+        info_label = QLabel(
+            f"파일: {info['filename']}\n"
+            f"크기: {ImageLoader.format_file_size(info['size_bytes'])}\n"
+            f"해상도: {info['width']} x {info['height']}"
+        )
+        layout.addWidget(info_label)
+
+        self._options = CompressionOptions()
+        self._options.changed.connect(self._update_estimate)
+        layout.addWidget(self._options)
+
+        # 예상 크기 (옵션 변경 시 백그라운드에서 샘플 인코딩으로 추정)
+        self._estimate_label = QLabel()
+        layout.addWidget(self._estimate_label)
+
+        # 진행 상황 (압축 중에만 표시)
+        self._progress_bar = QProgressBar()
+        self._progress_bar.setRange(0, 100)
+        self._progress_bar.hide()
+        layout.addWidget(self._progress_bar)
+
         # 버튼
-        button_box = QDialogButtonBox(
+        self._button_box = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
         )
-        button_box.accepted.connect(self._on_accept)
-        button_box.rejected.connect(self.reject)
-        layout.addWidget(button_box)
+        self._button_box.accepted.connect(self._on_accept)
+        self._button_box.rejected.connect(self.reject)
+        layout.addWidget(self._button_box)
+
+    def _update_estimate(self):
+        """현재 옵션으로 예상 크기 추정 시작 (대기 중인 이전 요청은 버림)"""
+        self._estimate_generation += 1
+        self._cancel_estimate()
+        target_size = self._options.target_size()
+        if target_size:
+            self._estimate_label.setText(f"예상 크기: {ImageLoader.format_file_size(target_size)} 이하")
+            return
+
+        self._estimate_label.setText("예상 크기: 계산 중...")
+        worker = SizeEstimateWorker(
+            self._estimator,
+            self._estimate_generation,
+            self._options.quality(),
+            self._options.max_width(),
+            self._options.output_format()
+        )
+        worker.signals.finished.connect(self._on_estimate_ready)
+        self._estimate_worker = worker
+        self._shared_estimate_pool().start(worker)
+
+    def _cancel_estimate(self):
+        """진행 중인 추정 취소 (대기 중이면 풀에서 빼고, 실행 중이면 결과만 버림)"""
+        worker = self._estimate_worker
+        if worker is None:
+            return
+        self._estimate_worker = None
+        worker.cancel()
+        self._shared_estimate_pool().tryTake(worker)
+        try:
+            worker.signals.finished.disconnect(self._on_estimate_ready)
+        except (RuntimeError, TypeError):
+            pass
+
+    def _on_estimate_ready(self, generation: int, estimate):
+        if generation != self._estimate_generation:
+            return
+        self._estimate_worker = None
+        if estimate is None:
+            self._estimate_label.setText("예상 크기: 알 수 없음")
+            return
+        self._estimate_label.setText(
+            f"예상 크기: {estimate.size_str} ({estimate.range_str}), "
+            f"{estimate.width} x {estimate.height}"
+        )
 
     def _on_accept(self):
-        quality = self._quality_combo.currentData()
-        max_width = self._resolution_combo.currentData()
-        output_format = self._format_combo.currentData()
-
-        self.result = ImageCompressor.compress(
-            input_path=self.file_path,
-            quality=quality,
-            max_width=max_width,
-            output_format=output_format
+        """압축 시작 (워커 스레드에서 실행, 끝나면 compression_finished 후 닫힘)"""
+        if self._worker is not None:
+            return
+
+        self._set_running(True)
+        self._worker = CompressionWorker(
+            self.file_path,
+            quality=self._options.quality(),
+            max_width=self._options.max_width(),
+            output_format=self._options.output_format(),
+            target_size=self._options.target_size()
         )
+        self._worker.signals.progress.connect(self._progress_bar.setValue)
+        self._worker.signals.finished.connect(self._on_finished)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _set_running(self, running: bool):
+        self._options.setEnabled(not running)
+        self._button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(not running)
+        self._button_box.button(QDialogButtonBox.StandardButton.Cancel).setEnabled(True)
+        self._progress_bar.setValue(0)
+        self._progress_bar.setVisible(running)
+
+    def _on_finished(self, result):
+        self._worker = None
+        if result.cancelled:
+            self._set_running(False)
+            return
+
+        self.result = result
+        self.compression_finished.emit(result)
         self.accept()
 
+    def reject(self):
+        """압축 중이면 취소 요청 (완료되면 대화상자는 그대로 남음), 아니면 닫기"""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._button_box.button(QDialogButtonBox.StandardButton.Cancel).setEnabled(False)
+            return
+        super().reject()
+
+    def closeEvent(self, event):
+        if self._worker is not None:
+            self.reject()
+            event.ignore()
+            return
+        super().closeEvent(event)
+
+    def done(self, result_code: int):
+        """닫힐 때 크기 추정 결과가 삭제된 대화상자로 오지 않도록 취소"""
+        self._cancel_estimate()
+        super().done(result_code)
+
+
+class BatchCompressionDialog(QDialog):
+    """일괄 압축 대화상자 (폴더/여러 파일, 백그라운드 프로세스 풀에서 압축)"""
+
+    file_created = Signal(str)  # 압축 결과 파일이 생길 때마다
+
+    def __init__(self, files: list, folder: Optional[str] = None, parent=None):
+        super().__init__(parent)
+        self._files = self._compressible(files)
+        self._folder = folder
+        self._worker: Optional[BatchCompressionWorker] = None
+        self.result: Optional[BatchCompressionResult] = None
+
+        self._setup_ui()
+        self._update_file_label()
+
+    def _setup_ui(self):
+        self.setWindowTitle("일괄 압축")
+        self.setFixedWidth(380)
+
+        layout = QVBoxLayout(self)
+
+        # 대상 파일
+        self._file_label = QLabel()
+        self._file_label.setWordWrap(True)
+        layout.addWidget(self._file_label)
+
+        source_layout = QHBoxLayout()
+        self._folder_button = QPushButton("폴더 선택...")
+        self._folder_button.clicked.connect(self._choose_folder)
+        source_layout.addWidget(self._folder_button)
+        self._files_button = QPushButton("파일 선택...")
+        self._files_button.clicked.connect(self._choose_files)
+        source_layout.addWidget(self._files_button)
+        layout.addLayout(source_layout)
+
+        self._options = CompressionOptions()
+        layout.addWidget(self._options)
+
+        # 진행 상황
+        self._progress_bar = QProgressBar()
+        self._progress_bar.setValue(0)
+        layout.addWidget(self._progress_bar)
+
+        self._status_label = QLabel("")
+        self._status_label.setWordWrap(True)
+        layout.addWidget(self._status_label)
+
+        # 버튼
+        self._button_box = QDialogButtonBox()
+        self._start_button = self._button_box.addButton("압축 시작", QDialogButtonBox.ButtonRole.AcceptRole)
+        self._cancel_button = self._button_box.addButton(QDialogButtonBox.StandardButton.Cancel)
+        self._start_button.clicked.connect(self._start)
+        self._cancel_button.clicked.connect(self._on_cancel)
+        layout.addWidget(self._button_box)
+
+    def _update_file_label(self):
+        source = self._folder if self._folder else "선택한 파일"
+        self._file_label.setText(f"대상: {source}\n이미지 {len(self._files)}개")
+        self._start_button.setEnabled(bool(self._files))
+
+    def _choose_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "폴더 선택", self._folder or "")
+        if folder:
+            self._folder = folder
+            self._files = self._compressible(ImageLoader.get_files_in_folder(folder))
+            self._update_file_label()
+
+    @staticmethod
+    def _compressible(files: list) -> list:
+        """압축 대상 (지원 이미지 중 이전 압축 결과 파일 제외)"""
+        return [f for f in files
+                if ImageLoader.is_supported_image(f) and not ImageCompressor.is_compressed_output(f)]
+
+    def _choose_files(self):
+        files, _ = QFileDialog.getOpenFileNames(
+            self,
+            "이미지 선택",
+            self._folder or "",
+            "이미지 파일 (*.jpg *.jpeg *.png *.bmp *.webp *.gif *.tif *.tiff *.heic *.heif)"
+        )
+        files = [f for f in files if ImageLoader.is_supported_image(f)]
+        if files:
+            self._folder = None
+            self._files = files
+            self._update_file_label()
+
+    def _start(self):
+        """압축 시작 (GUI를 막지 않도록 워커 스레드에서 실행)"""
+        if not self._files or self._worker is not None:
+            return
+
+        self._options.setEnabled(False)
+        self._folder_button.setEnabled(False)
+        self._files_button.setEnabled(False)
+        self._start_button.setEnabled(False)
+        self._progress_bar.setRange(0, len(self._files))
+        self._progress_bar.setValue(0)
+        self._status_label.setText("압축 중...")
+
+        self._worker = BatchCompressionWorker(
+            self._files,
+            quality=self._options.quality(),
+            max_width=self._options.max_width(),
+            output_format=self._options.output_format(),
+            target_size=self._options.target_size()
+        )
+        self._worker.signals.progress.connect(self._on_progress)
+        self._worker.signals.finished.connect(self._on_finished)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _on_progress(self, done: int, total: int, result):
+        self._progress_bar.setValue(done)
+        if result.success:
+            self.file_created.emit(result.output_path)
+        status = "완료" if result.success else f"실패 - {result.error_message}"
+        self._status_label.setText(f"{done}/{total} {os.path.basename(result.original_path)}: {status}")
+
+    def _on_finished(self, batch: BatchCompressionResult):
+        self._worker = None
+        self.result = batch
+
+        summary = (
+            f"{'취소됨' if batch.cancelled else '완료'}: "
+            f"성공 {len(batch.succeeded)}개, 실패 {len(batch.failed)}개 / 전체 {batch.total}개\n"
+            f"원본: {batch.original_size_str} → 압축: {batch.compressed_size_str} "
+            f"(절감 {batch.size_reduction:.1f}%)"
+        )
+        missed = [r for r in batch.succeeded if not r.target_met]
+        if missed:
+            summary += f"\n목표 크기 초과: {len(missed)}개 (가장 작게 저장됨)"
+        if batch.failed:
+            summary += "\n\n실패한 파일:\n" + "\n".join(
+                f"{os.path.basename(r.original_path)}: {r.error_message}" for r in batch.failed[:5]
+            )
+        self._status_label.setText(summary)
+
+        self._start_button.hide()
+        self._cancel_button.setText("닫기")
+        self._cancel_button.setEnabled(True)
+
+    def _on_cancel(self):
+        """실행 중이면 취소 요청 (남은 파일은 건너뜀), 아니면 닫기"""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._cancel_button.setEnabled(False)
+            self._status_label.setText("취소 중... (진행 중인 파일은 마무리)")
+            return
+        if self.result is not None:
+            self.accept()
+        else:
+            self.reject()
+
+    def closeEvent(self, event):
+        if self._worker is not None:
+            self._on_cancel()
+            event.ignore()
+            return
+        super().closeEvent(event)
+
+    def reject(self):
+        if self._worker is not None:
+            self._on_cancel()
+            return
+        super().reject()
+
 
 class MainWindow(QMainWindow):
     """메인 윈도우"""
 
+    FULL_RES_PRIORITY = 10  # 원본 해상도 로딩 우선순위 (썸네일보다 먼저)
+    PREFETCH_DELAY = 150  # 연속 탐색이 멈춘 뒤 프리페치 시작까지 (ms)
+    FOLDER_SCAN_DELAY = 300  # 첫 이미지가 표시되지 않아도 폴더 스캔을 시작하는 시간 (ms)
+
     def __init__(self):
         super().__init__()
         self._current_file: Optional[str] = None
@@ -117,6 +466,39 @@ class MainWindow(QMainWindow):
         self._files: list = []
         self._current_index = -1
         self._was_maximized = False
+        self._nav_direction = 1  # 1: 다음, -1: 이전 (프리페치 방향)
+        self._displayed_file: Optional[str] = None
+        self._image_worker: Optional[ImageLoadWorker] = None  # 현재 이미지 로딩 (최신 요청만 유효)
+        self._startup_decoder = None  # main.py에서 미리 디코딩 중인 명령줄 이미지 (첫 로딩에만 사용)
+
+        # 현재 이미지 전용 단일 스레드 풀 - 연속 탐색 시 대기 중인 요청은 버리고 마지막 것만 실행
+        self._image_pool = QThreadPool(self)
+        self._image_pool.setMaxThreadCount(1)
+        self._full_res_worker: Optional[ImageLoadWorker] = None
+        self._tiled_image: Optional[TiledImage] = None
+
+        # 디코딩 이미지 캐시 + 이웃 이미지 프리페처
+        self._image_cache = ImageCache()
+        self._prefetcher = ImagePrefetcher(self._image_cache, self)
+        self._prefetcher.image_ready.connect(self._on_prefetched_image)
+
+        # 키 반복 등 연속 탐색 중에는 프리페치를 미룸
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(self.PREFETCH_DELAY)
+        self._prefetch_timer.timeout.connect(self._update_prefetch)
+
+        # 폴더 스캔 - 파일을 열면 첫 이미지를 먼저 표시하고 목록은 백그라운드에서 채움
+        self._scan_pool = QThreadPool(self)
+        self._scan_pool.setMaxThreadCount(1)
+        self._scan_worker: Optional[FolderScanWorker] = None
+        self._scan_generation = 0  # 파일을 열 때마다 증가 (이전 스캔 결과 무시용)
+        self._scanning = False  # 현재 폴더 목록이 아직 완성되지 않음 (스캔 대기/진행 중)
+        self._unscanned_keys = set()  # 스캔 결과와 별개로 목록에 넣은 파일 (정규화 경로, 스캔 중 중복 방지)
+        self._scan_timer = QTimer(self)
+        self._scan_timer.setSingleShot(True)
+        self._scan_timer.setInterval(self.FOLDER_SCAN_DELAY)
+        self._scan_timer.timeout.connect(self._start_folder_scan)
 
         self._setup_ui()
         self._setup_menu()
@@ -177,14 +559,12 @@ class MainWindow(QMainWindow):
         self._viewer.next_requested.connect(self._next_image)
         self._viewer.prev_requested.connect(self._prev_image)
         self._viewer.fullscreen_toggled.connect(self._toggle_fullscreen)
+        self._viewer.full_resolution_requested.connect(self._load_full_resolution)
+        self._viewer.image_painted.connect(self._on_image_painted)
         self._stack.addWidget(self._viewer)
 
-        # 비디오 플레이어
-        self._video_player = VideoPlayer()
-        self._video_player.next_requested.connect(self._next_image)
-        self._video_player.prev_requested.connect(self._prev_image)
-        self._video_player.fullscreen_toggled.connect(self._toggle_fullscreen)
-        self._stack.addWidget(self._video_player)
+        # 비디오 플레이어 (QtMultimedia 로드가 무거우므로 첫 동영상을 열 때 생성)
+        self._video_player = None
 
         # 썸네일 스트립
         self._thumbnail_strip = ThumbnailStrip()
@@ -247,6 +627,10 @@ class MainWindow(QMainWindow):
         compress_action.triggered.connect(self._show_compress_dialog)
         tools_menu.addAction(compress_action)
 
+        batch_compress_action = QAction("일괄 압축(&B)...", self)
+        batch_compress_action.triggered.connect(self._show_batch_compress_dialog)
+        tools_menu.addAction(batch_compress_action)
+
     def _setup_shortcuts(self):
         """추가 단축키 설정"""
         pass  # 키보드 이벤트는 ImageViewer에서 처리
@@ -282,56 +666,353 @@ class MainWindow(QMainWindow):
             else:
                 subprocess.run(['open', '-R', self._current_file])
 
-    def open_file(self, file_path: str):
-        """파일 열기"""
+    def open_file(self, file_path: str, startup_decoder=None):
+        """파일 열기
+
+        Args:
+            file_path: 파일 경로
+            startup_decoder: 같은 파일을 미리 디코딩 중인 StartupDecoder (main.py, 시작 시에만)
+        """
         if not os.path.isfile(file_path):
+            if startup_decoder is not None:
+                startup_decoder.cancel()
             return
 
+        # 스캔 결과(폴더 경로 + 이름)와 같은 형태로 맞춤 ('photo.jpg'처럼 폴더 없이 연 경우 포함)
+        file_path = os.path.abspath(file_path)
         self._current_file = file_path
         self._current_folder = os.path.dirname(file_path)
-
-        # 폴더 내 파일 목록 가져오기
-        self._files = ImageLoader.get_files_in_folder(self._current_folder)
-
-        # 현재 파일 인덱스 찾기
-        try:
-            self._current_index = self._files.index(file_path)
-        except ValueError:
-            self._current_index = 0
-
-        # 썸네일 스트립 업데이트
+        self._displayed_file = None
+
+        # 요청한 파일만으로 먼저 시작 (폴더 목록은 첫 표시 후 백그라운드에서 채움)
+        if self._scan_worker is not None:
+            self._scan_worker.cancel()
+            self._scan_worker = None
+        self._scan_generation += 1
+        self._scanning = True
+        self._unscanned_keys = {_path_key(file_path)}
+        self._files = [file_path]
+        self._current_index = 0
         self._thumbnail_strip.set_files(self._files)
         self._thumbnail_strip.select_index(self._current_index)
+        self._prefetcher.set_files(self._files)
+        self._nav_direction = 1
 
-        # 이미지 로드
+        # 이미지 로드 (미리 디코딩한 결과는 축소 디코딩이 필요한 경우에만 사용)
+        self._startup_decoder = startup_decoder
         self._load_current_image()
+        if self._startup_decoder is not None:
+            self._startup_decoder.cancel()
+            self._startup_decoder = None
+
+        # 디코딩을 기다리는 중이면 표시된 뒤(또는 FOLDER_SCAN_DELAY 후) 스캔 시작
+        if self._image_worker is not None and self._displayed_file != file_path:
+            self._scan_timer.start()
+        else:
+            self._start_folder_scan()
+
+    def open_external_file(self, file_path: str):
+        """다른 실행에서 넘어온 파일 열기 (단일 인스턴스 모드) - 창을 앞으로 가져옴"""
+        if file_path and ImageLoader.is_supported_file(file_path):
+            self.open_file(file_path)
+
+        if self.isMinimized():
+            self.setWindowState(self.windowState() & ~Qt.WindowState.WindowMinimized)
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def _start_folder_scan(self):
+        """현재 폴더 스캔 시작"""
+        self._scan_timer.stop()
+        if not self._current_folder:
+            self._scanning = False
+            self._update_index_label()
+            return
+
+        worker = FolderScanWorker(self._current_folder, self._scan_generation)
+        worker.signals.progress.connect(self._on_folder_files)
+        worker.signals.finished.connect(self._on_folder_scanned)
+        self._scan_worker = worker
+        self._scan_pool.start(worker)
+
+    def _on_folder_scanned(self, generation: int, files: list):
+        """폴더 스캔 완료"""
+        if generation != self._scan_generation:
+            return
+        self._scan_worker = None
+        self._scanning = False
+        self._on_folder_files(generation, files)
+        self._unscanned_keys.clear()
+
+    def _on_folder_files(self, generation: int, files: list):
+        """스캔으로 새로 찾은 파일을 목록에 병합 (중간 결과 포함, 현재 파일과 스트립 스크롤 유지)"""
+        if generation != self._scan_generation:
+            return
+
+        # 스캔 전부터 목록에 있던 파일(처음 연 파일, 스캔 중 생긴 압축 결과)은
+        # 경로 표기(구분자, 대소문자, 상대 경로)가 달라도 다시 넣지 않음
+        if self._unscanned_keys:
+            new_files = []
+            for file_path in files:
+                key = _path_key(file_path)
+                if key in self._unscanned_keys:
+                    self._unscanned_keys.discard(key)
+                else:
+                    new_files.append(file_path)
+            files = new_files
+
+        if files:
+            # 둘 다 정렬되어 있으므로 병합만 (get_files_in_folder와 같은 정렬 순서)
+            self._files = list(heapq.merge(self._files, files, key=str.lower))
+            self._current_index = self._files.index(self._current_file)
+            self._thumbnail_strip.replace_files(self._files, self._current_index)
+            self._prefetcher.set_files(self._files)
+            self._prefetch_timer.start()
+        self._update_index_label()
 
     def _load_current_image(self):
         """현재 이미지/동영상 로드"""
         if not self._current_file:
             return
 
-        if ImageLoader.is_supported_image(self._current_file):
+        # 이전 탐색 요청의 로딩은 취소 (마지막으로 도착한 파일만 디코딩)
+        if self._image_worker is not None and self._image_worker.file_path != self._current_file:
+            self._image_worker.cancel()
+            self._image_worker = None
+
+        if self._tiled_image is not None and self._tiled_image.file_path != self._current_file:
+            self._close_tiled_image()
+
+        if ImageLoader.is_supported_image(self._current_file) and TiledImage.should_tile(self._current_file):
+            # 초대형 이미지 - 타일 피라미드로 표시
+            self._show_viewer_page()
+            self._show_tiled_image(self._current_file)
+            self._prefetch_timer.start()
+        elif ImageLoader.is_supported_image(self._current_file):
             # 이미지 표시
-            self._video_player.stop()
-            self._stack.setCurrentWidget(self._viewer)
-            pixmap = ImageLoader.load_image(self._current_file)
-            if pixmap:
-                self._viewer.set_image(pixmap)
+            self._show_viewer_page()
+
+            # 화면 크기로 축소 디코딩 (확대 시 원본 해상도로 교체)
+            preview_size = self._preview_size()
+            self._prefetcher.set_max_size(preview_size)
+
+            # 캐시(프리페치 포함)에 있으면 즉시 표시, 아니면 백그라운드 디코딩 후 표시
+            cached = self._image_cache.get(self._current_file)
+            if cached:
+                self._show_image(self._current_file, *cached)
             else:
-                self._viewer.clear()
+                if not self._prefetcher.is_pending(self._current_file):
+                    self._start_image_load(self._current_file, preview_size)
+                self._show_placeholder(self._current_file)
+
+            self._prefetch_timer.start()
         elif ImageLoader.is_supported_video(self._current_file):
             # 동영상 재생
+            self._displayed_file = None
             self._viewer.clear()
-            self._stack.setCurrentWidget(self._video_player)
-            self._video_player.set_video(self._current_file)
+            video_player = self._get_video_player()
+            self._stack.setCurrentWidget(video_player)
+            video_player.set_video(self._current_file)
         else:
-            self._video_player.stop()
-            self._stack.setCurrentWidget(self._viewer)
+            self._show_viewer_page()
+            self._displayed_file = None
             self._viewer.clear()
 
         self._update_info_bar()
 
+    def _get_video_player(self):
+        """비디오 플레이어 (첫 호출 시 생성)"""
+        if self._video_player is None:
+            from .video_player import VideoPlayer
+
+            self._video_player = VideoPlayer()
+            self._video_player.next_requested.connect(self._next_image)
+            self._video_player.prev_requested.connect(self._prev_image)
+            self._video_player.fullscreen_toggled.connect(self._toggle_fullscreen)
+            self._stack.addWidget(self._video_player)
+        return self._video_player
+
+    def _show_viewer_page(self):
+        """이미지 뷰어로 전환 (재생 중인 동영상은 정지)"""
+        if self._video_player is not None:
+            self._video_player.stop()
+        self._stack.setCurrentWidget(self._viewer)
+
+    def _preview_size(self) -> tuple:
+        """축소 디코딩 크기 (화면 해상도, 물리 픽셀 기준)"""
+        return self.preview_size_for(self.screen())
+
+    @staticmethod
+    def preview_size_for(screen) -> tuple:
+        """해당 화면의 축소 디코딩 크기 (창을 만들기 전 시작 디코딩용)"""
+        size = screen.size() * screen.devicePixelRatio()
+        return (size.width(), size.height())
+
+    def _update_prefetch(self):
+        """연속 탐색이 멈춘 위치 기준으로 프리페치 창 갱신"""
+        self._prefetcher.update(self._current_index, self._nav_direction)
+
+    def _start_image_load(self, file_path: str, max_size: tuple):
+        """현재 이미지 백그라운드 디코딩 시작"""
+        if self._image_worker is not None and self._image_worker.file_path == file_path:
+            return
+
+        decoder, self._startup_decoder = self._startup_decoder, None
+        if decoder is not None and (_path_key(decoder.file_path) != _path_key(file_path)
+                                    or decoder.max_size != max_size):
+            decoder.cancel()
+            decoder = None
+
+        worker = ImageLoadWorker(file_path, max_size, decoder)
+        worker.signals.finished.connect(self._on_image_loaded)
+        worker.signals.error.connect(self._on_image_load_error)
+        self._image_worker = worker
+        self._image_pool.clear()
+        self._image_pool.start(worker)
+
+    def _on_image_loaded(self, file_path: str, image: QImage, original_size: QSize):
+        """현재 이미지 디코딩 완료 (이미 다른 파일로 이동했으면 무시)"""
+        worker = self._image_worker
+        if worker is None or worker.file_path != file_path or worker.is_cancelled:
+            return
+        self._image_worker = None
+        StartupTimeline.mark('first_decode')
+
+        pixmap = QPixmap.fromImage(image)
+        self._image_cache.put(file_path, pixmap, original_size)
+        if file_path == self._current_file:
+            self._show_image(file_path, pixmap, original_size)
+
+    def _on_image_load_error(self, file_path: str, error: str):
+        """현재 이미지 디코딩 실패"""
+        worker = self._image_worker
+        if worker is None or worker.file_path != file_path or worker.is_cancelled:
+            return
+        self._image_worker = None
+
+        print(f"이미지 로드 실패: {file_path} - {error}")
+        if file_path == self._current_file:
+            self._displayed_file = None
+            self._viewer.clear()
+            if self._scan_timer.isActive():
+                self._start_folder_scan()
+
+    def _show_placeholder(self, file_path: str):
+        """디코딩이 끝날 때까지 캐시된 썸네일을 확대해 임시 표시"""
+        thumbnail = self._thumbnail_strip.get_cached_thumbnail(file_path)
+        if thumbnail is None:
+            return
+
+        info = ImageLoader.get_image_info(file_path)
+        original_size = QSize(info['width'], info['height']) if info['width'] else None
+        self._displayed_file = None
+        self._viewer.set_image(thumbnail, original_size)
+
+    def _show_image(self, file_path: str, pixmap: QPixmap, original_size: QSize):
+        """뷰어에 이미지 표시"""
+        if self._displayed_file == file_path:
+            return
+        self._displayed_file = file_path
+        self._viewer.set_image(pixmap, original_size)
+
+        # 파일을 연 직후라면 첫 표시가 끝났으니 폴더 스캔 시작
+        if self._scan_timer.isActive():
+            self._start_folder_scan()
+
+    def _on_image_painted(self):
+        """뷰어가 새 이미지를 처음 그림 - 시작 타임라인 마감 (썸네일 임시 표시는 제외)"""
+        if self._displayed_file is not None:
+            StartupTimeline.mark('first_paint')
+            StartupTimeline.report()
+
+    def _show_tiled_image(self, file_path: str):
+        """타일 모드 표시 시작 (피라미드가 준비되면 표시)"""
+        if self._tiled_image is not None:
+            return
+
+        self._displayed_file = None
+        self._viewer.clear()
+
+        tiled = TiledImage(file_path, self)
+        tiled.pyramid_ready.connect(self._on_pyramid_ready)
+        tiled.build_failed.connect(self._on_pyramid_failed)
+        self._tiled_image = tiled
+        tiled.start()
+
+    def _on_pyramid_ready(self):
+        """타일 피라미드 준비 완료 - 미리보기를 밑그림으로 타일 모드 전환"""
+        tiled = self._tiled_image
+        if tiled is None or self.sender() is not tiled:
+            return
+
+        preview = tiled.load_preview()
+        if preview is None:
+            self._on_pyramid_failed("미리보기를 읽을 수 없음")
+            return
+
+        StartupTimeline.mark('first_decode')
+        self._displayed_file = tiled.file_path
+        self._viewer.set_image(preview, tiled.size)
+        self._viewer.set_tiled_image(tiled)
+
+    def _on_pyramid_failed(self, error: str):
+        """타일 피라미드 생성 실패"""
+        if self._tiled_image is not None:
+            print(f"타일 생성 실패: {self._tiled_image.file_path} - {error}")
+
+    def _close_tiled_image(self):
+        """타일 모드 종료 (진행 중인 생성/로딩 취소)"""
+        tiled = self._tiled_image
+        self._tiled_image = None
+        self._displayed_file = None
+        self._viewer.clear()
+        tiled.close()
+        tiled.deleteLater()
+
+    def _on_prefetched_image(self, file_path: str, pixmap: QPixmap, original_size: QSize):
+        """프리페치 완료 - 현재 파일을 기다리는 중이면 표시"""
+        if file_path == self._current_file and ImageLoader.is_supported_image(file_path):
+            self._show_image(file_path, pixmap, original_size)
+
+    def _load_full_resolution(self):
+        """확대로 축소본 해상도가 부족해지면 원본 해상도를 백그라운드에서 로드"""
+        file_path = self._displayed_file
+        if not file_path:
+            return
+
+        # 캐시에 원본 해상도가 있으면 바로 교체
+        cached = self._image_cache.get(file_path)
+        if cached and cached[0].width() >= cached[1].width():
+            self._viewer.upgrade_image(cached[0])
+            return
+
+        if self._full_res_worker is not None:
+            if self._full_res_worker.file_path == file_path:
+                return
+            self._full_res_worker.cancel()
+
+        worker = ImageLoadWorker(file_path)
+        worker.signals.finished.connect(self._on_full_resolution_loaded)
+        worker.signals.error.connect(self._on_full_resolution_error)
+        self._full_res_worker = worker
+        QThreadPool.globalInstance().start(worker, self.FULL_RES_PRIORITY)
+
+    def _on_full_resolution_loaded(self, file_path: str, image: QImage, original_size: QSize):
+        """원본 해상도 로드 완료"""
+        if self._full_res_worker is not None and self._full_res_worker.file_path == file_path:
+            self._full_res_worker = None
+
+        pixmap = QPixmap.fromImage(image)
+        self._image_cache.put(file_path, pixmap, original_size)
+        if file_path == self._displayed_file:
+            self._viewer.upgrade_image(pixmap)
+
+    def _on_full_resolution_error(self, file_path: str, error: str):
+        """원본 해상도 로드 실패 (축소본 유지)"""
+        if self._full_res_worker is not None and self._full_res_worker.file_path == file_path:
+            self._full_res_worker = None
+
     def _update_info_bar(self):
         """정보 바 업데이트"""
         if not self._current_file:
@@ -346,13 +1027,19 @@ class MainWindow(QMainWindow):
         self._filename_label.setText(info['filename'])
         self._resolution_label.setText(f"{info['width']} x {info['height']}")
         self._filesize_label.setText(ImageLoader.format_file_size(info['size_bytes']))
-        self._index_label.setText(f"{self._current_index + 1} / {len(self._files)}")
+        self._update_index_label()
 
         self.setWindowTitle(f"{info['filename']} - Lightweight Viewer")
 
+    def _update_index_label(self):
+        """인덱스 표시 갱신 (폴더 스캔 중이면 전체 개수 뒤에 … 표시)"""
+        total = f"{len(self._files)}…" if self._scanning else f"{len(self._files)}"
+        self._index_label.setText(f"{self._current_index + 1} / {total}")
+
     def _next_image(self):
         """다음 이미지"""
         if self._current_index < len(self._files) - 1:
+            self._nav_direction = 1
             self._current_index += 1
             self._current_file = self._files[self._current_index]
             self._thumbnail_strip.select_index(self._current_index)
@@ -361,6 +1048,7 @@ class MainWindow(QMainWindow):
     def _prev_image(self):
         """이전 이미지"""
         if self._current_index > 0:
+            self._nav_direction = -1
             self._current_index -= 1
             self._current_file = self._files[self._current_index]
             self._thumbnail_strip.select_index(self._current_index)
@@ -368,6 +1056,7 @@ class MainWindow(QMainWindow):
 
     def _on_thumbnail_selected(self, index: int, file_path: str):
         """썸네일 선택"""
+        self._nav_direction = -1 if index < self._current_index else 1
         self._current_index = index
         self._current_file = file_path
         self._load_current_image()
@@ -397,7 +1086,7 @@ class MainWindow(QMainWindow):
             self,
             "이미지 열기",
             "",
-            "이미지 파일 (*.jpg *.jpeg *.png *.bmp *.webp *.gif *.heic *.heif);;모든 파일 (*.*)"
+            "이미지 파일 (*.jpg *.jpeg *.png *.bmp *.webp *.gif *.tif *.tiff *.heic *.heif);;모든 파일 (*.*)"
         )
         if file_path:
             self.open_file(file_path)
@@ -409,24 +1098,65 @@ class MainWindow(QMainWindow):
             return
 
         dialog = CompressionDialog(self._current_file, self)
-        if dialog.exec() == QDialog.DialogCode.Accepted and dialog.result:
-            result = dialog.result
-            if result.success:
-                QMessageBox.information(
-                    self, "압축 완료",
-                    f"압축이 완료되었습니다.\n\n"
-                    f"원본: {result.original_size_str}\n"
-                    f"압축: {result.compressed_size_str}\n"
-                    f"절감: {result.size_reduction:.1f}%\n\n"
-                    f"저장 위치: {result.output_path}"
-                )
-                # 폴더 새로고침
-                self.open_file(self._current_file)
-            else:
-                QMessageBox.warning(
-                    self, "압축 실패",
-                    f"압축 중 오류가 발생했습니다.\n{result.error_message}"
-                )
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.compression_finished.connect(self._on_compression_finished)
+        dialog.show()
+
+    def _on_compression_finished(self, result):
+        """압축 완료 - 새 파일을 목록에 추가하고 결과 안내"""
+        if not result.success:
+            QMessageBox.warning(
+                self, "압축 실패",
+                f"압축 중 오류가 발생했습니다.\n{result.error_message}"
+            )
+            return
+
+        self._add_file(result.output_path)
+
+        message = (
+            f"압축이 완료되었습니다.\n\n"
+            f"원본: {result.original_size_str}\n"
+            f"압축: {result.compressed_size_str}\n"
+            f"절감: {result.size_reduction:.1f}%\n"
+        )
+        if result.target_size:
+            message += f"품질: {result.quality}%, 해상도: {result.width} x {result.height}\n"
+            if not result.target_met:
+                message += "목표 크기를 맞추지 못해 가장 작은 결과로 저장했습니다.\n"
+        message += f"\n저장 위치: {result.output_path}"
+        QMessageBox.information(self, "압축 완료", message)
+
+    def _show_batch_compress_dialog(self):
+        """일괄 압축 대화상자 표시 (기본 대상: 현재 폴더의 이미지)"""
+        dialog = BatchCompressionDialog(self._files, self._current_folder, self)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.file_created.connect(self._add_file)
+        dialog.show()
+
+    def _add_file(self, file_path: str):
+        """새로 생긴 파일을 현재 폴더 목록에 삽입 (폴더를 다시 읽지 않음)"""
+        if not self._current_folder or not ImageLoader.is_supported_file(file_path):
+            return
+        if _path_key(os.path.dirname(file_path)) != _path_key(self._current_folder):
+            return
+
+        if file_path in self._files:
+            # 같은 이름으로 덮어쓴 경우 썸네일만 갱신
+            self._thumbnail_strip.invalidate_thumbnail(file_path)
+            return
+
+        # get_files_in_folder와 같은 정렬 순서 유지
+        index = bisect.bisect_left(self._files, file_path.lower(), key=str.lower)
+        self._files = self._files[:index] + [file_path] + self._files[index:]
+        if self._current_index >= index:
+            self._current_index += 1
+        if self._scanning:
+            self._unscanned_keys.add(_path_key(file_path))  # 스캔 결과에 다시 나와도 중복 방지
+
+        self._thumbnail_strip.insert_file(index, file_path)
+        self._prefetcher.set_files(self._files)
+        if self._current_file:
+            self._update_index_label()
 
     def dragEnterEvent(self, event: QDragEnterEvent):
         """드래그 진입"""
@@ -441,10 +1171,15 @@ class MainWindow(QMainWindow):
             if ImageLoader.is_supported_file(file_path):
                 self.open_file(file_path)
 
+    def shutdown(self):
+        """백그라운드 작업과 썸네일 디스크 캐시 정리 (이벤트 루프 종료 후 호출)"""
+        self._prefetcher.clear()
+        self._thumbnail_strip.shutdown()
+
     def keyPressEvent(self, event):
         """키 이벤트 (현재 위젯으로 전달)"""
         current_widget = self._stack.currentWidget()
-        if current_widget == self._video_player:
+        if self._video_player is not None and current_widget == self._video_player:
             self._video_player.keyPressEvent(event)
         else:
             self._viewer.keyPressEvent(event)
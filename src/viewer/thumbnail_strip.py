@@ -1,15 +1,18 @@
 """
-썸네일 스트립 - 비동기 로딩, 가상 스크롤 지원, 높이 조절 가능
+썸네일 스트립 - 가상화된 뷰(보이는 아이템만 그림), 비동기 로딩, 높이 조절 가능
 """
-from typing import List, Optional
-from PySide6.QtWidgets import (
-    QWidget, QScrollArea, QHBoxLayout, QLabel, QFrame,
-    QSizePolicy, QVBoxLayout
+import math
+import time
+from typing import List, Optional, Tuple
+from PySide6.QtWidgets import QWidget, QAbstractScrollArea, QFrame, QVBoxLayout
+from PySide6.QtCore import Qt, Signal, QPoint, QRect, QRectF, QTimer
+from PySide6.QtGui import (
+    QImage, QPixmap, QPainter, QColor, QPen, QPolygon, QMouseEvent, QWheelEvent
 )
-from PySide6.QtCore import Qt, Signal, QSize, QThreadPool, QTimer
-from PySide6.QtGui import QPixmap, QPainter, QColor, QPen, QFont, QMouseEvent
 
-from utils.image_loader import ImageLoader, ThumbnailWorker, ThumbnailCache
+from utils.image_loader import ImageLoader, ThumbnailCache
+from utils.thumbnail_store import ThumbnailDiskCache
+from utils.thumbnail_scheduler import ThumbnailScheduler
 
 
 class ResizeHandle(QWidget):
@@ -68,89 +71,234 @@ class ResizeHandle(QWidget):
             event.accept()
 
 
-class ThumbnailItem(QFrame):
-    """개별 썸네일 아이템"""
+class ThumbnailView(QAbstractScrollArea):
+    """가상화된 썸네일 뷰 - 보이는 아이템만 직접 그림
 
-    clicked = Signal(int)  # index
+    파일 수와 무관하게 위젯은 하나뿐이며, 썸네일은 ThumbnailCache에서 꺼내
+    그린다. 선택/호버 상태도 스타일시트 대신 그리기로 표현한다.
+    """
+
+    item_clicked = Signal(int)  # index
+    visible_range_changed = Signal(int, int)  # first, last (포함)
+    user_scrolled = Signal(float)  # 사용자 스크롤(휠/스크롤바) 이동량 (아이템 단위, 음수는 왼쪽)
 
     THUMB_SIZE = 80
+    ITEM_SIZE = THUMB_SIZE + 8
+    SPACING = 4
+    MARGIN = 8
     SELECTED_BORDER = 3
+    ENSURE_VISIBLE_MARGIN = 50  # 선택 아이템 스크롤 시 여백
 
-    def __init__(self, index: int, file_path: str, parent=None):
+    def __init__(self, cache: ThumbnailCache, parent=None):
         super().__init__(parent)
-        self.index = index
-        self.file_path = file_path
-        self._pixmap: Optional[QPixmap] = None
-        self._is_selected = False
-        self._is_loading = False
-        self._is_video = ImageLoader.is_supported_video(file_path)
+        self._cache = cache
+        self._files: List[str] = []
+        self._loading = set()  # 로딩 중 표시할 경로
+        self._current_index = -1
+        self._hover_index = -1
+        self._scroll_value = 0  # 마지막 스크롤 값 (이동량 계산용)
+        self._user_scrolling = False  # 휠/스크롤바 조작으로 값이 바뀌는 중
+
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.viewport().setMouseTracking(True)
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setStyleSheet("""
+            QAbstractScrollArea {
+                background-color: #0a0a0a;
+                border: none;
+            }
+        """)
+        self.horizontalScrollBar().setSingleStep(self.ITEM_SIZE + self.SPACING)
+        self.horizontalScrollBar().valueChanged.connect(self._on_scrolled)
+        self.horizontalScrollBar().actionTriggered.connect(self._on_scroll_action)
 
-        self._setup_ui()
+    @property
+    def pitch(self) -> int:
+        """아이템 간격 (아이템 너비 + 간격)"""
+        return self.ITEM_SIZE + self.SPACING
 
-    def _setup_ui(self):
-        self.setFixedSize(self.THUMB_SIZE + 8, self.THUMB_SIZE + 8)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._update_style()
-
-    def _update_style(self):
-        if self._is_selected:
-            self.setStyleSheet(f"""
-                ThumbnailItem {{
-                    background-color: #0078d4;
-                    border: {self.SELECTED_BORDER}px solid #0078d4;
-                    border-radius: 4px;
-                }}
-            """)
+    def set_files(self, files: List[str]):
+        """파일 목록 설정 (아이템 생성 없음, O(1))"""
+        self._files = files
+        self._loading.clear()
+        self._current_index = -1
+        self._hover_index = -1
+        self._update_scroll_range()
+        self.horizontalScrollBar().setValue(0)
+        self.viewport().update()
+        self._emit_visible_range()
+
+    def replace_files(self, files: List[str], current_index: int):
+        """파일 목록 교체 (폴더 스캔 결과 병합용)
+
+        보이던 첫 아이템이 같은 화면 위치에 남도록 스크롤을 맞추므로, 앞쪽에
+        파일이 끼어들어도 사용자가 보던 곳이 밀리지 않는다.
+        """
+        scrollbar = self.horizontalScrollBar()
+        anchor = None
+        if self._files:
+            first, _ = self.visible_range()
+            anchor = (self._files[first], scrollbar.value() - (self.MARGIN + first * self.pitch))
+
+        self._files = files
+        self._current_index = current_index
+        self._hover_index = -1
+        self._update_scroll_range()
+        if anchor is not None:
+            try:
+                index = files.index(anchor[0])
+            except ValueError:
+                index = 0
+            scrollbar.setValue(self.MARGIN + index * self.pitch + anchor[1])
+        self.viewport().update()
+        self._emit_visible_range()
+
+    def set_current_index(self, index: int):
+        """선택 아이템 변경"""
+        previous = self._current_index
+        self._current_index = index
+        self._update_item(previous)
+        self._update_item(index)
+
+    def set_loading(self, file_path: str, loading: bool):
+        """로딩 중 표시 설정"""
+        if loading:
+            self._loading.add(file_path)
         else:
-            self.setStyleSheet("""
-                ThumbnailItem {
-                    background-color: #1a1a1a;
-                    border: 2px solid transparent;
-                    border-radius: 4px;
-                }
-                ThumbnailItem:hover {
-                    border: 2px solid #404040;
-                }
-            """)
-
-    def set_selected(self, selected: bool):
-        self._is_selected = selected
-        self._update_style()
-        self.update()
-
-    def set_pixmap(self, pixmap: QPixmap):
-        self._pixmap = pixmap
-        self._is_loading = False
-        self.update()
-
-    def set_loading(self):
-        self._is_loading = True
-        self.update()
+            self._loading.discard(file_path)
+
+    def refresh(self):
+        """보이는 아이템 다시 그리기 (썸네일 도착 시)"""
+        self.viewport().update()
+
+    def insert_file(self, index: int, file_path: str):
+        """아이템 하나 삽입 (스크롤 위치 유지)"""
+        self._files = self._files[:index] + [file_path] + self._files[index:]
+        if self._current_index >= index:
+            self._current_index += 1
+        self._hover_index = -1
+        self._update_scroll_range()
+        self.viewport().update()
+        self._emit_visible_range()
+
+    def visible_range(self) -> Tuple[int, int]:
+        """화면에 보이는 인덱스 범위 (first, last 포함, 없으면 (0, -1))"""
+        if not self._files:
+            return 0, -1
+        scroll_x = self.horizontalScrollBar().value()
+        first = max(0, (scroll_x - self.MARGIN) // self.pitch)
+        last = min(len(self._files) - 1,
+                   (scroll_x + self.viewport().width() - self.MARGIN) // self.pitch)
+        return first, last
+
+    def ensure_visible(self, index: int):
+        """아이템이 보이도록 스크롤 (양쪽 여백 유지)"""
+        if not (0 <= index < len(self._files)):
+            return
+
+        scrollbar = self.horizontalScrollBar()
+        left = self.MARGIN + index * self.pitch
+        right = left + self.ITEM_SIZE
+        margin = min(self.ENSURE_VISIBLE_MARGIN, max(0, (self.viewport().width() - self.ITEM_SIZE) // 2))
+
+        if left - margin < scrollbar.value():
+            scrollbar.setValue(left - margin)
+        elif right + margin > scrollbar.value() + self.viewport().width():
+            scrollbar.setValue(right + margin - self.viewport().width())
+
+    def index_at(self, pos: QPoint) -> int:
+        """뷰포트 좌표의 아이템 인덱스 (없으면 -1)"""
+        x = pos.x() + self.horizontalScrollBar().value() - self.MARGIN
+        if x < 0:
+            return -1
+        index, offset = divmod(x, self.pitch)
+        if offset >= self.ITEM_SIZE or index >= len(self._files):
+            return -1
+        if not self._item_rect(index).contains(pos):
+            return -1
+        return index
+
+    def _item_rect(self, index: int) -> QRect:
+        """아이템 영역 (뷰포트 좌표, 세로 중앙 정렬)"""
+        x = self.MARGIN + index * self.pitch - self.horizontalScrollBar().value()
+        y = max(0, (self.viewport().height() - self.ITEM_SIZE) // 2)
+        return QRect(x, y, self.ITEM_SIZE, self.ITEM_SIZE)
+
+    def _update_item(self, index: int):
+        if 0 <= index < len(self._files):
+            self.viewport().update(self._item_rect(index))
+
+    def _update_scroll_range(self):
+        content_width = 2 * self.MARGIN + len(self._files) * self.pitch - self.SPACING
+        scrollbar = self.horizontalScrollBar()
+        scrollbar.setRange(0, max(0, content_width - self.viewport().width()))
+        scrollbar.setPageStep(self.viewport().width())
+
+    def _emit_visible_range(self):
+        first, last = self.visible_range()
+        self.visible_range_changed.emit(first, last)
+
+    def _on_scroll_action(self, action: int):
+        """스크롤바 조작 (값 반영 직전에 호출, 실제로 움직일 때만 사용자 스크롤로 표시)"""
+        scrollbar = self.horizontalScrollBar()
+        if scrollbar.sliderPosition() != scrollbar.value():
+            self._user_scrolling = True
+
+    def _on_scrolled(self, value: int):
+        """스크롤 값 변경 (ensure_visible 등 코드에서 옮긴 경우는 user_scrolled 없음)"""
+        delta = value - self._scroll_value
+        self._scroll_value = value
+        if self._user_scrolling:
+            self._user_scrolling = False
+            self.user_scrolled.emit(delta / self.pitch)
+        self.viewport().update()
+        self._emit_visible_range()
 
     def paintEvent(self, event):
-        super().paintEvent(event)
-        painter = QPainter(self)
+        """보이는 아이템만 그리기"""
+        painter = QPainter(self.viewport())
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
 
+        first, last = self.visible_range()
+        for index in range(first, last + 1):
+            rect = self._item_rect(index)
+            if rect.intersects(event.rect()):
+                self._paint_item(painter, index, rect)
+
+    def _paint_item(self, painter: QPainter, index: int, rect: QRect):
+        file_path = self._files[index]
+        selected = index == self._current_index
+
+        # 배경/테두리 (선택: 파란 배경, 호버: 회색 테두리)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor('#0078d4') if selected else QColor('#1a1a1a'))
+        painter.drawRoundedRect(QRectF(rect), 4, 4)
+        if not selected and index == self._hover_index:
+            painter.setPen(QPen(QColor('#404040'), 2))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawRoundedRect(QRectF(rect).adjusted(1, 1, -1, -1), 4, 4)
+
         # 컨텐츠 영역
-        margin = 4 if not self._is_selected else self.SELECTED_BORDER + 1
-        content_rect = self.rect().adjusted(margin, margin, -margin, -margin)
-
-        if self._pixmap:
-            # 썸네일 그리기 (중앙 정렬)
-            scaled = self._pixmap.scaled(
-                content_rect.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            x = content_rect.x() + (content_rect.width() - scaled.width()) // 2
-            y = content_rect.y() + (content_rect.height() - scaled.height()) // 2
-            painter.drawPixmap(x, y, scaled)
+        margin = 4 if not selected else self.SELECTED_BORDER + 1
+        content_rect = rect.adjusted(margin, margin, -margin, -margin)
+
+        pixmap = self._cache.peek(file_path)
+        if pixmap:
+            # 썸네일 그리기 (중앙 정렬, 영역보다 크면 비율 유지 축소)
+            size = pixmap.size().scaled(content_rect.size(), Qt.AspectRatioMode.KeepAspectRatio) \
+                if pixmap.width() > content_rect.width() or pixmap.height() > content_rect.height() \
+                else pixmap.size()
+            x = content_rect.x() + (content_rect.width() - size.width()) // 2
+            y = content_rect.y() + (content_rect.height() - size.height()) // 2
+            painter.drawPixmap(QRect(x, y, size.width(), size.height()), pixmap)
 
             # 동영상 아이콘
-            if self._is_video:
+            if ImageLoader.is_supported_video(file_path):
                 self._draw_video_icon(painter, content_rect)
-        elif self._is_loading:
+        elif file_path in self._loading:
             # 로딩 중 표시
             painter.setPen(QColor('#888888'))
             painter.drawText(content_rect, Qt.AlignmentFlag.AlignCenter, "...")
@@ -158,7 +306,7 @@ class ThumbnailItem(QFrame):
             # 빈 상태
             painter.fillRect(content_rect, QColor('#1a1a1a'))
 
-    def _draw_video_icon(self, painter: QPainter, rect):
+    def _draw_video_icon(self, painter: QPainter, rect: QRect):
         """동영상 아이콘 (재생 버튼)"""
         icon_size = 20
         x = rect.right() - icon_size - 4
@@ -176,16 +324,46 @@ class ThumbnailItem(QFrame):
             (x + 7, y + 15),
             (x + 16, y + 10),
         ]
-        from PySide6.QtGui import QPolygon
-        from PySide6.QtCore import QPoint
         polygon = QPolygon([QPoint(px, py) for px, py in points])
         painter.drawPolygon(polygon)
 
-    def mousePressEvent(self, event):
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scroll_range()
+        self._emit_visible_range()
+
+    def wheelEvent(self, event: QWheelEvent):
+        """휠 - 가로 스크롤 (세로 휠도 가로로 변환)"""
+        delta = event.angleDelta()
+        amount = delta.x() if abs(delta.x()) > abs(delta.y()) else delta.y()
+        scrollbar = self.horizontalScrollBar()
+        self._user_scrolling = True
+        scrollbar.setValue(scrollbar.value() - amount)
+        self._user_scrolling = False
+        event.accept()
+
+    def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit(self.index)
+            index = self.index_at(event.position().toPoint())
+            if index >= 0:
+                self.item_clicked.emit(index)
         super().mousePressEvent(event)
 
+    def mouseMoveEvent(self, event: QMouseEvent):
+        index = self.index_at(event.position().toPoint())
+        if index != self._hover_index:
+            previous = self._hover_index
+            self._hover_index = index
+            self._update_item(previous)
+            self._update_item(index)
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        previous = self._hover_index
+        self._hover_index = -1
+        self._update_item(previous)
+        super().leaveEvent(event)
+
 
 class ThumbnailStrip(QWidget):
     """썸네일 스트립 위젯"""
@@ -193,18 +371,25 @@ class ThumbnailStrip(QWidget):
     item_selected = Signal(int, str)  # index, file_path
 
     VISIBLE_BUFFER = 5  # 화면 밖 버퍼 (가상 스크롤용)
+    MAX_AHEAD = 48  # 스크롤 진행 방향 최대 프리페치 개수
+    MIN_LEAD_TIME = 0.3  # 진행 방향 예측 시간 하한 (초)
+    MAX_LEAD_TIME = 2.0  # 진행 방향 예측 시간 상한 (초)
+    VELOCITY_SMOOTHING = 0.3  # 스크롤 속도 지수 이동 평균 가중치
+    MIN_SCROLL_SPEED = 1.0  # 이보다 느리면 정지로 보고 양쪽 대칭 버퍼 사용 (초당 아이템 수)
+    SCROLL_IDLE_MS = 200  # 이 시간 동안 스크롤이 없으면 정지로 간주
     MIN_HEIGHT = 80
     MAX_HEIGHT = 300
-    DEFAULT_HEIGHT = ThumbnailItem.THUMB_SIZE + 24 + ResizeHandle.HEIGHT
+    DEFAULT_HEIGHT = ThumbnailView.THUMB_SIZE + 24 + ResizeHandle.HEIGHT
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._files: List[str] = []
-        self._items: List[ThumbnailItem] = []
         self._current_index = -1
         self._cache = ThumbnailCache(max_items=500, max_memory_mb=100)
-        self._thread_pool = QThreadPool.globalInstance()
-        self._pending_workers: dict = {}  # {path: worker}
+        self._disk_cache = ThumbnailDiskCache()
+        self._failed = set()  # 디코딩에 실패한 경로 (재시도하지 않음)
+        self._velocity = 0.0  # 스크롤 속도 (초당 아이템 수, 음수는 왼쪽)
+        self._last_scroll: Optional[float] = None  # 마지막 사용자 스크롤 시각
         self._current_height = self.DEFAULT_HEIGHT
 
         self._setup_ui()
@@ -218,97 +403,69 @@ class ThumbnailStrip(QWidget):
         self._resize_handle = ResizeHandle(self)
         layout.addWidget(self._resize_handle)
 
-        # 스크롤 영역
-        self._scroll_area = QScrollArea()
-        self._scroll_area.setWidgetResizable(True)
-        self._scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self._scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self._scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: #0a0a0a;
-                border: none;
-            }
-        """)
-
         # 최소/최대 높이 설정 (fixedHeight 대신)
         self.setMinimumHeight(self.MIN_HEIGHT)
         self.setMaximumHeight(self.MAX_HEIGHT)
         self.setFixedHeight(self.DEFAULT_HEIGHT)
 
-        # 컨테이너
-        self._container = QWidget()
-        self._container_layout = QHBoxLayout(self._container)
-        self._container_layout.setContentsMargins(8, 8, 8, 8)
-        self._container_layout.setSpacing(4)
-        self._container_layout.addStretch()
-
-        self._scroll_area.setWidget(self._container)
-        layout.addWidget(self._scroll_area)
-
-        # 가시성 체크 타이머 (가상 스크롤)
-        self._visibility_timer = QTimer()
-        self._visibility_timer.timeout.connect(self._load_visible_thumbnails)
-        self._visibility_timer.setInterval(100)
-
-        # 스크롤 이벤트 연결
-        self._scroll_area.horizontalScrollBar().valueChanged.connect(
-            self._on_scroll_changed
-        )
+        # 썸네일 디코딩 스케줄러 (화면 중심부터, 스크롤 시 우선순위 갱신, 디스크 캐시는 워커에서 처리)
+        self._scheduler = ThumbnailScheduler((ThumbnailView.THUMB_SIZE, ThumbnailView.THUMB_SIZE), self,
+                                             disk_cache=self._disk_cache)
+        self._scheduler.thumbnail_ready.connect(self._on_thumbnail_loaded)
+        self._scheduler.thumbnail_failed.connect(self._on_thumbnail_error)
+
+        # 스크롤이 멈추면 속도를 0으로 되돌리고 양쪽 버퍼를 다시 채움
+        self._scroll_idle_timer = QTimer(self)
+        self._scroll_idle_timer.setSingleShot(True)
+        self._scroll_idle_timer.setInterval(self.SCROLL_IDLE_MS)
+        self._scroll_idle_timer.timeout.connect(self._on_scroll_idle)
+
+        # 썸네일 뷰 (보이는 아이템만 그림)
+        self._view = ThumbnailView(self._cache)
+        self._view.item_clicked.connect(self._on_item_clicked)
+        self._view.user_scrolled.connect(self._update_velocity)
+        self._view.visible_range_changed.connect(self._on_visible_range_changed)
+        layout.addWidget(self._view)
 
     def set_files(self, files: List[str]):
         """파일 목록 설정"""
-        self._clear_items()
+        self._scheduler.clear()
+        self._failed.clear()
+        self._reset_velocity()
         self._files = files
         self._current_index = -1
+        self._view.set_files(files)
 
-        # 아이템 생성 (썸네일은 아직 로드하지 않음)
-        for i, file_path in enumerate(files):
-            item = ThumbnailItem(i, file_path)
-            item.clicked.connect(self._on_item_clicked)
-            self._items.append(item)
-            self._container_layout.insertWidget(i, item)
+    def insert_file(self, index: int, file_path: str):
+        """파일 하나 추가 (목록을 다시 설정하지 않아 스크롤 위치와 로딩 상태 유지)"""
+        self._files = self._files[:index] + [file_path] + self._files[index:]
+        if self._current_index >= index:
+            self._current_index += 1
+        self._view.insert_file(index, file_path)
 
-        # 가시 영역 썸네일 로드 시작
-        self._visibility_timer.start()
-
-    def _clear_items(self):
-        """모든 아이템 제거"""
-        self._visibility_timer.stop()
-
-        # 진행 중인 워커 취소
-        for worker in self._pending_workers.values():
-            worker.cancel()
-        self._pending_workers.clear()
+    def replace_files(self, files: List[str], current_index: int):
+        """파일 목록 교체 (스크롤 위치, 로딩 중인 썸네일, 스크롤 속도 유지 - 폴더 스캔 결과 병합용)"""
+        self._files = files
+        self._current_index = current_index
+        self._view.replace_files(files, current_index)
 
-        # 아이템 제거
-        for item in self._items:
-            self._container_layout.removeWidget(item)
-            item.deleteLater()
-        self._items.clear()
+    def invalidate_thumbnail(self, file_path: str):
+        """파일이 바뀐 경우 썸네일 다시 로드"""
+        self._cache.remove(file_path)
+        self._failed.discard(file_path)
+        self._load_visible_thumbnails()
+        self._view.refresh()
 
     def select_index(self, index: int):
         """인덱스 선택"""
-        if index < 0 or index >= len(self._items):
+        if index < 0 or index >= len(self._files):
             return
 
-        # 이전 선택 해제
-        if 0 <= self._current_index < len(self._items):
-            self._items[self._current_index].set_selected(False)
-
-        # 새 선택
         self._current_index = index
-        self._items[index].set_selected(True)
+        self._view.set_current_index(index)
 
         # 선택된 아이템으로 스크롤
-        self._scroll_to_item(index)
-
-    def _scroll_to_item(self, index: int):
-        """아이템이 보이도록 스크롤"""
-        if index < 0 or index >= len(self._items):
-            return
-
-        item = self._items[index]
-        self._scroll_area.ensureWidgetVisible(item, 50, 0)
+        self._view.ensure_visible(index)
 
     def _on_item_clicked(self, index: int):
         """아이템 클릭 처리"""
@@ -316,85 +473,145 @@ class ThumbnailStrip(QWidget):
             self.select_index(index)
             self.item_selected.emit(index, self._files[index])
 
-    def _on_scroll_changed(self):
-        """스크롤 변경 시 가시 영역 썸네일 로드"""
+    def _on_visible_range_changed(self, first: int, last: int):
+        """가시 범위 변경 시 보이는 썸네일 고정 후 로드"""
+        self._cache.pin(self._files[first:last + 1])
         self._load_visible_thumbnails()
 
+    def _update_velocity(self, delta: float):
+        """사용자 스크롤 이동량으로 속도 추정 (지수 이동 평균, 코드에서 옮긴 스크롤은 제외)"""
+        now = time.perf_counter()
+        if self._last_scroll is not None:
+            dt = now - self._last_scroll
+            if dt > 0:
+                sample = delta / dt
+                self._velocity += self.VELOCITY_SMOOTHING * (sample - self._velocity)
+        self._last_scroll = now
+        self._scroll_idle_timer.start()
+
+    def _reset_velocity(self):
+        self._velocity = 0.0
+        self._last_scroll = None
+        self._scroll_idle_timer.stop()
+
+    def _on_scroll_idle(self):
+        """스크롤 정지 - 대칭 버퍼로 대기열 재구성"""
+        self._reset_velocity()
+        self._load_visible_thumbnails()
+
+    def _scroll_direction(self) -> int:
+        """스크롤 진행 방향 (1: 오른쪽, -1: 왼쪽, 0: 정지)"""
+        if abs(self._velocity) < self.MIN_SCROLL_SPEED:
+            return 0
+        return 1 if self._velocity > 0 else -1
+
+    def _prefetch_depth(self, visible_count: int) -> Tuple[int, int]:
+        """진행 방향 앞/뒤 프리페치 개수
+
+        앞쪽 깊이는 (스크롤 속도 × 예측 시간)이다. 예측 시간은 한 화면을
+        디코딩하는 데 걸리는 시간이라, 디코딩이 느릴수록 더 멀리 앞서 나간다.
+        """
+        speed = abs(self._velocity)
+        if speed < self.MIN_SCROLL_SPEED:
+            return self.VISIBLE_BUFFER, self.VISIBLE_BUFFER
+
+        throughput = self._scheduler.throughput()
+        lead_time = visible_count / throughput if throughput > 0 else self.MAX_LEAD_TIME
+        lead_time = max(self.MIN_LEAD_TIME, min(self.MAX_LEAD_TIME, lead_time))
+        ahead = max(self.VISIBLE_BUFFER, min(self.MAX_AHEAD, math.ceil(speed * lead_time)))
+        behind = max(1, self.VISIBLE_BUFFER // 2)
+        return ahead, behind
+
     def _load_visible_thumbnails(self):
-        """화면에 보이는 썸네일만 로드 (가상 스크롤)"""
-        if not self._items:
-            return
+        """화면에 보이는 썸네일만 로드 (가상 스크롤)
 
-        viewport = self._scroll_area.viewport()
-        scroll_x = self._scroll_area.horizontalScrollBar().value()
-        visible_width = viewport.width()
-
-        # 가시 범위 계산
-        item_width = ThumbnailItem.THUMB_SIZE + 12
-        start_idx = max(0, scroll_x // item_width - self.VISIBLE_BUFFER)
-        end_idx = min(
-            len(self._items),
-            (scroll_x + visible_width) // item_width + self.VISIBLE_BUFFER + 1
-        )
-
-        # 가시 영역 아이템 로드
-        for i in range(start_idx, end_idx):
-            self._load_thumbnail(i)
-
-    def _load_thumbnail(self, index: int):
-        """개별 썸네일 로드"""
-        if index < 0 or index >= len(self._items):
+        보이는 아이템을 화면 중심에서 가까운 순서로 먼저, 이어서 스크롤
+        진행 방향 앞쪽, 마지막으로 뒤쪽 버퍼 순으로 디코딩 대기열을 다시 만든다.
+        """
+        if not self._files:
             return
 
-        item = self._items[index]
-        file_path = self._files[index]
+        first, last = self._view.visible_range()
+        ahead, behind = self._prefetch_depth(last - first + 1)
+        direction = self._scroll_direction()
+        if direction < 0:
+            right, left = behind, ahead
+        else:
+            right, left = ahead, behind
+        center = (first + last) / 2
+        count = len(self._files)
+
+        indices = sorted(range(first, last + 1), key=lambda i: abs(i - center))
+        right_side = list(range(last + 1, min(count, last + right + 1)))
+        left_side = list(range(first - 1, max(-1, first - left - 1), -1))
+        if direction > 0:
+            indices += right_side + left_side
+        elif direction < 0:
+            indices += left_side + right_side
+        else:
+            indices += sorted(right_side + left_side, key=lambda i: abs(i - center))
 
-        # 이미 로드됨
-        if item._pixmap is not None:
-            return
+        queue = []
+        for i in indices:
+            if self._needs_decode(i):
+                queue.append(self._files[i])
+        self._scheduler.schedule(queue)
 
-        # 캐시 확인
-        cached = self._cache.get(file_path)
-        if cached:
-            item.set_pixmap(cached)
-            return
+    def _needs_decode(self, index: int) -> bool:
+        """메모리 캐시에 없어 로딩이 필요한지 확인 (디스크 캐시는 워커가 확인)"""
+        file_path = self._files[index]
+
+        # 캐시 확인 (이미 로드됨) / 실패한 파일
+        if self._cache.contains(file_path) or file_path in self._failed:
+            return False
 
         # 이미 로딩 중
-        if file_path in self._pending_workers:
-            return
+        if self._scheduler.is_pending(file_path):
+            return True
 
         # 동영상은 기본 아이콘 (썸네일 추출 없음)
         if ImageLoader.is_supported_video(file_path):
             # TODO: 동영상 썸네일 추출 구현
-            item.set_loading()
-            return
+            self._view.set_loading(file_path, True)
+            return False
+
+        self._view.set_loading(file_path, True)
+        return True
 
-        # 비동기 로드 시작
-        item.set_loading()
-        worker = ThumbnailWorker(file_path, size=(ThumbnailItem.THUMB_SIZE, ThumbnailItem.THUMB_SIZE))
-        worker.signals.finished.connect(self._on_thumbnail_loaded)
-        worker.signals.error.connect(self._on_thumbnail_error)
-        self._pending_workers[file_path] = worker
-        self._thread_pool.start(worker)
-
-    def _on_thumbnail_loaded(self, file_path: str, pixmap: QPixmap):
-        """썸네일 로드 완료"""
-        # 캐시에 저장
+    def _on_thumbnail_loaded(self, file_path: str, image: QImage):
+        """썸네일 로드 완료 (QPixmap 변환은 GUI 스레드에서)"""
+        pixmap = QPixmap.fromImage(image)
+
+        # 메모리 캐시에 저장 (디스크 캐시는 워커가 저장)
         self._cache.put(file_path, pixmap)
 
         # 아이템 업데이트
-        if file_path in self._pending_workers:
-            del self._pending_workers[file_path]
-
-        for i, f in enumerate(self._files):
-            if f == file_path and i < len(self._items):
-                self._items[i].set_pixmap(pixmap)
-                break
+        self._view.set_loading(file_path, False)
+        self._view.refresh()
 
-    def _on_thumbnail_error(self, file_path: str, error: str):
+    def _on_thumbnail_error(self, file_path: str):
         """썸네일 로드 실패"""
-        if file_path in self._pending_workers:
-            del self._pending_workers[file_path]
+        self._failed.add(file_path)
+        self._view.set_loading(file_path, False)
+        self._view.refresh()
+
+    def get_cached_thumbnail(self, file_path: str) -> Optional[QPixmap]:
+        """메모리 캐시에 있는 썸네일 반환 (없으면 None)"""
+        return self._cache.get(file_path)
+
+    def set_cache_limits(self, max_items: Optional[int] = None, max_memory_mb: Optional[int] = None):
+        """썸네일 메모리 캐시 제한 변경"""
+        self._cache.set_limits(max_items, max_memory_mb)
+
+    def cache_stats(self) -> dict:
+        """썸네일 메모리 캐시 통계"""
+        return self._cache.stats()
+
+    def shutdown(self):
+        """썸네일 작업을 끝내고 디스크 캐시 연결 닫기 (종료 시)"""
+        self._scroll_idle_timer.stop()
+        self._scheduler.shutdown()
+        self._disk_cache.close()
 
     def get_current_index(self) -> int:
         return self._current_index